@@ -5,7 +5,6 @@
 """
 import sys
 from typing import Any
-from time import sleep
 
 # ENTITIES
 from entity.function import Function
@@ -13,6 +12,7 @@ from entity.testCase import TestCase
 
 # USER INTERFACE
 from ui.att_ui import Ui_MainWindow as ui_main_window
+from PyQt5.QtCore import QTimer as timer
 from PyQt5.QtWidgets import (
     QMainWindow as main_window,
     QApplication as application,
@@ -21,7 +21,8 @@ from PyQt5.QtWidgets import (
 )
 
 # BUSINESS
-from business.testManager import TestManager
+from business.parallelTestManager import ParallelTestManager
+from business.testWorkerManager import TestWorkerManager
 from business.functionManager import FunctionManager
 from business.exceptionManager import ExceptionManager
 from business.uiTimerManager import UiProgressBarValueManager
@@ -70,6 +71,7 @@ class AttApp(ui_main_window, main_window):
         self.init_managers()
 
         self._support_cases: list[Any] = []
+        self._test_worker: TestWorkerManager | None = None
 
     # ----->> INIT UI
     def init_ui(self) -> None:
@@ -141,7 +143,7 @@ class AttApp(ui_main_window, main_window):
         Initializes the managers for the class.
 
         This function initializes the following managers:
-        - TestManager
+        - ParallelTestManager
         - FunctionManager
         - ExceptionManager
         - UiProgressBarValueManager
@@ -153,7 +155,9 @@ class AttApp(ui_main_window, main_window):
         Returns:
             None
         """
-        self._test_manager = TestManager()
+        # One worker process per CPU, the pool is started by the first test that needs it.
+        self._test_manager = ParallelTestManager(
+            _message_handler=ShowMessageBox().show_message)
         self._function_manager = FunctionManager()
         self._exception_manager = ExceptionManager()
         self._progress_bar_value_manager = UiProgressBarValueManager(
@@ -268,8 +272,8 @@ class AttApp(ui_main_window, main_window):
         "run_test" method, and connects the "Support Case Done" button to the method 
         that changes the current index of the stacked widget to 0. Additionally, it 
         connects the "Support Case Clear Cases" button to the "clear_support_cases" 
-        method, and connects the "Support Case Add" button to the "add_support_cases" 
-        method.
+        method, connects the "Support Case Add" button to the "add_support_cases" 
+        method, and connects the "Test Cancel" button to the "cancel_test" method.
 
         Parameters:
             self (ClassName): The instance of the class.
@@ -288,6 +292,7 @@ class AttApp(ui_main_window, main_window):
             self.clear_support_cases)
 
         self.ui.btn_support_case_add.clicked.connect(self.add_support_cases)
+        self.ui.btn_test_cancel.clicked.connect(self.cancel_test)
 
     # ----->> CLEAR SUPPORT CASES
     def clear_support_cases(self) -> None:
@@ -315,13 +320,10 @@ class AttApp(ui_main_window, main_window):
             None
         """
         try:
-            value = self.ui.txt_support_case_support_case.text()
-            if not self.ui.checkbox_support_case_str.isChecked():
-                if value.startswith("."):
-                    value = "0" + value
-                elif value.endswith("."):
-                    value = value + "0"
-                value = float(value) if "." in value else int(value)
+            value = self._function_manager.str_to_support_case(
+                self.ui.txt_support_case_support_case.text(),
+                self.ui.checkbox_support_case_str.isChecked(),
+            )
 
             self._support_cases.append(value)
             self.ui.lw_support_case_values.clear()
@@ -338,28 +340,15 @@ class AttApp(ui_main_window, main_window):
             self.ui.txt_support_case_support_case.setFocus()
             self.ui.txt_support_case_support_case.selectAll()
 
-    # ----->> CHECK 'IS FUNCTION'
-    def _check_is_function_lines(self, _lines: str) -> bool:
-        """
-        Checks if the given lines of code contain any function definition.
-
-        Parameters:
-            _lines (str): The lines of code to check.
-
-        Returns:
-            bool: True if the lines contain a function definition, False otherwise.
-        """
-        return any(line.strip().startswith("def ") and line.strip().endswith(":") for line in _lines.split("\n"))
-
     # ----->> TEST CASES
     def generate_test_cases(self) -> None:
         """
         Generate test cases for the given function.
 
-        This function generates test cases based on the specified test pool count
-        and the current function. It updates the UI to display the progress of the
-        test generation. The test cases generated are added to the function's list
-        of test cases.
+        This function starts a test worker that generates test cases based on the
+        specified test pool count and the current function on a worker thread.
+        The UI is updated by the signals of the worker while the test cases are
+        generated, so the window stays responsive and the test can be cancelled.
 
         Parameters:
             None.
@@ -370,7 +359,6 @@ class AttApp(ui_main_window, main_window):
         # --->> Test Case Gererated
         test_pool_count: int = self.ui.sp_test_cases_pool_count.value()
 
-        current_count = 0
         self.ui.gbox_test_completed.setVisible(True)
         self.ui.gbox_test_completed.setFocus()
         self.ui.pb_test_rate.setFormat(
@@ -379,53 +367,164 @@ class AttApp(ui_main_window, main_window):
         self.ui.lbl_branched_count.setText("Branched Count:")
         self.ui.lbl_tested_line_count.setText("Tested Line Count:")
         self.change_object_enabled(False)
+        self.ui.btn_test_cancel.setEnabled(True)
 
         self.show_statusbar_message("Test Started")
 
-        application.processEvents()
-        try_count = 0
-        while current_count < test_pool_count:
-            test_cases_list: list[TestCase] = self._test_manager.generate_test_cases(
-                self._function
+        self._test_worker = TestWorkerManager(
+            self._test_manager, self._function, test_pool_count)
+        self._test_worker.progress_changed.connect(self.test_progress_changed)
+        self._test_worker.test_cases_generated.connect(
+            self.test_cases_generated)
+        self._test_worker.retry_limit_reached.connect(
+            self.test_retry_limit_reached)
+        self._test_worker.message_requested.connect(
+            ShowMessageBox().show_message)
+        self._test_worker.generation_failed.connect(self.test_failed)
+        self._test_worker.generation_finished.connect(self.test_finished)
+        self._test_worker.start()
+
+    def test_progress_changed(self, _tested_rate: float) -> None:
+        """
+        Updates the test rate progress bar with the completed percentage of the test case pools.
+
+        Parameters:
+            _tested_rate (float): The completed percentage of the test case pools.
+
+        Returns:
+            None
+        """
+        point: str = "." * (round(_tested_rate) % 4)
+        self.ui.pb_test_rate.setFormat(
+            f"{_tested_rate:>6}% of the test is complete, please wait {point}"
+        )
+        self.ui.pb_test_rate.setValue(round(_tested_rate))
+
+    def test_cases_generated(self, _test_cases: list[TestCase]) -> None:
+        """
+        Adds the test cases of a new pool to the test cases list and shows the statistics of its best test case.
+
+        Parameters:
+            _test_cases (list[TestCase]): The test cases of the new pool.
+
+        Returns:
+            None
+        """
+        # ----->> TEST CASES (LIST WIDGET)
+        tcases: list[str] = [
+            case.test_values.replace(",", " , ") for case in _test_cases
+        ]
+        self.ui.list_test_cases.addItems(
+            [" , ".join(tcases[case_index:])
+             for case_index in range(len(tcases))]
+        )
+
+        # ----->> STATISTICS (GROUP BOX)
+        if _test_cases:
+            # The values are set directly, the animated managers are left to the selected test case.
+            best_test_case: TestCase = _test_cases[0]
+            self.ui.progressBar_coverage_rate.setValue(
+                int(best_test_case.test_coverages_rate))
+            self.ui.lbl_branched_count.setText(
+                f"Branched Count: {best_test_case.tested_branches_count} / {self._function.branch_count}"
             )
-            try_count += 1
-            if self._function.branch_count == 0:
-                tested_rate = 100
-
-                self.ui.pb_test_rate.setFormat(
-                    f"{tested_rate:>6}% of the test is complete, please wait")
-                break
-
-            if len(test_cases_list) == self._function.branch_count:
-                self._function.add_test_case = [
-                    case_pool for case_pool in test_cases_list
-                ]
-                current_count += 1
-
-                step: float = 100 / test_pool_count
-                tested_rate: float = round(step * current_count, 2)
-                if round(step * current_count, 2) > 100:
-                    tested_rate = 100.00
-                point_count: int = current_count % 4
-                point = "." * point_count
-
-                self.ui.pb_test_rate.setFormat(
-                    f"{tested_rate:>6}% of the test is complete, please wait {point}"
-                )
-                self.ui.pb_test_rate.setValue(round(tested_rate))
-                application.processEvents()
-            if try_count == 10:
-                result = ShowMessageBox().show_question(
-                    "Warning",
-                    "A large number of attempts were made, but the result could not be reached. Would you like to continue?",
-                )
-                if result == 16_384:
-                    try_count = 0
-                else:
-                    break
-        sleep(1)
-        self.ui.gbox_test_completed.setVisible(False)
+            self.ui.lbl_tested_line_count.setText(
+                f"Tested Line Count: {best_test_case.tested_lines_count} / {self._function.code_lines_count}"
+            )
+            self.ui.gbox_statistics.setVisible(True)
+
+    def test_retry_limit_reached(self) -> None:
+        """
+        Asks whether the test should continue after a large number of attempts without a new test case pool.
+
+        Parameters:
+            None
+
+        Returns:
+            None
+        """
+        if self._test_worker is None:
+            return
+
+        result = ShowMessageBox().show_question(
+            "Warning",
+            "A large number of attempts were made, but the result could not be reached. Would you like to continue?",
+        )
+        self._test_worker.answer_retry(result == 16_384)
+
+    def cancel_test(self) -> None:
+        """
+        Cancels the running test, the worker stops within one batch of trials.
+
+        Parameters:
+            None
+
+        Returns:
+            None
+        """
+        if self._test_worker is not None:
+            self.ui.btn_test_cancel.setEnabled(False)
+            self.show_statusbar_message("Test Cancelling")
+            self._test_worker.cancel()
+
+    def test_failed(self, _exception: Exception) -> None:
+        """
+        Handles the exception that stopped the test worker.
+
+        Parameters:
+            _exception (Exception): The exception that stopped the test worker.
+
+        Returns:
+            None
+        """
+        self._test_worker = None
+        self._handle_test_exeption(_exception)
+
+    def test_finished(self, _cancelled: bool) -> None:
+        """
+        Completes the test after the test worker generated the test case pools.
+
+        This function adds the test case name to the combo box widget, shows a message
+        in the status bar, enables the widgets again and hides the test rate progress bar
+        after a second.
+
+        Parameters:
+            _cancelled (bool): True if the test was cancelled.
+
+        Returns:
+            None
+        """
+        self._test_worker = None
+        # ----->> TEST CASE NAME (COMBO BOX WIDGET)
+        self.combo_box_add_test_case_name()
+        # ----->> STATUS BAR (STATUS BAR WIDGET)
+        self.show_statusbar_message(
+            "Test Cancelled" if _cancelled else "Test Completed")
+
+        self.change_object_enabled(True)
+        self.ui.cbx_test_case_name.setFocus()
+
         self.ui.gbox_statistics.setVisible(True)
+        timer.singleShot(
+            1000, lambda: self.ui.gbox_test_completed.setVisible(
+                self._test_worker is not None)
+        )
+
+    def closeEvent(self, _event: Any) -> None:
+        """
+        Cancels the running test, waits for the test worker and stops the worker processes before the window is closed.
+
+        Parameters:
+            _event (Any): The close event of the window.
+
+        Returns:
+            None
+        """
+        if self._test_worker is not None:
+            self._test_worker.cancel()
+            self._test_worker.wait()
+        self._test_manager.shutdown()
+        super().closeEvent(_event)
 
     def create_function(self, _source_code: str) -> None:
         """
@@ -437,16 +536,9 @@ class AttApp(ui_main_window, main_window):
         Returns:
             None
         """
-        self._function: Function = Function()
-        if self._check_is_function_lines(_source_code):
-            self._function = self._function_manager.str_to_function(
-                _source_code
-            )
-        else:
-            func_lines: list[str] = ["def This_Is_The_Way():"] + [" " * 4 +
-                                                                  line for line in _source_code.splitlines()]
-            self._function = self._function_manager.str_to_function(
-                "\n".join(func_lines))
+        self._function: Function = self._function_manager.source_to_function(
+            _source_code
+        )
 
         self._function.support_cases = self._support_cases
 
@@ -517,9 +609,8 @@ class AttApp(ui_main_window, main_window):
 
         1. Create a function using the provided source code.
         2. Display the fixed source code in a list widget.
-        3. Generate test cases for the function.
-        4. Add the test case name to the combo box widget.
-        5. Show a message in the status bar indicating that the test is completed.
+        3. Start the generation of the test cases for the function, the test is
+        completed by "test_finished" when the test worker is done.
 
         Parameters:
         - _source_code (str): The source code to create the function from.
@@ -534,13 +625,6 @@ class AttApp(ui_main_window, main_window):
         self.fixed_source_code()
         # --->> Test Case Gererated
         self.generate_test_cases()
-        # ----->> TEST CASE NAME (COMBO BOX WIDGET)
-        self.combo_box_add_test_case_name()
-        # ----->> STATUS BAR (STATUS BAR WIDGET)
-        self.show_statusbar_message("Test Completed")
-
-        self.change_object_enabled(True)
-        self.ui.cbx_test_case_name.setFocus()
 
     def _handle_test_exeption(self, _exception: Exception) -> None:
         """
@@ -644,9 +728,8 @@ class AttApp(ui_main_window, main_window):
                     ]
                     test_cases.append(tcases)
 
-                test_pools_count: int = self.ui.sp_test_cases_pool_count.value()
-                for pool_index in range(test_pools_count):
-                    test_cases_count: int = self._function.branch_count
+                for pool_index in range(len(test_cases)):
+                    test_cases_count: int = len(test_cases[pool_index])
                     for case_index in range(test_cases_count):
                         test_cases[pool_index][case_index] = test_cases[pool_index][
                             case_index:
@@ -696,10 +779,9 @@ class AttApp(ui_main_window, main_window):
             list_current_row: int = self.ui.list_test_cases.currentRow()
             current_case_name: str = self.ui.cbx_test_case_name.currentText()
             if current_case_name and list_current_row >= 0:
-                function_branch_count: int = self._function.branch_count
-                current_test_case: TestCase = self._function.test_cases[
-                    list_current_row // function_branch_count
-                ][list_current_row % function_branch_count]
+                current_test_case: TestCase = [
+                    case for pool in self._function.test_cases for case in pool
+                ][list_current_row]
 
                 # ----->> PROGRESS BAR
                 self._progress_bar_value_manager.update_value(
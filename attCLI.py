@@ -0,0 +1,493 @@
+""" The headless command line runner of the tool, it does not import PyQt5, so it runs without a display.
+
+    python attCLI.py run file.py --pools 5 --jobs 8 --format json
+    python attCLI.py module module.py --jobs 8 --format json
+    python attCLI.py batch src --jobs 8 --format json --output report.jsonl
+"""
+import argparse
+import json
+import os
+import sys
+from typing import Any
+
+# ENTITIES
+from entity.function import Function
+from entity.testCase import TestCase
+
+# BUSINESS
+from business.testManager import TestManager
+from business.parallelTestManager import ParallelTestManager
+from business.functionManager import FunctionManager
+from business.moduleAnalyzer import ModuleAnalyzer
+from business.testCacheManager import TestCacheManager
+
+# DATA ACCESS
+from dataAccess.corpusDal import CorpusDal
+
+
+# APPLICATION
+class AttCli:
+    """
+    This class is the headless command line runner of the tool.
+    Here's what each class method does:
+
+    - __init__: Initializes the argument parser of the commands.
+    - create_parser: Creates the argument parser of the commands.
+    - create_test_manager: Creates the test manager for the given worker count, coverage backend and trial budget.
+    - create_test_cache: Creates the test case cache of the given directory and size cap.
+    - function_to_report: Converts a tested function into a report dictionary.
+    - module_to_report: Converts the tested functions of a module into a report dictionary.
+    - report_to_text: Converts a report dictionary into readable text.
+    - write_report: Writes a report in the requested format to the requested output.
+    - discard_stdout: Points stdout at the null device after the reader of a pipe went away.
+    - run: Tests the function in a source file and writes the report.
+    - run_module: Tests every function of a source file and writes the report.
+    - find_source_files: Returns the Python source files under a directory.
+    - run_batch: Tests every function of every source file under a directory and streams the reports to one output.
+    - main: Parses the command line arguments and runs the command.
+
+    Only the business and entity classes are used, no module of the user interface is imported.
+
+    @category: Application
+    @import: TestManager, ParallelTestManager, FunctionManager, ModuleAnalyzer, TestCacheManager, CorpusDal, Function, TestCase
+    @see: TestManager, ParallelTestManager, FunctionManager, ModuleAnalyzer, TestCacheManager, CorpusDal, Function, TestCase
+    """
+
+    def __init__(self) -> None:
+        """
+        Initializes the argument parser of the commands.
+
+        Parameters:
+            None
+
+        Returns:
+            None
+        """
+        self._function_manager = FunctionManager()
+        self._corpus_dal = CorpusDal()
+        self._parser: argparse.ArgumentParser = self.create_parser()
+
+    def create_parser(self) -> argparse.ArgumentParser:
+        """
+        Creates the argument parser of the commands.
+
+        Parameters:
+            None
+
+        Returns:
+            argparse.ArgumentParser: The argument parser.
+        """
+        parser = argparse.ArgumentParser(
+            description="Generates test cases that reach every branch of a Python function."
+        )
+        commands = parser.add_subparsers(dest="command", required=True)
+
+        # The options of the test case generation, shared by the commands.
+        generation = argparse.ArgumentParser(add_help=False)
+        generation.add_argument("--pools", type=int, default=1,
+                                help="The number of test case pools. Defaults to 1.")
+        generation.add_argument("--jobs", type=int, default=os.cpu_count() or 1,
+                                help="The number of worker processes, 1 runs in this process. Defaults to the CPU count.")
+        generation.add_argument("--format", choices=["json", "text"], default="text",
+                                help="The format of the report. Defaults to text.")
+        generation.add_argument("--output", default="-",
+                                help="The report file, '-' writes stdout. Defaults to stdout.")
+        generation.add_argument("--backend", choices=["probe", "auto", "monitoring", "settrace"], default="probe",
+                                help="The coverage backend of the execution engine. Defaults to probe.")
+        generation.add_argument("--retry-limit", type=int, default=10,
+                                help="The number of attempts without a new pool before the test stops. Defaults to 10.")
+        generation.add_argument("--timeout", type=float, default=1.0,
+                                help="The wall clock timeout of a trial in seconds, 0 turns it off. Defaults to 1.")
+        generation.add_argument("--max-steps", type=int, default=1_000_000,
+                                help="The step limit of a trial, loop iterations and calls, 0 turns it off. Defaults to 1000000.")
+        generation.add_argument("--cache", default="",
+                                help="The directory of the test case cache, the unchanged functions get their test cases from it.")
+        generation.add_argument("--cache-size", type=int, default=256,
+                                help="The size cap of the test case cache in MiB. Defaults to 256.")
+
+        run_parser = commands.add_parser(
+            "run", parents=[generation], help="Generate the test cases of the function in a source file.")
+        run_parser.add_argument(
+            "file", help="The source file of the function, '-' reads stdin.")
+        run_parser.add_argument("--support-case", action="append", default=[],
+                                help="A number support case, can be given more than once.")
+        run_parser.add_argument("--support-string", action="append", default=[],
+                                help="A string support case, can be given more than once.")
+        run_parser.add_argument("--corpus", default="",
+                                help="A JSON file the fuzzing corpus is loaded from before and saved to after the run.")
+
+        module_parser = commands.add_parser(
+            "module", parents=[generation], help="Generate the test cases of every function in a source file.")
+        module_parser.add_argument(
+            "file", help="The source file of the module, '-' reads stdin.")
+
+        batch_parser = commands.add_parser(
+            "batch", parents=[generation],
+            help="Generate the test cases of every function in the source files under a directory, "
+                 "the json format writes a JSON object per line.")
+        batch_parser.add_argument(
+            "directory", help="The directory the .py files are searched under.")
+        return parser
+
+    def create_test_manager(
+        self, _jobs: int, _coverage_backend: str, _trial_timeout: float = 1.0, _trial_steps: int = 1_000_000
+    ) -> TestManager:
+        """
+        Creates the test manager for the given worker count, coverage backend and trial budget.
+
+        Parameters:
+            _jobs (int): The number of worker processes, one job runs in the calling process.
+            _coverage_backend (str): The name of the coverage backend of the execution engine.
+            _trial_timeout (float): The wall clock timeout of a trial in seconds. Defaults to 1.
+            _trial_steps (int): The step limit of a trial. Defaults to 1_000_000.
+
+        Returns:
+            TestManager: The test manager.
+        """
+        if _jobs > 1:
+            return ParallelTestManager(_jobs, _coverage_backend=_coverage_backend,
+                                       _trial_timeout=_trial_timeout, _trial_steps=_trial_steps)
+        return TestManager(_coverage_backend, _trial_timeout=_trial_timeout, _trial_steps=_trial_steps)
+
+    def create_test_cache(self, _directory: str, _size: int) -> TestCacheManager | None:
+        """
+        Creates the test case cache of the given directory and size cap.
+
+        Parameters:
+            _directory (str): The directory of the cache, empty turns the cache off.
+            _size (int): The size cap of the cache in MiB.
+
+        Returns:
+            TestCacheManager | None: The test case cache, None if it is off.
+        """
+        if not _directory:
+            return None
+        return TestCacheManager(_directory, _size * 1024 * 1024)
+
+    def function_to_report(self, _function: Function) -> dict[str, Any]:
+        """
+        Converts a tested function into a report dictionary.
+
+        Parameters:
+            _function (Function): The tested function.
+
+        Returns:
+            dict[str, Any]: The signature, the counts and the test case pools of the function.
+        """
+        return {
+            "function": _function.name,
+            "signature": _function.signature,
+            "branch_count": _function.branch_count,
+            "code_lines_count": _function.code_lines_count,
+            "pools": [
+                [
+                    {
+                        "test_values": case.test_values,
+                        "coverage_rate": case.test_coverages_rate,
+                        "tested_lines_count": case.tested_lines_count,
+                        "tested_branches_count": case.tested_branches_count,
+                        "covered_edges": [list(edge) for edge in sorted(case.covered_edges)],
+                        "outcome": case.outcome,
+                    }
+                    for case in pool
+                ]
+                for pool in _function.test_cases
+            ],
+        }
+
+    def module_to_report(self, _file: str, _results: dict[str, Function | Exception]) -> dict[str, Any]:
+        """
+        Converts the tested functions of a module into a report dictionary.
+
+        Parameters:
+            _file (str): The source file of the module.
+            _results (dict[str, Function | Exception]): The tested functions keyed by their qualified names, see ModuleAnalyzer.
+
+        Returns:
+            dict[str, Any]: The file and the report of every function, an error report for a function that could not be tested.
+        """
+        return {
+            "file": _file,
+            "functions": {
+                name: self.function_to_report(result) if isinstance(result, Function) else {
+                    "function": name, "error": {"type": type(result).__name__, "message": str(result)}}
+                for name, result in _results.items()
+            },
+        }
+
+    def report_to_text(self, _report: dict[str, Any]) -> str:
+        """
+        Converts a report dictionary into readable text.
+
+        Parameters:
+            _report (dict[str, Any]): The report dictionary, see function_to_report and module_to_report.
+
+        Returns:
+            str: The report as text.
+        """
+        if "functions" in _report:
+            # The qualified name tells the nested helpers and the functions of the same name apart, like file::name of batch.
+            return "\n".join(
+                f"{name}\n{self.report_to_text(report)}" for name, report in _report["functions"].items())
+        if "error" in _report:
+            return f"{_report.get('function', _report.get('file'))}: {_report['error']['type']}: {_report['error']['message']}"
+
+        lines: list[str] = [
+            f"{_report['signature']}  branches: {_report['branch_count']}  lines: {_report['code_lines_count']}"
+        ]
+        for pool_index, pool in enumerate(_report["pools"], start=1):
+            lines.append(f"  pool {pool_index}:")
+            lines.extend(
+                f"    {case['test_values'] or '()':<40} {case['coverage_rate']:>6}%"
+                + ("  timeout" if case.get("outcome") == "timeout" else "") for case in pool)
+        return "\n".join(lines)
+
+    def write_report(self, _report: dict[str, Any], _format: str, _output: str) -> None:
+        """
+        Writes a report in the requested format to the requested output.
+
+        Parameters:
+            _report (dict[str, Any]): The report dictionary.
+            _format (str): The format of the report, "json" or "text".
+            _output (str): The report file, "-" writes stdout.
+
+        Returns:
+            None
+        """
+        text: str = json.dumps(
+            _report, indent=2) if _format == "json" else self.report_to_text(_report)
+        if _output == "-":
+            try:
+                print(text, flush=True)
+            except BrokenPipeError:
+                self.discard_stdout()
+        else:
+            with open(_output, "w", encoding="utf-8") as file:
+                file.write(text + "\n")
+
+    def discard_stdout(self) -> None:
+        """
+        Points stdout at the null device after the reader of a pipe went away, for example `attCLI.py batch src | head`,
+        so the remaining writes and the flush at exit do not raise BrokenPipeError again.
+
+        Parameters:
+            None
+
+        Returns:
+            None
+        """
+        null_device: int = os.open(os.devnull, os.O_WRONLY)
+        os.dup2(null_device, sys.stdout.fileno())
+        os.close(null_device)
+
+    def run(self, _args: argparse.Namespace) -> int:
+        """
+        Tests the function in a source file and writes the report.
+
+        Parameters:
+            _args (argparse.Namespace): The arguments of the run command.
+
+        Returns:
+            int: The exit status, 0 if every pool was generated, 1 otherwise.
+        """
+        if _args.file == "-":
+            source_code: str = sys.stdin.read()
+        else:
+            with open(_args.file, encoding="utf-8") as file:
+                source_code = file.read()
+
+        test_manager: TestManager = self.create_test_manager(
+            _args.jobs, _args.backend, _args.timeout, _args.max_steps)
+        report: dict[str, Any] = {}
+        status: int = 1
+        try:
+            function: Function = self._function_manager.source_to_function(
+                source_code)
+            function.support_cases = [
+                self._function_manager.str_to_support_case(value, False) for value in _args.support_case
+            ] + [
+                self._function_manager.str_to_support_case(value, True) for value in _args.support_string
+            ]
+            function.corpus = self._corpus_dal.load_corpus(_args.corpus)
+
+            test_cache: TestCacheManager | None = self.create_test_cache(_args.cache, _args.cache_size)
+            settings: dict[str, Any] = {
+                "pool_count": _args.pools, "retry_limit": _args.retry_limit, **test_manager.settings}
+            if test_cache is not None and test_cache.load_test_cases(function, settings):
+                pool_count: int = len(function.test_cases)
+            else:
+                pool_count = test_manager.generate_test_pools(
+                    function, _args.pools, _args.retry_limit)
+                if test_cache is not None:
+                    test_cache.save_test_cases(function, settings)
+            report = self.function_to_report(function)
+            self._corpus_dal.save_corpus(_args.corpus, function.corpus)
+            if pool_count == _args.pools or function.branch_count == 0:
+                status = 0
+
+        except Exception as e:
+            # The tested function may raise anything, see TestManager.admit_results, it is reported instead of a traceback.
+            report = {"file": _args.file, "error": {
+                "type": type(e).__name__, "message": str(e)}}
+
+        finally:
+            if isinstance(test_manager, ParallelTestManager):
+                test_manager.shutdown()
+
+        self.write_report(report, _args.format, _args.output)
+        return status
+
+    def run_module(self, _args: argparse.Namespace) -> int:
+        """
+        Tests every function of a source file and writes the report.
+
+        Parameters:
+            _args (argparse.Namespace): The arguments of the module command.
+
+        Returns:
+            int: The exit status, 0 if every function got every pool, 1 otherwise.
+        """
+        if _args.file == "-":
+            source_code: str = sys.stdin.read()
+        else:
+            with open(_args.file, encoding="utf-8") as file:
+                source_code = file.read()
+
+        test_manager: TestManager = self.create_test_manager(
+            _args.jobs, _args.backend, _args.timeout, _args.max_steps)
+        report: dict[str, Any] = {}
+        status: int = 1
+        try:
+            results: dict[str, Function | Exception] = ModuleAnalyzer(
+                test_manager, _args.pools, _args.retry_limit,
+                self.create_test_cache(_args.cache, _args.cache_size)).analyze(source_code)
+            report = self.module_to_report(_args.file, results)
+            if all(
+                isinstance(result, Function) and (len(result.test_cases) == _args.pools or result.branch_count == 0)
+                for result in results.values()
+            ):
+                status = 0
+
+        except SyntaxError as e:
+            report = {"file": _args.file, "error": {
+                "type": type(e).__name__, "message": str(e)}}
+
+        finally:
+            if isinstance(test_manager, ParallelTestManager):
+                test_manager.shutdown()
+
+        self.write_report(report, _args.format, _args.output)
+        return status
+
+    def find_source_files(self, _directory: str) -> list[str]:
+        """
+        Returns the Python source files under a directory, the hidden directories and __pycache__ are skipped.
+
+        Parameters:
+            _directory (str): The directory to search.
+
+        Returns:
+            list[str]: The paths of the .py files, in sorted order.
+        """
+        paths: list[str] = []
+        for root, directories, files in os.walk(_directory):
+            directories[:] = sorted(
+                directory for directory in directories if not directory.startswith(".") and directory != "__pycache__")
+            paths += [os.path.join(root, file) for file in sorted(files) if file.endswith(".py")]
+        return paths
+
+    def run_batch(self, _args: argparse.Namespace) -> int:
+        """
+        Tests every function of every source file under a directory and streams the reports to one output.
+        The functions of all the files are queued together by their estimated cost, see ModuleAnalyzer.run,
+        and the report of a function is written and flushed as soon as it finishes, so a long run can be followed and
+        a stopped run keeps the reports it wrote.
+
+        Parameters:
+            _args (argparse.Namespace): The arguments of the batch command.
+
+        Returns:
+            int: The exit status, 0 if every function of every file got every pool, 1 otherwise.
+        """
+        test_manager: TestManager = self.create_test_manager(
+            _args.jobs, _args.backend, _args.timeout, _args.max_steps)
+        analyzer: ModuleAnalyzer = ModuleAnalyzer(
+            test_manager, _args.pools, _args.retry_limit, self.create_test_cache(_args.cache, _args.cache_size))
+        output: Any = sys.stdout if _args.output == "-" else open(_args.output, "w", encoding="utf-8")
+        # The unique name of a function is its file and its qualified name.
+        names: dict[str, tuple[str, str]] = {}
+        failures: list[str] = []
+
+        def write_result(_name: str, _result: Function | Exception) -> None:
+            file, function_name = names[_name]
+            report: dict[str, Any]
+            if isinstance(_result, Function):
+                report = {"file": file, "qualified_name": function_name, **self.function_to_report(_result)}
+                if len(_result.test_cases) != _args.pools and _result.branch_count != 0:
+                    failures.append(_name)
+            else:
+                report = {"file": file, "error": {"type": type(_result).__name__, "message": str(_result)}}
+                if function_name:
+                    report["function"] = function_name
+                failures.append(_name)
+
+            try:
+                if _args.format == "json":
+                    output.write(json.dumps(report) + "\n")
+                else:
+                    heading: str = f"{file}::{function_name}" if function_name else file
+                    output.write(heading + "\n" + self.report_to_text(report) + "\n")
+                output.flush()
+            except BrokenPipeError:
+                # Nobody reads the reports anymore, the functions that are left are not tested.
+                self.discard_stdout()
+                test_manager.cancelled = True
+
+        try:
+            functions: dict[str, Function | Exception] = {}
+            for path in self.find_source_files(_args.directory):
+                file: str = os.path.relpath(path, _args.directory)
+                try:
+                    with open(path, encoding="utf-8") as source_file:
+                        module_functions: dict[str, Function | Exception] = analyzer.discover(source_file.read())
+                except (SyntaxError, ValueError, OSError) as e:
+                    names[file] = (file, "")
+                    functions[file] = e
+                    continue
+                for function_name, result in module_functions.items():
+                    names[f"{file}::{function_name}"] = (file, function_name)
+                    functions[f"{file}::{function_name}"] = result
+
+            analyzer.run(functions, write_result)
+
+        finally:
+            if isinstance(test_manager, ParallelTestManager):
+                test_manager.shutdown()
+            if output is not sys.stdout:
+                output.close()
+
+        return 1 if failures or test_manager.cancelled else 0
+
+    def main(self, _argv: list[str] | None = None) -> int:
+        """
+        Parses the command line arguments and runs the command.
+
+        Parameters:
+            _argv (list[str] | None): The command line arguments. Defaults to sys.argv.
+
+        Returns:
+            int: The exit status of the command.
+        """
+        args: argparse.Namespace = self._parser.parse_args(_argv)
+        if args.command == "run":
+            return self.run(args)
+        if args.command == "module":
+            return self.run_module(args)
+        if args.command == "batch":
+            return self.run_batch(args)
+        return 2
+
+
+# RUN CLI
+if __name__ == "__main__":
+    sys.exit(AttCli().main())
@@ -0,0 +1,221 @@
+"""
+This class records the branch distances and the operands of the instrumented comparisons of a function and scores inputs by them.
+"""
+import math
+from typing import Any
+from entity.instrumentedCode import Predicate
+from business.symbolicValue import SymbolicValue
+
+
+class BranchDistance:
+    """
+    This class records the branch distances and the operands of the instrumented comparisons of a function and scores inputs by them.
+    Here's what each class method does:
+
+    - __init__: Initializes the recorder with no distances and operands.
+    - distances: Gets the distances recorded since the last clear, keyed by compare id.
+    - operands: Gets the number and string operands compared since the last clear.
+    - path: Gets the comparisons of symbolic values evaluated since the last clear, in the order of the run.
+    - clear: Starts the recording of a new trial.
+    - compare: Evaluates an instrumented comparison, records its operands and how far it was from being true and from being false.
+    - __distance: Returns the distances of a comparison to true and to false.
+    - fitness: Returns how far a trial was from taking a branch, 0 when it took it.
+
+    The instrumented code calls compare in place of every leaf of an `if` or `while` condition, see CodeInstrumenter.
+    The distance of `a == b` to true is |a - b|, the distance of `x > k` to true is k - x + 1, so a search gets a gradient
+    towards a branch instead of the hit or miss of a random trial. A comparison of strings for equality counts the
+    character code differences, other operands only tell whether the comparison was true.
+    A comparison evaluated more than once in a trial, in a loop, keeps its smallest distances.
+    The operands are the values the function computed at run time, `len(s)`, `x % 7` or a local, which the constant miner
+    can not see in the code, so they are fed back to the input generator like the mined literals.
+    A comparison with a symbolic operand of a concolic run is also appended to the path with its outcome, see ConcolicExecutor.
+
+    @category: Business Classes, Analyzer
+    @import: Predicate
+    @see: Predicate, CodeInstrumenter, SymbolicValue, ConcolicExecutor
+    """
+
+    def __init__(self) -> None:
+        """
+        Initializes the recorder with no distances and operands.
+
+        Parameters:
+            None
+
+        Returns:
+            None
+
+        @category: Business Classes, Analyzer
+        """
+        self.__distances: dict[int, tuple[float, float]] = {}
+        self.__operands: set[Any] = set()
+        self.__operand_length: int = 64
+        self.__operand_count: int = 256
+        self.__path: list[tuple[int, str, Any, Any, bool]] = []
+        self.__path_length: int = 64
+
+    @property
+    def distances(self) -> dict[int, tuple[float, float]]:
+        """
+        Returns the distances recorded since the last clear.
+
+        Returns:
+            dict[int, tuple[float, float]]: The distances to true and to false of every evaluated comparison, keyed by compare id.
+        """
+        return self.__distances
+
+    @property
+    def operands(self) -> set[Any]:
+        """
+        Returns the number and string operands compared since the last clear.
+
+        Returns:
+            set[Any]: The compared numbers and the compared strings of at most 64 characters, the first 256 of a trial.
+        """
+        return self.__operands
+
+    @property
+    def path(self) -> list[tuple[int, str, Any, Any, bool]]:
+        """
+        Returns the comparisons of symbolic values evaluated since the last clear.
+
+        Returns:
+            list[tuple[int, str, Any, Any, bool]]: The compare id, the operator, the operands and the outcome of every comparison
+            with a symbolic operand, the first 64 of a trial.
+        """
+        return self.__path
+
+    def clear(self) -> None:
+        """
+        Starts the recording of a new trial, the distances and operands of the last trial are kept by their owner.
+
+        Parameters:
+            None
+
+        Returns:
+            None
+        """
+        self.__distances = {}
+        self.__operands = set()
+        self.__path = []
+
+    def compare(self, _compare_id: int, _operator: str, _left: Any, _right: Any = None) -> Any:
+        """
+        Evaluates an instrumented comparison, records its operands and how far it was from being true and from being false.
+
+        Parameters:
+            _compare_id (int): The id of the comparison in the condition map of the instrumented code.
+            _operator (str): The name of the ast operator, "Eq", "NotEq", "Lt", "LtE", "Gt" or "GtE",
+            or "Truth" for a leaf that is not a comparison.
+            _left (Any): The left operand, or the value of the leaf.
+            _right (Any): The right operand. Defaults to None.
+
+        Returns:
+            Any: The value of the comparison, the value of the leaf for "Truth".
+        """
+        if _operator == "Truth":
+            result: Any = _left
+        elif _operator == "Eq":
+            result = _left == _right
+        elif _operator == "NotEq":
+            result = _left != _right
+        elif _operator == "Lt":
+            result = _left < _right
+        elif _operator == "LtE":
+            result = _left <= _right
+        elif _operator == "Gt":
+            result = _left > _right
+        else:
+            result = _left >= _right
+
+        if _operator != "Truth" and len(self.__operands) < self.__operand_count:
+            for operand in (_left, _right):
+                if type(operand) in (int, float) or (type(operand) is str and len(operand) <= self.__operand_length):
+                    self.__operands.add(operand)
+
+        if (isinstance(_left, SymbolicValue) or isinstance(_right, SymbolicValue)) and len(self.__path) < self.__path_length:
+            self.__path.append((_compare_id, _operator, _left, _right, bool(result)))
+
+        true_distance, false_distance = self.__distance(
+            _operator, _left, _right, bool(result))
+        recorded: tuple[float, float] | None = self.__distances.get(
+            _compare_id)
+        if recorded is not None:
+            true_distance = min(true_distance, recorded[0])
+            false_distance = min(false_distance, recorded[1])
+        self.__distances[_compare_id] = (true_distance, false_distance)
+        return result
+
+    def __distance(self, _operator: str, _left: Any, _right: Any, _result: bool) -> tuple[float, float]:
+        """
+        Returns the distances of a comparison to true and to false.
+
+        Parameters:
+            _operator (str): The name of the ast operator.
+            _left (Any): The left operand.
+            _right (Any): The right operand.
+            _result (bool): The value of the comparison.
+
+        Returns:
+            tuple[float, float]: The distance to true and the distance to false, 0 for the side the comparison took.
+            A numerical comparison without a float difference, an overflow or a nan, gets the distances 0 and 1.
+        """
+        numbers: tuple[type, ...] = (int, float, bool)
+        difference: float = math.nan
+        if type(_left) in numbers and type(_right) in numbers:
+            try:
+                difference = float(_left - _right)
+            except OverflowError:
+                # An int beyond the float range, as in 10 ** 400 > 1.5, has no float difference.
+                pass
+        if not math.isnan(difference):
+            if _operator == "Eq":
+                return abs(difference), float(_result)
+            if _operator == "NotEq":
+                return float(not _result), abs(difference)
+            if _operator in ("Lt", "Gt"):
+                difference = difference if _operator == "Lt" else -difference
+                return (0.0, -difference) if _result else (difference + 1, 0.0)
+            if _operator in ("LtE", "GtE"):
+                difference = difference if _operator == "LtE" else -difference
+                return (0.0, 1 - difference) if _result else (difference, 0.0)
+
+        if type(_left) is str and type(_right) is str and _operator in ("Eq", "NotEq"):
+            difference = sum(abs(ord(left) - ord(right)) for left, right in zip(_left, _right)) + \
+                128 * abs(len(_left) - len(_right))
+            if _operator == "Eq":
+                return float(difference), float(_result)
+            return float(not _result), float(difference)
+
+        return (0.0, 1.0) if _result else (1.0, 0.0)
+
+    def fitness(self, _predicate: Predicate, _outcome: bool, _distances: dict[int, tuple[float, float]]) -> float:
+        """
+        Returns how far a trial was from giving a condition the wanted outcome, 0 when it gave it.
+        Every distance is normalized to d / (d + 1), a comparison the trial did not evaluate counts as 1.
+        A conjunction that must hold sums the distances of its parts, a disjunction takes the smallest one.
+
+        Parameters:
+            _predicate (Predicate): The predicate tree of the condition.
+            _outcome (bool): The wanted outcome of the condition.
+            _distances (dict[int, tuple[float, float]]): The distances the trial recorded.
+
+        Returns:
+            float: The fitness of the trial, smaller is closer.
+        """
+        kind, value = _predicate
+        if kind == "compare":
+            distances: tuple[float, float] | None = _distances.get(value)
+            if distances is None:
+                return 1.0
+            distance: float = distances[0] if _outcome else distances[1]
+            return distance / (distance + 1)
+
+        if kind == "not":
+            return self.fitness(value, not _outcome, _distances)
+
+        fitnesses: list[float] = [self.fitness(
+            predicate, _outcome, _distances) for predicate in value]
+        if (kind == "and") == _outcome:
+            return sum(fitnesses)
+        return min(fitnesses)
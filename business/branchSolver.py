@@ -0,0 +1,477 @@
+"""
+This class solves the numeric branch conditions of a function with interval analysis to compute an input for every branch.
+"""
+import ast
+import math
+import random
+from typing import Any
+
+# A constraint is the linear comparison sum(coefficient * argument) + constant <op> 0.
+Constraint = tuple[str, dict[str, float], float]
+
+
+class BranchSolver:
+    """
+    This class solves the numeric branch conditions of a function with interval analysis to compute an input for every branch.
+    Here's what each class method does:
+
+    - parse: Parses the path condition of every branch target of a function into conjunctions of linear constraints.
+    - solve: Computes the argument values that satisfy each conjunction, with a random point of the feasible interval.
+    - solve_path: Computes the argument values that satisfy the path of a concolic run with its last constraint negated.
+    - negate: Returns the negation of a constraint.
+    - walk_paths: Walks the statements of a body and collects the path conditions of the branches.
+    - __to_dnf: Converts a condition into a disjunction of conjunctions of linear constraints.
+    - __linear: Converts an expression into a linear form over the arguments.
+    - __solve_conjunction: Computes the argument values that satisfy a conjunction.
+    - __substitute: Replaces the eliminated arguments of a linear form with their expressions.
+    - __pick: Picks a value from an interval.
+    - __holds: Checks a constraint with the given argument values.
+
+    The path condition of a branch is its own condition and the conditions of the enclosing branches,
+    negated for the else branches, so the condition of an elif includes the negation of the conditions before it.
+    A constraint may hold one argument, which gives an interval, or the difference of two arguments,
+    which is solved by assigning the arguments one by one. A path with a condition that can not be modelled,
+    for example a call or an argument that is assigned in the function, is skipped and left to the random search.
+    The path of a concolic run holds any linear constraint, it is solved next to the input that ran it:
+    its equalities are eliminated and every free argument but one of the negated constraint keeps its value.
+
+    @category: Business Classes, Analyzer
+    """
+
+    __negations: dict[str, str] = {"<": ">=", "<=": ">", ">": "<=", ">=": "<", "==": "!=", "!=": "=="}
+    __flips: dict[str, str] = {"<": ">", "<=": ">=", ">": "<", ">=": "<=", "==": "==", "!=": "!="}
+    __operators: dict[type, str] = {
+        ast.Lt: "<", ast.LtE: "<=", ast.Gt: ">", ast.GtE: ">=", ast.Eq: "==", ast.NotEq: "!="
+    }
+    __max_conjunctions: int = 32
+
+    def parse(self, _code_str: str) -> list[list[Constraint]]:
+        """
+        Parses the path condition of every branch target of a function into conjunctions of linear constraints.
+
+        Parameters:
+            _code_str (str): The code of the function.
+
+        Returns:
+            list[list[Constraint]]: The conjunctions of the branch targets that can be modelled, without duplicates.
+        """
+        try:
+            tree: ast.Module = ast.parse(_code_str)
+        except SyntaxError:
+            return []
+
+        function_node = next((node for node in tree.body if isinstance(
+            node, (ast.FunctionDef, ast.AsyncFunctionDef))), None)
+        if function_node is None:
+            return []
+
+        arguments: set[str] = {
+            arg.arg for arg in function_node.args.args + function_node.args.kwonlyargs}
+        assigned: set[str] = {
+            node.id for node in ast.walk(function_node) if isinstance(node, ast.Name) and isinstance(node.ctx, ast.Store)
+        }
+
+        paths: list[list[tuple[ast.expr, bool]]] = []
+        self.walk_paths(function_node.body, [], paths)
+
+        conjunctions: dict[str, list[Constraint]] = {}
+        for path in paths:
+            dnf: list[list[Constraint]] | None = [[]]
+            for condition, polarity in path:
+                condition_dnf = self.__to_dnf(
+                    condition, polarity, arguments - assigned)
+                if condition_dnf is None or dnf is None:
+                    dnf = None
+                    break
+                dnf = [left + right for left in dnf for right in condition_dnf][:self.__max_conjunctions]
+
+            for conjunction in dnf or []:
+                conjunctions.setdefault(repr(conjunction), conjunction)
+
+        return [conjunction for conjunction in conjunctions.values() if conjunction]
+
+    def solve(self, _conjunctions: list[list[Constraint]], _arg_types: dict[str, Any]) -> list[dict[str, Any]]:
+        """
+        Computes the argument values that satisfy each conjunction, with a random point of the feasible interval.
+
+        Parameters:
+            _conjunctions (list[list[Constraint]]): The conjunctions returned by parse.
+            _arg_types (dict[str, Any]): The type of every argument, None if the argument has no type.
+
+        Returns:
+            list[dict[str, Any]]: The values of the constrained arguments for every conjunction that has a solution.
+        """
+        solutions: list[dict[str, Any]] = []
+        for conjunction in _conjunctions:
+            solution: dict[str, Any] | None = self.__solve_conjunction(
+                conjunction, _arg_types)
+            if solution is not None:
+                solutions.append(solution)
+        return solutions
+
+    def solve_path(self, _conjunction: list[Constraint], _arg_types: dict[str, Any], _values: dict[str, Any]) -> dict[str, Any] | None:
+        """
+        Computes the argument values that satisfy the path of a concolic run with its last constraint negated.
+        The equalities of the path are eliminated first, each one expresses an argument by the others. Then one argument
+        of the negated constraint, the first one in a random order that has a solution, is solved from the constraints of one argument
+        that are left when the other free arguments keep the values of the input that ran the path,
+        and the eliminated arguments are computed back from it.
+
+        Parameters:
+            _conjunction (list[Constraint]): The constraints of the path, the last one negated.
+            _arg_types (dict[str, Any]): The type of every argument, None if the argument has no type.
+            _values (dict[str, Any]): The argument values of the input that ran the path.
+
+        Returns:
+            dict[str, Any] | None: The values of the constrained arguments, None if no solution was found.
+        """
+        if any(name not in _arg_types or name not in _values for _, coefficients, _ in _conjunction for name in coefficients):
+            return None
+
+        substitutions: dict[str, tuple[dict[str, float], float]] = {}
+        constraints: list[Constraint] = []
+        for index, (operator, coefficients, constant) in enumerate(_conjunction):
+            coefficients, constant = self.__substitute(coefficients, constant, substitutions)
+            if operator != "==" or not coefficients or index == len(_conjunction) - 1:
+                constraints.append((operator, coefficients, constant))
+                continue
+            pivot: str = max(coefficients, key=lambda name: (abs(coefficients[name]) == 1, abs(coefficients[name])))
+            scale: float = -1 / coefficients[pivot]
+            expression: tuple[dict[str, float], float] = (
+                {name: value * scale for name, value in coefficients.items() if name != pivot}, constant * scale)
+            for name, (other_coefficients, other_constant) in substitutions.items():
+                substitutions[name] = self.__substitute(other_coefficients, other_constant, {pivot: expression})
+            substitutions[pivot] = expression
+        # A constraint before an equality may hold the argument that equality eliminated.
+        constraints = [(operator, *self.__substitute(coefficients, constant, substitutions))
+                       for operator, coefficients, constant in constraints]
+
+        names: list[str] = list(constraints[-1][1])
+        random.shuffle(names)
+        for name in names:
+            values: dict[str, Any] = {
+                other: value for other, value in _values.items() if other != name and other not in substitutions}
+            reduced: list[Constraint] = []
+            for operator, coefficients, constant in constraints:
+                rest: float = constant + sum(
+                    value * values[other] for other, value in coefficients.items() if other != name)
+                if name in coefficients:
+                    reduced.append((operator, {name: coefficients[name]}, rest))
+                elif not self.__holds((operator, {}, rest), {}):
+                    break
+            else:
+                solution: dict[str, Any] | None = self.__solve_conjunction(
+                    reduced, {name: _arg_types[name]})
+                if solution is None:
+                    continue
+                values.update(solution)
+                for pivot, (coefficients, constant) in substitutions.items():
+                    value: Any = constant + sum(coefficient * values[other] for other, coefficient in coefficients.items())
+                    if _arg_types[pivot] is not float and type(_values[pivot]) is not float and value == round(value):
+                        value = int(round(value))
+                    values[pivot] = value
+                if all(self.__holds(constraint, values) for constraint in _conjunction):
+                    return values
+        return None
+
+    def negate(self, _constraint: Constraint) -> Constraint:
+        """
+        Returns the negation of a constraint.
+
+        Parameters:
+            _constraint (Constraint): The constraint.
+
+        Returns:
+            Constraint: The constraint with the negated operator.
+        """
+        operator, coefficients, constant = _constraint
+        return self.__negations[operator], coefficients, constant
+
+    def walk_paths(self, _body: list[ast.stmt], _path: list[tuple[ast.expr, bool]], _paths: list[list[tuple[ast.expr, bool]]]) -> None:
+        """
+        Walks the statements of a body and collects the path conditions of the branches.
+
+        Parameters:
+            _body (list[ast.stmt]): The statements.
+            _path (list[tuple[ast.expr, bool]]): The conditions of the enclosing branches with their polarity.
+            _paths (list[list[tuple[ast.expr, bool]]]): The collected path conditions.
+
+        Returns:
+            None
+        """
+        for statement in _body:
+            if isinstance(statement, (ast.If, ast.While)):
+                true_path = _path + [(statement.test, True)]
+                false_path = _path + [(statement.test, False)]
+                _paths.extend([true_path, false_path])
+                self.walk_paths(statement.body, true_path, _paths)
+                self.walk_paths(statement.orelse, false_path, _paths)
+            elif isinstance(statement, (ast.For, ast.AsyncFor)):
+                self.walk_paths(statement.body, _path, _paths)
+                self.walk_paths(statement.orelse, _path, _paths)
+            elif isinstance(statement, (ast.With, ast.AsyncWith)):
+                self.walk_paths(statement.body, _path, _paths)
+            elif isinstance(statement, ast.Try):
+                for body in [statement.body, *(handler.body for handler in statement.handlers), statement.orelse, statement.finalbody]:
+                    self.walk_paths(body, _path, _paths)
+
+    def __to_dnf(self, _condition: ast.expr, _polarity: bool, _arguments: set[str]) -> list[list[Constraint]] | None:
+        """
+        Converts a condition into a disjunction of conjunctions of linear constraints.
+
+        Parameters:
+            _condition (ast.expr): The condition.
+            _polarity (bool): False to convert the negation of the condition.
+            _arguments (set[str]): The arguments that are not assigned in the function.
+
+        Returns:
+            list[list[Constraint]] | None: The disjunction, None if the condition can not be modelled.
+        """
+        if isinstance(_condition, ast.UnaryOp) and isinstance(_condition.op, ast.Not):
+            return self.__to_dnf(_condition.operand, not _polarity, _arguments)
+
+        if isinstance(_condition, ast.BoolOp):
+            parts = [self.__to_dnf(value, _polarity, _arguments)
+                     for value in _condition.values]
+            if any(part is None for part in parts):
+                return None
+            if isinstance(_condition.op, ast.And) == _polarity:
+                dnf: list[list[Constraint]] = [[]]
+                for part in parts:
+                    dnf = [left + right for left in dnf for right in part][:self.__max_conjunctions]  # type: ignore
+                return dnf
+            return [conjunction for part in parts for conjunction in part][:self.__max_conjunctions]  # type: ignore
+
+        if isinstance(_condition, ast.Constant):
+            return [[]] if bool(_condition.value) == _polarity else []
+
+        if isinstance(_condition, ast.Compare):
+            conjunction: list[Constraint] = []
+            operands: list[ast.expr] = [_condition.left, *_condition.comparators]
+            for index, op in enumerate(_condition.ops):
+                operator: str | None = self.__operators.get(type(op))
+                left = self.__linear(operands[index], _arguments)
+                right = self.__linear(operands[index + 1], _arguments)
+                if operator is None or left is None or right is None:
+                    return None
+                coefficients: dict[str, float] = dict(left[0])
+                for name, coefficient in right[0].items():
+                    coefficients[name] = coefficients.get(
+                        name, 0) - coefficient
+                conjunction.append(
+                    (operator, {name: value for name, value in coefficients.items() if value}, left[1] - right[1]))
+
+            if _polarity:
+                return [conjunction]
+            return [[(self.__negations[operator], coefficients, constant)] for operator, coefficients, constant in conjunction]
+
+        linear = self.__linear(_condition, _arguments)
+        if linear is None:
+            return None
+        return [[("!=" if _polarity else "==", linear[0], linear[1])]]
+
+    def __linear(self, _node: ast.expr, _arguments: set[str]) -> tuple[dict[str, float], float] | None:
+        """
+        Converts an expression into a linear form over the arguments.
+
+        Parameters:
+            _node (ast.expr): The expression.
+            _arguments (set[str]): The arguments that are not assigned in the function.
+
+        Returns:
+            tuple[dict[str, float], float] | None: The coefficients of the arguments and the constant,
+            None if the expression is not linear over the arguments.
+        """
+        if isinstance(_node, ast.Constant) and isinstance(_node.value, (int, float)) and not isinstance(_node.value, bool):
+            # A literal such as 1e999 is infinite, it can not become the edge of an interval.
+            return ({}, _node.value) if math.isfinite(_node.value) else None
+        if isinstance(_node, ast.Name):
+            return ({_node.id: 1}, 0) if _node.id in _arguments else None
+        if isinstance(_node, ast.UnaryOp) and isinstance(_node.op, (ast.USub, ast.UAdd)):
+            operand = self.__linear(_node.operand, _arguments)
+            if operand is None or isinstance(_node.op, ast.UAdd):
+                return operand
+            return {name: -value for name, value in operand[0].items()}, -operand[1]
+        if isinstance(_node, ast.BinOp):
+            left = self.__linear(_node.left, _arguments)
+            right = self.__linear(_node.right, _arguments)
+            if left is None or right is None:
+                return None
+            linear: tuple[dict[str, float], float] | None = None
+            if isinstance(_node.op, (ast.Add, ast.Sub)):
+                sign: int = 1 if isinstance(_node.op, ast.Add) else -1
+                coefficients: dict[str, float] = dict(left[0])
+                for name, value in right[0].items():
+                    coefficients[name] = coefficients.get(name, 0) + sign * value
+                linear = coefficients, left[1] + sign * right[1]
+            elif isinstance(_node.op, ast.Mult) and not (left[0] and right[0]):
+                factor, (coefficients, constant) = (
+                    left[1], right) if not left[0] else (right[1], left)
+                linear = {name: value * factor for name, value in coefficients.items()}, constant * factor
+            elif isinstance(_node.op, ast.Div) and not right[0] and right[1]:
+                linear = {name: value / right[1] for name, value in left[0].items()}, left[1] / right[1]
+            # Finite literals may still overflow, 1e308 * 10 is infinite.
+            if linear is not None and all(math.isfinite(value) for value in (linear[1], *linear[0].values())):
+                return linear
+        return None
+
+    def __solve_conjunction(self, _conjunction: list[Constraint], _arg_types: dict[str, Any]) -> dict[str, Any] | None:
+        """
+        Computes the argument values that satisfy a conjunction.
+        The arguments are assigned one by one, the interval of an argument is narrowed by its own constraints
+        and by the difference constraints with the arguments that are already assigned.
+
+        Parameters:
+            _conjunction (list[Constraint]): The constraints.
+            _arg_types (dict[str, Any]): The type of every argument, None if the argument has no type.
+
+        Returns:
+            dict[str, Any] | None: The values of the constrained arguments, None if no solution was found.
+        """
+        for _, coefficients, _ in _conjunction:
+            if len(coefficients) > 2 or (len(coefficients) == 2 and sum(coefficients.values()) != 0):
+                return None
+            if any(name not in _arg_types for name in coefficients):
+                return None
+
+        names: list[str] = [name for name in _arg_types if any(
+            name in coefficients for _, coefficients, _ in _conjunction)]
+        values: dict[str, Any] = {}
+        for name in names:
+            low: tuple[float, bool] = (-math.inf, False)
+            high: tuple[float, bool] = (math.inf, False)
+            excluded: set[float] = set()
+            for operator, coefficients, constant in _conjunction:
+                if name not in coefficients or any(other not in values for other in coefficients if other != name):
+                    continue
+
+                coefficient: float = coefficients[name]
+                rest: float = constant + sum(
+                    value * values[other] for other, value in coefficients.items() if other != name)
+                bound: float = -rest / coefficient
+                if not math.isfinite(bound):
+                    # An infinite or NaN operand, for example a runtime value of float("inf"), gives no interval to pick from.
+                    return None
+                if coefficient < 0:
+                    operator = self.__flips[operator]
+
+                if operator in ("<", "<="):
+                    high = min(high, (bound, operator == "<"),
+                               key=lambda edge: (edge[0], not edge[1]))
+                elif operator in (">", ">="):
+                    low = max(low, (bound, operator == ">"),
+                              key=lambda edge: (edge[0], edge[1]))
+                elif operator == "==":
+                    low = max(low, (bound, False), key=lambda edge: (edge[0], edge[1]))
+                    high = min(high, (bound, False),
+                               key=lambda edge: (edge[0], not edge[1]))
+                else:
+                    excluded.add(bound)
+
+            value: Any = self.__pick(low, high, excluded, _arg_types.get(name))
+            if value is None:
+                return None
+            values[name] = value
+
+        if not all(self.__holds(constraint, values) for constraint in _conjunction):
+            return None
+        return values
+
+    def __substitute(
+        self, _coefficients: dict[str, float], _constant: float, _substitutions: dict[str, tuple[dict[str, float], float]]
+    ) -> tuple[dict[str, float], float]:
+        """
+        Replaces the eliminated arguments of a linear form with their expressions.
+
+        Parameters:
+            _coefficients (dict[str, float]): The coefficients of the linear form.
+            _constant (float): The constant of the linear form.
+            _substitutions (dict[str, tuple[dict[str, float], float]]): The expression of every eliminated argument.
+
+        Returns:
+            tuple[dict[str, float], float]: The coefficients and the constant of the linear form over the other arguments.
+        """
+        coefficients: dict[str, float] = {}
+        constant: float = _constant
+        for name, coefficient in _coefficients.items():
+            if name in _substitutions:
+                expression_coefficients, expression_constant = _substitutions[name]
+                constant += coefficient * expression_constant
+                for other, value in expression_coefficients.items():
+                    coefficients[other] = coefficients.get(other, 0.0) + coefficient * value
+            else:
+                coefficients[name] = coefficients.get(name, 0.0) + coefficient
+        return {name: value for name, value in coefficients.items() if value}, constant
+
+    def __pick(self, _low: tuple[float, bool], _high: tuple[float, bool], _excluded: set[float], _arg_type: Any) -> Any:
+        """
+        Picks a value from an interval, one of the edges or a random point between them.
+        Integers are preferred unless the argument is a float.
+
+        Parameters:
+            _low (tuple[float, bool]): The lower edge and whether it is excluded.
+            _high (tuple[float, bool]): The upper edge and whether it is excluded.
+            _excluded (set[float]): The values the argument must not take.
+            _arg_type (Any): The type of the argument, None if the argument has no type.
+
+        Returns:
+            Any: The picked value, None if the interval is empty or an edge is not a number.
+        """
+        if math.isnan(_low[0]) or math.isnan(_high[0]) or _low[0] == math.inf or _high[0] == -math.inf:
+            return None
+        if _arg_type is not float:
+            low: float = -math.inf if _low[0] == -math.inf else (
+                math.floor(_low[0]) + 1 if _low[1] or _low[0] != math.floor(_low[0]) else _low[0])
+            high: float = math.inf if _high[0] == math.inf else (
+                math.ceil(_high[0]) - 1 if _high[1] or _high[0] != math.ceil(_high[0]) else _high[0])
+            if low == -math.inf and high == math.inf:
+                low, high = -100, 100
+            elif low == -math.inf:
+                low = high - 100
+            elif high == math.inf:
+                high = low + 100
+
+            if low <= high:
+                for candidate in (random.choice([low, high, random.randint(int(low), int(high))]), low, high):
+                    candidate = int(candidate)
+                    while candidate in _excluded and candidate <= high:
+                        candidate += 1
+                    if low <= candidate <= high:
+                        return candidate
+
+            if _arg_type is int:
+                return None
+
+        low_edge, low_open = _low
+        high_edge, high_open = _high
+        if low_edge == -math.inf and high_edge == math.inf:
+            low_edge, high_edge = -100.0, 100.0
+        elif low_edge == -math.inf:
+            low_edge = high_edge - 100.0
+        elif high_edge == math.inf:
+            high_edge = low_edge + 100.0
+        if low_edge > high_edge or (low_edge == high_edge and (low_open or high_open)):
+            return None
+
+        candidate: float = round(random.uniform(low_edge, high_edge), 1)
+        if (low_open and candidate <= low_edge) or (high_open and candidate >= high_edge) or candidate in _excluded:
+            candidate = (low_edge + high_edge) / 2
+        return None if candidate in _excluded else candidate
+
+    def __holds(self, _constraint: Constraint, _values: dict[str, Any]) -> bool:
+        """
+        Checks a constraint with the given argument values.
+
+        Parameters:
+            _constraint (Constraint): The constraint.
+            _values (dict[str, Any]): The values of the arguments.
+
+        Returns:
+            bool: True if the constraint holds, False otherwise.
+        """
+        operator, coefficients, constant = _constraint
+        total: float = constant + sum(
+            value * _values[name] for name, value in coefficients.items())
+        return {
+            "<": total < 0, "<=": total <= 0, ">": total > 0, ">=": total >= 0, "==": total == 0, "!=": total != 0
+        }[operator]
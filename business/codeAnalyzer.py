@@ -11,7 +11,6 @@ class CodeAnalyzer(CodeFormatter):
         - __init__(self): Initializes the instance variables of the class.
         - branched_keys(self): Returns the list of branched keys.
         - skip_statement_keys(self): Returns the list of skip statement keys.
-        - last_code_line(self): Returns the last code line.
         - left_space_count(self, _code_lines): Returns the number of leading spaces in the given code line.
         - right_space_count(self, _code_lines): Returns the number of trailing spaces in the given code line.
         - is_skip_statement_line(self, _code_lines): Checks if the given code lines contain any skip statement keys.
@@ -35,7 +34,6 @@ class CodeAnalyzer(CodeFormatter):
         self.__branched_keys: list[str] = [
             "if", "elif", "else", "for", "while"]
         self.__skip_statement_keys: list[str] = ["return", "break"]
-        self.__last_code_line: str = "_lcl_"
 
     @property
     def branched_keys(self) -> list[str]:
@@ -56,15 +54,6 @@ class CodeAnalyzer(CodeFormatter):
         """
         return self.__skip_statement_keys
 
-    @property
-    def last_code_line(self) -> str:
-        """Returns the last code line.
-
-        Returns:
-            str: A string representing the last code line.
-        """
-        return self.__last_code_line
-
     def left_space_count(self, _code_lines: str) -> int:
         """
         Calculate the number of leading spaces or tabs in a given string of code lines.
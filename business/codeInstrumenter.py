@@ -0,0 +1,359 @@
+"""
+This class is a code instrumenter that walks the ast of a source code and inserts integer probes at each statement and branch target.
+"""
+import ast
+import copy
+from entity.instrumentedCode import InstrumentedCode, Predicate
+
+
+class CodeInstrumenter:
+    """
+    This class is a code instrumenter that walks the ast of a source code and inserts integer probes at each statement and branch target.
+    Here's what each class method does:
+
+    - __init__: Initializes a new instance of the class with an empty source map and branch map.
+    - probe_name: Gets the name of the probe array the instrumented code writes to.
+    - compare_name: Gets the name of the comparison recorder the instrumented conditions call.
+    - distances_name: Gets the name of the flag that turns the comparison recorder on.
+    - step_name: Gets the name of the step counter of the trial budget the loops and functions call.
+    - instrument: Instruments the given source code and returns the instrumented code with its source map.
+    - __add_probe: Allocates a new probe id for a line and returns the probe statement.
+    - __add_branch_probe: Allocates a new branch probe id for a (decision line, target line) pair and returns the probe statement.
+    - __add_step: Returns the statement that counts a step of the trial budget.
+    - __instrument_condition: Replaces the leaves of a condition with calls to the comparison recorder and returns its predicate tree.
+    - __instrument_body: Inserts the probes into a list of statements.
+    - __leading_count: Counts the docstring and the __future__ imports at the start of a body.
+    - __instrument_statement: Instruments the sub bodies of a compound statement.
+
+    A probe is the statement `_att_probes_[<probe id>] = 1`, so a trial marks the probes it reached in a bytearray.
+    Every statement gets a probe before it, but a leading docstring and the __future__ imports get theirs after them,
+    so the docstring is kept as __doc__ and the imports stay valid. Every branch target gets a branch probe: the body and the else part of `if`,
+    the body and the exit of loops, the `except` handlers of `try` and the cases of `match`.
+    Missing else parts and default cases are added with only a branch probe in them.
+    Every leaf of an `if` or `while` condition becomes
+    `(_att_compare_(<compare id>, "<operator>", left, right) if _att_distances_ else left <operator> right)`,
+    the recorder returns the value of the leaf and records its branch distances, see BranchDistance.
+    The flag is off unless the branch distances are asked for, so the other trials pay only for reading it.
+    Every loop body and function body starts with `_att_step_()`, which stops a trial that does not end, see TrialBudget.
+
+    @category: Business Classes, Instrumenter
+    @import: InstrumentedCode, Predicate
+    @see: InstrumentedCode, BranchDistance
+    """
+
+    def __init__(self) -> None:
+        """
+        Initializes a new instance of the class.
+
+        Parameters:
+            None
+
+        Returns:
+            None
+
+        @category: Business Classes, Instrumenter
+        @import: InstrumentedCode
+        @see: InstrumentedCode
+        """
+        self.__probe_name: str = "_att_probes_"
+        self.__source_map: list[int] = []
+        self.__branch_map: dict[int, tuple[int, int]] = {}
+        self.__compare_name: str = "_att_compare_"
+        self.__distances_name: str = "_att_distances_"
+        self.__condition_map: dict[int, tuple[bool, Predicate]] = {}
+        self.__compare_count: int = 0
+        self.__step_name: str = "_att_step_"
+
+    @property
+    def probe_name(self) -> str:
+        """
+        Returns the name of the probe array the instrumented code writes to.
+
+        Returns:
+            str: The name of the probe array.
+        """
+        return self.__probe_name
+
+    @property
+    def compare_name(self) -> str:
+        """
+        Returns the name of the comparison recorder the instrumented conditions call.
+
+        Returns:
+            str: The name of the comparison recorder.
+        """
+        return self.__compare_name
+
+    @property
+    def distances_name(self) -> str:
+        """
+        Returns the name of the flag that turns the comparison recorder on.
+
+        Returns:
+            str: The name of the flag.
+        """
+        return self.__distances_name
+
+    @property
+    def step_name(self) -> str:
+        """
+        Returns the name of the step counter of the trial budget the loops and functions call.
+
+        Returns:
+            str: The name of the step counter.
+        """
+        return self.__step_name
+
+    def instrument(self, _code_str: str) -> InstrumentedCode:
+        """
+        Instrument the given source code.
+
+        Parameters:
+            _code_str (str): The source code to instrument.
+
+        Returns:
+            InstrumentedCode: The instrumented source code with its source map, branch map and condition map.
+
+        Raises:
+            SyntaxError: If the source code can not be parsed.
+        """
+        self.__source_map = []
+        self.__branch_map = {}
+        self.__condition_map = {}
+        self.__compare_count = 0
+
+        tree: ast.Module = ast.parse(_code_str)
+        tree.body = self.__instrument_body(tree.body, 0)
+        ast.fix_missing_locations(tree)
+
+        return InstrumentedCode(ast.unparse(tree), self.__source_map, self.__branch_map, self.__condition_map)
+
+    def __add_probe(self, _line: int) -> ast.stmt:
+        """
+        Allocate a new probe id for the given line and return the probe statement.
+
+        Parameters:
+            _line (int): The line number of the probe.
+
+        Returns:
+            ast.stmt: The probe statement.
+        """
+        probe_id: int = len(self.__source_map)
+        self.__source_map.append(_line)
+
+        probe: ast.stmt = ast.Assign(
+            targets=[
+                ast.Subscript(
+                    value=ast.Name(id=self.__probe_name, ctx=ast.Load()),
+                    slice=ast.Constant(value=probe_id),
+                    ctx=ast.Store(),
+                )
+            ],
+            value=ast.Constant(value=1),
+        )
+        probe.lineno = _line
+        return probe
+
+    def __add_branch_probe(self, _decision_line: int, _target_line: int, _condition: tuple[bool, Predicate] | None = None) -> ast.stmt:
+        """
+        Allocate a new branch probe id for the given (decision line, target line) pair and return the probe statement.
+
+        Parameters:
+            _decision_line (int): The line number of the statement that takes the branch.
+            _target_line (int): The line number the branch jumps to, 0 if it leaves the function.
+            _condition (tuple[bool, Predicate] | None): The outcome of the condition that takes the branch and its predicate tree.
+            Defaults to None for the branches without a condition.
+
+        Returns:
+            ast.stmt: The probe statement.
+        """
+        self.__branch_map[len(self.__source_map)] = (
+            _decision_line, _target_line)
+        if _condition is not None:
+            self.__condition_map[len(self.__source_map)] = _condition
+        return self.__add_probe(_decision_line)
+
+    def __add_step(self, _line: int) -> ast.stmt:
+        """
+        Return the statement that counts a step of the trial budget.
+
+        Parameters:
+            _line (int): The line number of the statement.
+
+        Returns:
+            ast.stmt: The step statement.
+        """
+        step: ast.stmt = ast.Expr(value=ast.Call(
+            func=ast.Name(id=self.__step_name, ctx=ast.Load()), args=[], keywords=[]))
+        step.lineno = _line
+        return step
+
+    def __instrument_condition(self, _test: ast.expr) -> tuple[ast.expr, Predicate]:
+        """
+        Replace the leaves of a condition with calls to the comparison recorder and return its predicate tree.
+        `and`, `or` and `not` are kept, so the short circuit of the condition does not change.
+        A comparison with one operator gives its operator and operands to the recorder, any other leaf gives its value.
+
+        Parameters:
+            _test (ast.expr): The condition.
+
+        Returns:
+            tuple[ast.expr, Predicate]: The instrumented condition and its predicate tree.
+        """
+        if isinstance(_test, ast.BoolOp):
+            children: list[tuple[ast.expr, Predicate]] = [
+                self.__instrument_condition(value) for value in _test.values]
+            _test.values = [value for value, _ in children]
+            kind: str = "and" if isinstance(_test.op, ast.And) else "or"
+            return _test, (kind, tuple(predicate for _, predicate in children))
+
+        if isinstance(_test, ast.UnaryOp) and isinstance(_test.op, ast.Not):
+            _test.operand, predicate = self.__instrument_condition(
+                _test.operand)
+            return _test, ("not", predicate)
+
+        compare_id: int = self.__compare_count
+        self.__compare_count += 1
+        args: list[ast.expr] = [ast.Constant(value=compare_id)]
+        if (
+            isinstance(_test, ast.Compare)
+            and len(_test.ops) == 1
+            and isinstance(_test.ops[0], (ast.Eq, ast.NotEq, ast.Lt, ast.LtE, ast.Gt, ast.GtE))
+        ):
+            args += [ast.Constant(value=type(_test.ops[0]).__name__),
+                     _test.left, _test.comparators[0]]
+        else:
+            args += [ast.Constant(value="Truth"), _test]
+
+        call: ast.expr = ast.Call(
+            func=ast.Name(id=self.__compare_name, ctx=ast.Load()), args=args, keywords=[])
+        leaf: ast.expr = ast.IfExp(
+            test=ast.Name(id=self.__distances_name, ctx=ast.Load()),
+            body=call,
+            orelse=copy.deepcopy(_test),
+        )
+        return ast.copy_location(leaf, _test), ("compare", compare_id)
+
+    def __instrument_body(self, _body: list[ast.stmt], _next_line: int) -> list[ast.stmt]:
+        """
+        Insert a probe before every statement of the given body and instrument the compound statements.
+
+        Parameters:
+            _body (list[ast.stmt]): The statements to instrument.
+            _next_line (int): The line number that runs after the body, 0 if the body ends the function.
+
+        Returns:
+            list[ast.stmt]: The instrumented statements.
+        """
+        instrumented_body: list[ast.stmt] = []
+        # The probes of the leading statements go after them, a docstring must stay first and so must the __future__ imports.
+        leading_count: int = self.__leading_count(_body)
+        leading_probes: list[ast.stmt] = []
+        for index, statement in enumerate(_body):
+            next_line: int = _body[index + 1].lineno if index + \
+                1 < len(_body) else _next_line
+
+            if not (isinstance(statement, ast.ImportFrom) and statement.module == "__future__"):
+                probe: ast.stmt = self.__add_probe(statement.lineno)
+                if index < leading_count:
+                    leading_probes.append(probe)
+                else:
+                    instrumented_body.append(probe)
+            self.__instrument_statement(statement, next_line)
+            instrumented_body.append(statement)
+            if index == leading_count - 1:
+                instrumented_body += leading_probes
+
+        return instrumented_body
+
+    def __leading_count(self, _body: list[ast.stmt]) -> int:
+        """
+        Count the statements at the start of a body that must not have a statement before them:
+        the docstring and the __future__ imports after it.
+
+        Parameters:
+            _body (list[ast.stmt]): The statements.
+
+        Returns:
+            int: The number of the leading statements.
+        """
+        count: int = 0
+        if _body and isinstance(_body[0], ast.Expr) and isinstance(_body[0].value, ast.Constant) \
+                and isinstance(_body[0].value.value, str):
+            count = 1
+        while count < len(_body) and isinstance(_body[count], ast.ImportFrom) and _body[count].module == "__future__":
+            count += 1
+        return count
+
+    def __instrument_statement(self, _statement: ast.stmt, _next_line: int) -> None:
+        """
+        Instrument the sub bodies of a compound statement and add the branch probes of its branch targets.
+
+        Parameters:
+            _statement (ast.stmt): The statement to instrument.
+            _next_line (int): The line number that runs after the statement, 0 if the statement ends the function.
+
+        Returns:
+            None
+        """
+        line: int = _statement.lineno
+
+        if isinstance(_statement, ast.If):
+            _statement.test, predicate = self.__instrument_condition(
+                _statement.test)
+            _statement.body = [self.__add_branch_probe(line, _statement.body[0].lineno, (True, predicate))] + \
+                self.__instrument_body(_statement.body, _next_line)
+            target_line: int = _statement.orelse[0].lineno if _statement.orelse else _next_line
+            _statement.orelse = [self.__add_branch_probe(line, target_line, (False, predicate))] + \
+                self.__instrument_body(_statement.orelse, _next_line)
+
+        elif isinstance(_statement, (ast.For, ast.AsyncFor, ast.While)):
+            constant_test: bool = isinstance(_statement, ast.While) and isinstance(
+                _statement.test, ast.Constant)
+            infinite_loop: bool = constant_test and bool(
+                getattr(_statement, "test").value)
+            condition: Predicate | None = None
+            if isinstance(_statement, ast.While) and not constant_test:
+                _statement.test, condition = self.__instrument_condition(
+                    _statement.test)
+            _statement.body = [
+                self.__add_branch_probe(line, _statement.body[0].lineno,
+                                        None if condition is None else (True, condition)),
+                self.__add_step(line),
+            ] + self.__instrument_body(_statement.body, line)
+            orelse: list[ast.stmt] = self.__instrument_body(
+                _statement.orelse, _next_line)
+            if not infinite_loop:
+                target_line = _statement.orelse[0].lineno if _statement.orelse else _next_line
+                orelse = [self.__add_branch_probe(
+                    line, target_line, None if condition is None else (False, condition))] + orelse
+            _statement.orelse = orelse
+
+        elif isinstance(_statement, (ast.Try, getattr(ast, "TryStar", ast.Try))):
+            _statement.body = self.__instrument_body(
+                _statement.body, _next_line)
+            for handler in _statement.handlers:
+                handler.body = [self.__add_branch_probe(line, handler.body[0].lineno)] + \
+                    self.__instrument_body(handler.body, _next_line)
+            _statement.orelse = self.__instrument_body(
+                _statement.orelse, _next_line)
+            _statement.finalbody = self.__instrument_body(
+                _statement.finalbody, _next_line)
+
+        elif isinstance(_statement, ast.Match):
+            for case in _statement.cases:
+                case.body = [self.__add_branch_probe(line, case.body[0].lineno)] + \
+                    self.__instrument_body(case.body, _next_line)
+            last_case: ast.match_case = _statement.cases[-1]
+            if not (isinstance(last_case.pattern, ast.MatchAs) and last_case.pattern.pattern is None and last_case.guard is None):
+                _statement.cases.append(ast.match_case(
+                    pattern=ast.MatchAs(), body=[self.__add_branch_probe(line, _next_line)]))
+
+        elif isinstance(_statement, (ast.FunctionDef, ast.AsyncFunctionDef)):
+            docstring_count: int = min(self.__leading_count(_statement.body), 1)
+            _statement.body = self.__instrument_body(_statement.body, 0)
+            _statement.body.insert(docstring_count, self.__add_step(line))
+
+        elif isinstance(_statement, (ast.ClassDef, ast.With, ast.AsyncWith)):
+            _statement.body = self.__instrument_body(
+                _statement.body, _next_line)
@@ -1,7 +1,15 @@
 """
 The CodeManager class extends the CodeAnalyzer class
 """
+from typing import Any, Iterable
 from business.codeAnalyzer import CodeAnalyzer
+from business.codeInstrumenter import CodeInstrumenter
+from business.constantMiner import ConstantMiner
+from business.controlFlowBuilder import ControlFlowBuilder
+from business.branchSolver import BranchSolver
+from entity.controlFlowGraph import ControlFlowGraph
+from entity.instrumentedCode import InstrumentedCode
+from entity.minedConstants import MinedConstants
 
 
 class CodeManaager(CodeAnalyzer):
@@ -13,12 +21,12 @@ class CodeManaager(CodeAnalyzer):
     - coverage_rate - Gets the coverage rate of the object.
     - branched_count - Gets the value of the __branched_count property.
     - get_code_lines(_code_str: str) -> list[str] - Extracts and returns a list of code lines from the given code string.
-    - __loop_line(code: str) -> bool - Checks if a line of code is a loop statement.
-    - __if_elif_else_line(code: str) -> bool - Checks if a line of code is an if, elif, or else statement.
-    - __increase_number_of_branches(_line: str, _loop: bool, _code_lines: list[str], _index: int, _branches: int) -> int - Increases the number of branches based on certain conditions.
-    - __return_line(code: str) -> bool - Checks if a code line starts with the keyword "return".
-    - get_branched_count(_code_str: str) -> int - Calculates the number of branches in the given code.
-    - add_content_to_code(_code_str: str) -> str - Generates a modified version of the code string by adding content comments.
+    - build_control_flow_graph(_code_str: str, _branch_map: dict[int, tuple[int, int]]) -> ControlFlowGraph - Builds the control flow graph of the code string with its branch edges.
+    - instrument_code(_code_str: str) -> InstrumentedCode - Instruments the code string with integer probes and returns it with its source map.
+    - mine_constants(_code_str: str) -> MinedConstants - Mines the literals of the conditions of the code string.
+    - merge_observed_constants(_constants: MinedConstants, _values: Iterable[Any]) -> MinedConstants - Adds the operands compared at run time to the observed constants.
+    - parse_branch_constraints(_code_str: str) -> list[list[tuple[str, dict[str, float], float]]] - Parses the path conditions of the branches of numerical code into linear constraints.
+    - add_content_to_code(_code_str: str) -> str - Generates a modified version of the code string by adding integer probes.
 
         Parameters:
             None
@@ -27,8 +35,8 @@ class CodeManaager(CodeAnalyzer):
             None
 
         @category: Business, Manager
-        @import: CodeAnalyzer
-        @see: CodeAnalyzer
+        @import: CodeAnalyzer, CodeInstrumenter, ConstantMiner, ControlFlowBuilder, BranchSolver, ControlFlowGraph, InstrumentedCode, MinedConstants
+        @see: CodeAnalyzer, CodeInstrumenter, ConstantMiner, ControlFlowBuilder, BranchSolver, ControlFlowGraph, InstrumentedCode, MinedConstants
         """
 
     def __init__(self) -> None:
@@ -94,140 +102,86 @@ class CodeManaager(CodeAnalyzer):
         code_lines: list[str] = lines.splitlines()
         return code_lines
 
-    # GET BRANCHED COUNT
-    def __loop_line(self, code: str) -> bool:
+    def build_control_flow_graph(self, _code_str: str, _branch_map: dict[int, tuple[int, int]]) -> ControlFlowGraph:
         """
-        Checks if a line of code is a loop statement.
+        Builds the control flow graph of the given code string from its ast, with the branch edges keyed by the branch probes.
 
-        Parameters:
-            code (str): The line of code to check.
+        Args:
+            _code_str (str): The original code string.
+            _branch_map (dict[int, tuple[int, int]]): The branch map of the instrumented code.
 
         Returns:
-            bool: True if the line of code is a loop statement, False otherwise.
+            ControlFlowGraph: The control flow graph, empty if the code can not be parsed.
         """
-        line_without_space: str = code.strip()
-        return line_without_space.endswith(":") and any(line_without_space.startswith(loop) for loop in ["for", "while"])
+        return ControlFlowBuilder().build("\n".join(self.get_code_lines(_code_str)), _branch_map)
 
-    def __if_elif_else_line(self, code: str) -> bool:
+    def instrument_code(self, _code_str: str) -> InstrumentedCode:
         """
-        Checks if a given line of code is an if, elif, or else statement.
+        Instruments the given code string with integer probes by walking its ast.
+        If the code can not be parsed, the code is returned as it is with an empty source map,
+        so that the syntax error is reported when the code is compiled.
 
-        Parameters:
-            code (str): The line of code to be checked.
+        Args:
+            _code_str (str): The original code string.
 
         Returns:
-            bool: True if the line is an if, elif, or else statement, False otherwise.
+            InstrumentedCode: The instrumented code with its source map and branch map.
         """
-        line_without_space: str = code.strip()
-        return line_without_space.endswith(":") and (line_without_space.startswith("if") or line_without_space.startswith("elif") or line_without_space.startswith("else"))
+        code: str = "\n".join(self.get_code_lines(_code_str))
+        try:
+            return CodeInstrumenter().instrument(code)
+        except SyntaxError:
+            return InstrumentedCode(code, [], {})
 
-    def __increase_number_of_branches(self, _line: str, _loop: bool, _code_lines: list[str], _index: int, _branches: int) -> int:
+    def mine_constants(self, _code_str: str) -> MinedConstants:
         """
-        Increase the number of branches in the code based on certain conditions.
+        Mines the numbers, strings and lengths of the conditions of the given code string from its ast.
 
         Args:
-            _line (str): The current line of code being processed.
-            _loop (bool): A flag indicating whether the code is inside a loop.
-            _code_lines (list[str]): The list of code lines being analyzed.
-            _index (int): The index of the current line in the code_lines list.
-            _branches (int): The current number of branches.
+            _code_str (str): The original code string.
 
         Returns:
-            int: The updated number of branches after processing the current line of code.
+            MinedConstants: The mined literals, empty if the code can not be parsed.
         """
-        if (self.__if_elif_else_line(_line) and not _loop) or (_loop and not _code_lines[_index-1].strip().startswith("return") and _line.strip().startswith("return")):
-            _branches += 1
-        return _branches
+        return ConstantMiner().mine("\n".join(self.get_code_lines(_code_str)))
 
-    def __return_line(self, code: str) -> bool:
+    def merge_observed_constants(self, _constants: MinedConstants, _values: Iterable[Any]) -> MinedConstants:
         """
-        Check if the given code line starts with the keyword "return".
+        Adds the operands the comparisons of a function compared at run time to its observed constants.
 
-        Parameters:
-            code (str): The code line to be checked.
+        Args:
+            _constants (MinedConstants): The observed constants so far.
+            _values (Iterable[Any]): The compared numbers and strings.
 
         Returns:
-            bool: True if the code line starts with "return", False otherwise.
+            MinedConstants: The observed constants with the new operands.
         """
-        line_without_space: str = code.strip()
-        return line_without_space.startswith("return")
+        return ConstantMiner().merge(_constants, _values)
 
-    def get_branched_count(self, _code_str: str) -> int:
+    def parse_branch_constraints(self, _code_str: str) -> list[list[tuple[str, dict[str, float], float]]]:
         """
-        Calculate the number of branches in the given code.
+        Parses the path conditions of the branches of the given code string into linear constraints.
+        Only the code with numerical branches is parsed.
 
-        Parameters:
-            _code_str (str): The code string to analyze.
+        Args:
+            _code_str (str): The original code string.
 
         Returns:
-            int: The number of branches in the code.
-
+            list[list[tuple[str, dict[str, float], float]]]: A conjunction of constraints for every branch target that can be modelled,
+            empty if the branches are not numerical.
         """
-        code_lines: list[str] = _code_str.splitlines()
-        branches: int = 0
-        loop_spaces: list[int] = []
-
-        for index, line in enumerate(code_lines):
-            if self.__loop_line(line):
-                loop_space: int = self.left_space_count(line)
-                if loop_space not in loop_spaces:
-                    loop_spaces.append(loop_space)
-            else:
-                line_space: int = self.left_space_count(line)
-                if loop_spaces and (line_space <= loop_spaces[-1] or self.__return_line(line)):
-                    loop_spaces.pop()
-
-            branches = self.__increase_number_of_branches(
-                line, bool(loop_spaces), code_lines, index, branches)
-
-        return branches
+        if not self.is_branches_numerical(_code_str):
+            return []
+        return BranchSolver().parse("\n".join(self.get_code_lines(_code_str)))
 
     def add_content_to_code(self, _code_str: str) -> str:
         """
-        Generates a modified version of the given code string by adding content comments.
+        Generates a modified version of the given code string by adding integer probes.
 
         Args:
             _code_str (str): The original code string.
 
         Returns:
-            str: The modified code string with content comments.
-        """
-        code_with_content: str = ""
-        codes: list[str] = self.get_code_lines(_code_str)
-        left_space_count: int = 0
-
-        for line in codes:
-            if self.is_skip_statement_line(line):
-                left_space_count = self.left_space_count(line)
-                code_with_content += (
-                    f"\n{' '*left_space_count}{self.last_code_line}='{line}'"
-                )
-
-                code_with_content += f"\n{line}"
-            else:
-                left_space_count = self.left_space_count(line)
-                if line.startswith(f"{' '* left_space_count}def ") and line.endswith(
-                    ":"
-                ):
-                    code_with_content += (
-                        f"\n{' '*left_space_count}{self.last_code_line}='{line}'"
-                    )
-
-                    code_with_content += f"\n{' '*left_space_count}{line}"
-                    code_with_content += (
-                        f"\n{' '*left_space_count}{' '*4}global {self.last_code_line}"
-                    )
-                elif line.startswith(f"{' '*left_space_count}#"):
-                    code_with_content += f"\n{line}"
-                elif self.is_branched_line(line):
-                    code_with_content += f"\n{line}"
-                    code_with_content += f"\n{' '*left_space_count}{' '*4}{self.last_code_line}='{line}'"
-
-                else:
-                    code_with_content += (
-                        f"\n{' '*left_space_count}{self.last_code_line}='{line}'"
-                    )
-
-                    code_with_content += f"\n{line}"
-
-        return code_with_content
+            str: The modified code string with probes.
+        """
+        return self.instrument_code(_code_str).source
@@ -0,0 +1,230 @@
+"""
+This class turns the path of a concolic run into new inputs that flip its comparisons one at a time.
+"""
+import math
+import random
+import string
+from typing import Any
+from business.branchSolver import BranchSolver, Constraint
+from business.symbolicValue import SymbolicValue, SymbolicInt, SymbolicFloat, SymbolicStr
+from entity.instrumentedCode import Predicate
+
+# A string constraint is the comparison <argument> <"==" or "!="> <string>.
+StringConstraint = tuple[str, str, str]
+
+
+class ConcolicExecutor:
+    """
+    This class turns the path of a concolic run into new inputs that flip its comparisons one at a time.
+    Here's what each class method does:
+
+    - __init__: Initializes the executor with the branch solver that solves the flipped paths.
+    - symbolize: Returns the symbolic values of the arguments of an input.
+    - compare_ids: Returns the compare ids of the leaves of a predicate tree.
+    - expand: Returns the inputs that flip each comparison of the path of a run that was not flipped yet.
+    - __constraint: Converts a comparison of the path into the constraint that held in the run.
+    - __solve_strings: Computes the values of the string arguments that satisfy the string constraints.
+
+    A concolic run calls the function with symbolic arguments, see SymbolicValue, so the comparisons of the conditions
+    record their outcome with the linear expression of their operands over the arguments, see BranchDistance.
+    The path of the run is the list of these constraints. Negating the k-th constraint and keeping the ones before it
+    gives the input that takes the other side of the k-th comparison on the same path, it is solved by the bundled
+    linear solver next to the input that ran, see BranchSolver.solve_path. A flip is tried once per path prefix,
+    so every feasible branch is reached in a number of runs close to the number of branches.
+    Equality and inequality of a string argument with a string are solved by assignment, other comparisons are kept concrete.
+    An argument without a type that got a number is also given the string it is compared with.
+
+    @category: Business Classes, Analyzer
+    @import: BranchSolver, Constraint, SymbolicValue, SymbolicInt, SymbolicFloat, SymbolicStr, Predicate
+    @see: BranchSolver, SymbolicValue, BranchDistance
+    """
+
+    __operators: dict[str, str] = {
+        "Eq": "==", "NotEq": "!=", "Lt": "<", "LtE": "<=", "Gt": ">", "GtE": ">="
+    }
+
+    def __init__(self, _branch_solver: BranchSolver | None = None) -> None:
+        """
+        Initializes the executor with the branch solver that solves the flipped paths.
+
+        Parameters:
+            _branch_solver (BranchSolver | None): The branch solver. Defaults to a new solver.
+
+        Returns:
+            None
+
+        @category: Business Classes, Analyzer
+        @import: BranchSolver
+        @see: BranchSolver
+        """
+        self.__branch_solver: BranchSolver = _branch_solver or BranchSolver()
+
+    def symbolize(self, _arg_names: list[str], _arg_values: tuple[Any, ...]) -> tuple[Any, ...]:
+        """
+        Returns the symbolic values of the arguments of an input.
+        The int, finite float and str arguments become symbolic, the other arguments are kept.
+
+        Parameters:
+            _arg_names (list[str]): The names of the arguments.
+            _arg_values (tuple[Any, ...]): The argument values of the input.
+
+        Returns:
+            tuple[Any, ...]: The argument values to call the function with.
+        """
+        values: list[Any] = []
+        for name, value in zip(_arg_names, _arg_values):
+            if type(value) is int:
+                value = SymbolicInt(value, {name: 1.0})
+            elif type(value) is float and math.isfinite(value):
+                value = SymbolicFloat(value, {name: 1.0})
+            elif type(value) is str:
+                value = SymbolicStr(value, name)
+            values.append(value)
+        return tuple(values) + tuple(_arg_values[len(values):])
+
+    def compare_ids(self, _predicate: Predicate) -> set[int]:
+        """
+        Returns the compare ids of the leaves of a predicate tree.
+
+        Parameters:
+            _predicate (Predicate): The predicate tree.
+
+        Returns:
+            set[int]: The compare ids.
+        """
+        kind, value = _predicate
+        if kind == "compare":
+            return {value}
+        if kind == "not":
+            return self.compare_ids(value)
+        return {compare_id for predicate in value for compare_id in self.compare_ids(predicate)}
+
+    def expand(
+        self,
+        _arg_types: dict[str, Any],
+        _arg_values: tuple[Any, ...],
+        _path_conditions: list[tuple[int, str, Any, Any, bool]],
+        _flipped: set[tuple[tuple[int, bool], ...]],
+    ) -> list[tuple[int, tuple[Any, ...]]]:
+        """
+        Returns the inputs that flip each comparison of the path of a run that was not flipped yet.
+
+        Parameters:
+            _arg_types (dict[str, Any]): The type of every argument, None if the argument has no type.
+            _arg_values (tuple[Any, ...]): The argument values of the input that ran the path.
+            _path_conditions (list[tuple[int, str, Any, Any, bool]]): The comparisons of the path, see TrialResult.
+            _flipped (set[tuple[tuple[int, bool], ...]]): The outcomes of the path prefixes that were flipped already,
+            the new ones are added.
+
+        Returns:
+            list[tuple[int, tuple[Any, ...]]]: The compare id of every flipped comparison with the input that flips it.
+        """
+        values: dict[str, Any] = dict(zip(_arg_types, _arg_values))
+        steps: list[tuple[int, bool, Constraint | StringConstraint]] = []
+        for compare_id, operator, left, right, outcome in _path_conditions:
+            constraint: Constraint | StringConstraint | None = self.__constraint(
+                operator, left, right, outcome)
+            if constraint is not None:
+                steps.append((compare_id, outcome, constraint))
+
+        inputs: list[tuple[int, tuple[Any, ...]]] = []
+        for index, (compare_id, outcome, constraint) in enumerate(steps):
+            key: tuple[tuple[int, bool], ...] = tuple(
+                (step_id, step_outcome) for step_id, step_outcome, _ in steps[:index]) + ((compare_id, not outcome),)
+            if key in _flipped:
+                continue
+            _flipped.add(key)
+
+            prefix: list[Constraint | StringConstraint] = [step for _, _, step in steps[:index]]
+            solution: dict[str, Any] | None
+            try:
+                if isinstance(constraint[1], dict):
+                    numbers: list[Constraint] = [step for step in prefix if isinstance(step[1], dict)]  # type: ignore
+                    solution = self.__branch_solver.solve_path(
+                        numbers + [self.__branch_solver.negate(constraint)], _arg_types, values)  # type: ignore
+                else:
+                    strings: list[StringConstraint] = [step for step in prefix if isinstance(step[1], str)]  # type: ignore
+                    operator, name, text = constraint  # type: ignore
+                    solution = self.__solve_strings(
+                        strings + [("!=" if operator == "==" else "==", name, text)], values)
+            except (ArithmeticError, ValueError, TypeError):
+                # A flip the solver can not compute is left to the other phases, the other flips of the path go on.
+                continue
+            if solution is not None:
+                inputs.append((compare_id, tuple(solution.get(name, value) for name, value in values.items())))
+
+        return inputs
+
+    def __constraint(self, _operator: str, _left: Any, _right: Any, _outcome: bool) -> Constraint | StringConstraint | None:
+        """
+        Converts a comparison of the path into the constraint that held in the run.
+
+        Parameters:
+            _operator (str): The name of the ast operator, or "Truth".
+            _left (Any): The left operand, or the value of the leaf.
+            _right (Any): The right operand.
+            _outcome (bool): The outcome of the comparison.
+
+        Returns:
+            Constraint | StringConstraint | None: The constraint, None if the comparison can not be modelled.
+        """
+        if _operator == "Truth":
+            _operator, _right = "NotEq", ("" if isinstance(_left, str) else 0)
+
+        if isinstance(_left, str) or isinstance(_right, str):
+            if _operator not in ("Eq", "NotEq"):
+                return None
+            symbolic, text = (_left, _right) if isinstance(_left, SymbolicValue) else (_right, _left)
+            if isinstance(symbolic, SymbolicStr) and type(text) is str:
+                name: str = symbolic.name
+            elif isinstance(symbolic, SymbolicValue) and type(text) is str and len(symbolic.coefficients) == 1 \
+                    and not symbolic.constant and list(symbolic.coefficients.values()) == [1.0]:
+                # An argument without a type that got a number is compared with a string, the flip gives it the string.
+                name = next(iter(symbolic.coefficients))
+            else:
+                return None
+            return "==" if (_operator == "Eq") == _outcome else "!=", name, text
+
+        left = SymbolicValue.linear(_left)
+        right = SymbolicValue.linear(_right)
+        if left is None or right is None:
+            return None
+        coefficients: dict[str, float] = dict(left[0])
+        for name, value in right[0].items():
+            coefficients[name] = coefficients.get(name, 0.0) - value
+        coefficients = {name: value for name, value in coefficients.items() if value}
+        if not coefficients:
+            return None
+        # A runtime operand such as float("inf") or NaN gives no bound the solver can work with.
+        if not all(math.isfinite(value) for value in (left[1], right[1], *coefficients.values())):
+            return None
+
+        constraint: Constraint = (self.__operators[_operator], coefficients, left[1] - right[1])
+        return constraint if _outcome else self.__branch_solver.negate(constraint)
+
+    def __solve_strings(self, _constraints: list[StringConstraint], _values: dict[str, Any]) -> dict[str, Any] | None:
+        """
+        Computes the values of the string arguments that satisfy the string constraints.
+        An argument that must equal a string takes it, an argument that must differ from its value gets a letter appended.
+
+        Parameters:
+            _constraints (list[StringConstraint]): The string constraints, the last one negated.
+            _values (dict[str, Any]): The argument values of the input that ran the path.
+
+        Returns:
+            dict[str, Any] | None: The new value of the changed argument, None if the constraints contradict each other.
+        """
+        name: str = _constraints[-1][1]
+        equal: set[str] = {text for operator, other, text in _constraints if other == name and operator == "=="}
+        different: set[str] = {text for operator, other, text in _constraints if other == name and operator == "!="}
+        if len(equal) > 1 or equal & different:
+            return None
+        if equal:
+            return {name: equal.pop()}
+
+        value: Any = _values.get(name, "")
+        if not isinstance(value, str):
+            return {name: value}
+        while value in different:
+            value += random.choice(string.ascii_letters)
+        return {name: value}
@@ -0,0 +1,154 @@
+"""
+This class mines the literals of the conditions of a function from its ast to seed the input generator.
+"""
+import ast
+import math
+from typing import Any, Iterable
+from entity.minedConstants import MinedConstants
+
+
+class ConstantMiner(ast.NodeVisitor):
+    """
+    This class mines the literals of the conditions of a function from its ast to seed the input generator.
+    Here's what each class method does:
+
+    - mine: Parses the code and returns the numbers, strings and lengths found in its conditions.
+    - merge: Adds the operands observed at run time to the observed constants of a function.
+    - visit_Compare: Collects the literals of a comparison, the literals compared with len() are collected as lengths.
+    - visit_Call: Collects the literal arguments of range() calls.
+    - __literal: Returns the value of a literal node, negative numbers included.
+    - __add: Adds a literal to the mined values.
+
+    Every mined number is kept with its neighbours, n - 1 and n + 1, so both sides of a boundary are sampled.
+    The literals of an `in` test against a list, tuple, set or string are collected one by one.
+    The observed operands are kept the same way, and only the latest ones are kept when there are too many.
+
+    @category: Business Classes, Analyzer
+    @import: MinedConstants
+    @see: MinedConstants
+    """
+
+    def mine(self, _code_str: str) -> MinedConstants:
+        """
+        Parses the code and returns the numbers, strings and lengths found in its conditions.
+
+        Parameters:
+            _code_str (str): The code of the function.
+
+        Returns:
+            MinedConstants: The mined literals, empty if the code can not be parsed.
+        """
+        self.__numbers: dict[int | float, None] = {}
+        self.__strings: dict[str, None] = {}
+        self.__lengths: dict[int, None] = {}
+        try:
+            self.visit(ast.parse(_code_str))
+        except SyntaxError:
+            pass
+        return MinedConstants(list(self.__numbers), list(self.__strings), list(self.__lengths))
+
+    def merge(self, _constants: MinedConstants, _values: Iterable[Any], _limit: int = 256) -> MinedConstants:
+        """
+        Adds the operands observed at run time to the observed constants of a function.
+
+        Parameters:
+            _constants (MinedConstants): The observed constants so far.
+            _values (Iterable[Any]): The observed numbers and strings, infinite and nan floats are skipped.
+            _limit (int): The number of numbers and of strings that are kept, the oldest are dropped first. Defaults to 256.
+
+        Returns:
+            MinedConstants: The observed constants with the new operands.
+        """
+        self.__numbers = dict.fromkeys(_constants.numbers)
+        self.__strings = dict.fromkeys(_constants.strings)
+        self.__lengths = dict.fromkeys(_constants.lengths)
+        for value in _values:
+            self.__add(value, False)
+        return MinedConstants(
+            list(self.__numbers)[-_limit:], list(self.__strings)[-_limit:], list(self.__lengths)[-_limit:])
+
+    def visit_Compare(self, node: ast.Compare) -> None:
+        """
+        Collects the literals of a comparison, the literals compared with len() are collected as lengths.
+
+        Parameters:
+            node (ast.Compare): The comparison node.
+
+        Returns:
+            None
+        """
+        operands: list[ast.expr] = [node.left, *node.comparators]
+        is_length: bool = any(
+            isinstance(operand, ast.Call)
+            and isinstance(operand.func, ast.Name)
+            and operand.func.id == "len"
+            for operand in operands
+        )
+
+        for operand in operands:
+            if isinstance(operand, (ast.List, ast.Tuple, ast.Set)):
+                for element in operand.elts:
+                    self.__add(self.__literal(element), is_length)
+                continue
+
+            value: Any = self.__literal(operand)
+            self.__add(value, is_length)
+            if isinstance(value, str) and len(value) > 1 and any(isinstance(op, (ast.In, ast.NotIn)) for op in node.ops):
+                for char in value:
+                    self.__add(char, False)
+
+        self.generic_visit(node)
+
+    def visit_Call(self, node: ast.Call) -> None:
+        """
+        Collects the literal arguments of range() calls.
+
+        Parameters:
+            node (ast.Call): The call node.
+
+        Returns:
+            None
+        """
+        if isinstance(node.func, ast.Name) and node.func.id == "range":
+            for arg in node.args:
+                self.__add(self.__literal(arg), False)
+
+        self.generic_visit(node)
+
+    def __literal(self, _node: ast.expr) -> Any:
+        """
+        Returns the value of a literal node, negative numbers included.
+
+        Parameters:
+            _node (ast.expr): The node.
+
+        Returns:
+            Any: The value of the literal, None if the node is not a number or string literal.
+        """
+        if isinstance(_node, ast.UnaryOp) and isinstance(_node.op, ast.USub):
+            value: Any = self.__literal(_node.operand)
+            return -value if isinstance(value, (int, float)) else None
+
+        if isinstance(_node, ast.Constant) and isinstance(_node.value, (int, float, str)) and not isinstance(_node.value, bool):
+            return _node.value
+
+        return None
+
+    def __add(self, _value: Any, _is_length: bool) -> None:
+        """
+        Adds a literal to the mined values, a number is added with its neighbours.
+
+        Parameters:
+            _value (Any): The literal, None and the infinite and nan floats are skipped.
+            _is_length (bool): True if the literal is compared with len().
+
+        Returns:
+            None
+        """
+        if isinstance(_value, str):
+            self.__strings[_value] = None
+        elif isinstance(_value, int) or (isinstance(_value, float) and math.isfinite(_value)):
+            for neighbour in (_value - 1, _value, _value + 1):
+                if _is_length and isinstance(neighbour, int) and neighbour >= 0:
+                    self.__lengths[neighbour] = None
+                self.__numbers[neighbour] = None
@@ -0,0 +1,242 @@
+"""
+This class builds the control flow graph of a function from its ast, with the branch edges keyed by the branch probes of the instrumented code.
+"""
+import ast
+from entity.controlFlowGraph import ControlFlowGraph, EXIT_BLOCK
+
+# The edges that leave the statements visited so far: (source block, branch probe id or None for a plain edge).
+Pending = list[tuple[int, int | None]]
+# The loop a statement is in: (header block, the edges of its break statements).
+Loop = tuple[int, Pending]
+
+
+class ControlFlowBuilder:
+    """
+    This class builds the control flow graph of a function from its ast, with the branch edges keyed by the branch probes of the instrumented code.
+    Here's what each class method does:
+
+    - __init__: Initializes a new instance of the class with an empty graph.
+    - build: Builds the control flow graph of the given source code.
+    - __visit_body: Adds the statements of a body to the graph and returns the edges that leave it.
+    - __visit_statement: Adds a statement to the graph and returns the edges that leave it.
+    - __block: Returns the block a statement is added to, a new block unless the statement follows the last block alone.
+    - __connect: Adds the edges that leave the visited statements to a target block.
+    - __probe: Returns the branch probe id of a (decision line, target line) pair.
+
+    The graph is walked like the code instrumenter walks the code, see CodeInstrumenter, so every branch target it gets a probe
+    for is a branch edge of the graph with the same (decision line, target line) pair. A loop header always starts a block,
+    the edges from the end of its body and from `continue` are its back edges. `return` and `raise` go to the exit block,
+    `break` goes to the statement after the loop. An exception handler is entered from the first block of its `try`.
+    The body of a nested def or class is a region of its own, entered from nowhere in the graph of the enclosing code.
+
+    @category: Business Classes, Analyzer
+    @import: ControlFlowGraph, EXIT_BLOCK
+    @see: ControlFlowGraph, CodeInstrumenter
+    """
+
+    def __init__(self) -> None:
+        """
+        Initializes a new instance of the class.
+
+        Parameters:
+            None
+
+        Returns:
+            None
+
+        @category: Business Classes, Analyzer
+        """
+        self.__blocks: list[list[int]] = []
+        self.__successors: list[list[int]] = []
+        self.__branch_edges: dict[int, tuple[int, int]] = {}
+        self.__back_edges: list[tuple[int, int]] = []
+        self.__closed: set[int] = set()
+        self.__probes: dict[tuple[int, int], int] = {}
+
+    def build(self, _code_str: str, _branch_map: dict[int, tuple[int, int]]) -> ControlFlowGraph:
+        """
+        Builds the control flow graph of the given source code.
+
+        Parameters:
+            _code_str (str): The source code.
+            _branch_map (dict[int, tuple[int, int]]): The (decision line, target line) pair of every branch probe, see InstrumentedCode.
+
+        Returns:
+            ControlFlowGraph: The control flow graph, empty if the code can not be parsed.
+        """
+        self.__blocks = []
+        self.__successors = []
+        self.__branch_edges = {}
+        self.__back_edges = []
+        self.__closed = set()
+        self.__probes = {pair: probe for probe, pair in _branch_map.items()}
+
+        try:
+            tree: ast.Module = ast.parse(_code_str)
+        except SyntaxError:
+            return ControlFlowGraph([], [], {}, [])
+
+        self.__connect(self.__visit_body(tree.body, [], 0, None), EXIT_BLOCK)
+        return ControlFlowGraph(
+            [(first, last) for first, last in self.__blocks],
+            [tuple(successors) for successors in self.__successors],
+            self.__branch_edges,
+            self.__back_edges,
+            {probe: pair for pair, probe in self.__probes.items() if probe in self.__branch_edges},
+        )
+
+    def __visit_body(self, _body: list[ast.stmt], _pending: Pending, _next_line: int, _loop: Loop | None) -> Pending:
+        """
+        Adds the statements of a body to the graph and returns the edges that leave it.
+
+        Parameters:
+            _body (list[ast.stmt]): The statements.
+            _pending (Pending): The edges that enter the body.
+            _next_line (int): The line number that runs after the body, 0 if the body ends the function.
+            _loop (Loop | None): The innermost loop the body is in.
+
+        Returns:
+            Pending: The edges that leave the body to the statement after it.
+        """
+        for index, statement in enumerate(_body):
+            next_line: int = _body[index + 1].lineno if index + 1 < len(_body) else _next_line
+            _pending = self.__visit_statement(statement, _pending, next_line, _loop)
+        return _pending
+
+    def __visit_statement(self, _statement: ast.stmt, _pending: Pending, _next_line: int, _loop: Loop | None) -> Pending:
+        """
+        Adds a statement to the graph and returns the edges that leave it.
+
+        Parameters:
+            _statement (ast.stmt): The statement.
+            _pending (Pending): The edges that enter the statement.
+            _next_line (int): The line number that runs after the statement, 0 if the statement ends the function.
+            _loop (Loop | None): The innermost loop the statement is in.
+
+        Returns:
+            Pending: The edges that leave the statement to the statement after it.
+        """
+        line: int = _statement.lineno
+        block: int
+
+        if isinstance(_statement, ast.If):
+            block = self.__block(line, _statement.test.end_lineno or line, _pending)
+            exits: Pending = self.__visit_body(
+                _statement.body, [(block, self.__probe(line, _statement.body[0].lineno))], _next_line, _loop)
+            target_line: int = _statement.orelse[0].lineno if _statement.orelse else _next_line
+            orelse: Pending = [(block, self.__probe(line, target_line))]
+            return exits + self.__visit_body(_statement.orelse, orelse, _next_line, _loop)
+
+        if isinstance(_statement, (ast.For, ast.AsyncFor, ast.While)):
+            header_end: ast.expr = _statement.test if isinstance(_statement, ast.While) else _statement.iter
+            header: int = self.__block(line, header_end.end_lineno or line, _pending, False)
+            breaks: Pending = []
+            body_exits: Pending = self.__visit_body(
+                _statement.body, [(header, self.__probe(line, _statement.body[0].lineno))], line, (header, breaks))
+            self.__connect(body_exits, header)
+            self.__back_edges += [(source, header) for source, _ in body_exits]
+
+            if isinstance(_statement, ast.While) and isinstance(_statement.test, ast.Constant) and _statement.test.value:
+                return breaks
+            target_line = _statement.orelse[0].lineno if _statement.orelse else _next_line
+            exits = self.__visit_body(_statement.orelse, [(header, self.__probe(line, target_line))], _next_line, _loop)
+            return exits + breaks
+
+        if isinstance(_statement, (ast.Try, getattr(ast, "TryStar", ast.Try))):
+            block = self.__block(line, line, _pending)
+            exits = self.__visit_body(_statement.body, [(block, None)], _next_line, _loop)
+            exits = self.__visit_body(_statement.orelse, exits, _next_line, _loop)
+            for handler in _statement.handlers:
+                exits += self.__visit_body(
+                    handler.body, [(block, self.__probe(line, handler.body[0].lineno))], _next_line, _loop)
+            return self.__visit_body(_statement.finalbody, exits, _next_line, _loop)
+
+        if isinstance(_statement, ast.Match):
+            block = self.__block(line, _statement.subject.end_lineno or line, _pending)
+            exits = []
+            for case in _statement.cases:
+                exits += self.__visit_body(case.body, [(block, self.__probe(line, case.body[0].lineno))], _next_line, _loop)
+            last_case: ast.match_case = _statement.cases[-1]
+            if not (isinstance(last_case.pattern, ast.MatchAs) and last_case.pattern.pattern is None and last_case.guard is None):
+                exits.append((block, self.__probe(line, _next_line)))
+            return exits
+
+        if isinstance(_statement, (ast.FunctionDef, ast.AsyncFunctionDef)):
+            block = self.__block(line, line, _pending)
+            self.__connect(self.__visit_body(_statement.body, [], 0, None), EXIT_BLOCK)
+            return [(block, None)]
+
+        if isinstance(_statement, (ast.ClassDef, ast.With, ast.AsyncWith)):
+            block = self.__block(line, line, _pending)
+            return self.__visit_body(_statement.body, [(block, None)], _next_line, _loop)
+
+        block = self.__block(line, _statement.end_lineno or line, _pending)
+        if isinstance(_statement, (ast.Return, ast.Raise)):
+            self.__closed.add(block)
+            self.__connect([(block, None)], EXIT_BLOCK)
+            return []
+        if isinstance(_statement, ast.Break) and _loop is not None:
+            self.__closed.add(block)
+            _loop[1].append((block, None))
+            return []
+        if isinstance(_statement, ast.Continue) and _loop is not None:
+            self.__closed.add(block)
+            self.__connect([(block, None)], _loop[0])
+            self.__back_edges.append((block, _loop[0]))
+            return []
+        return [(block, None)]
+
+    def __block(self, _line: int, _end_line: int, _pending: Pending, _join: bool = True) -> int:
+        """
+        Returns the block a statement is added to, a new block unless the statement follows the last block alone.
+
+        Parameters:
+            _line (int): The first line of the statement.
+            _end_line (int): The last line of the statement, or of the header of a compound statement.
+            _pending (Pending): The edges that enter the statement.
+            _join (bool): Whether the statement may be added to the last block. Defaults to True.
+
+        Returns:
+            int: The block id.
+        """
+        if _join and len(_pending) == 1:
+            block, probe = _pending[0]
+            if probe is None and block == len(self.__blocks) - 1 and block not in self.__closed and not self.__successors[block]:
+                self.__blocks[block][1] = max(self.__blocks[block][1], _end_line)
+                return block
+
+        block = len(self.__blocks)
+        self.__blocks.append([_line, _end_line])
+        self.__successors.append([])
+        self.__connect(_pending, block)
+        return block
+
+    def __connect(self, _pending: Pending, _target: int) -> None:
+        """
+        Adds the edges that leave the visited statements to a target block.
+
+        Parameters:
+            _pending (Pending): The edges.
+            _target (int): The target block id, EXIT_BLOCK for the exit of the function.
+
+        Returns:
+            None
+        """
+        for block, probe in _pending:
+            if _target not in self.__successors[block]:
+                self.__successors[block].append(_target)
+            if probe is not None:
+                self.__branch_edges[probe] = (block, _target)
+
+    def __probe(self, _decision_line: int, _target_line: int) -> int | None:
+        """
+        Returns the branch probe id of a (decision line, target line) pair.
+
+        Parameters:
+            _decision_line (int): The line number of the statement that takes the branch.
+            _target_line (int): The line number the branch jumps to, 0 if it leaves the function.
+
+        Returns:
+            int | None: The branch probe id, None if the code instrumenter did not add a probe for the branch.
+        """
+        return self.__probes.get((_decision_line, _target_line))
@@ -0,0 +1,605 @@
+"""
+This class is a coverage tracer that records the executed lines of a compiled function.
+"""
+import sys
+from itertools import compress
+from types import CodeType, FrameType
+from typing import Any, Callable
+from business.codeInstrumenter import CodeInstrumenter
+from business.branchDistance import BranchDistance
+from business.trialBudget import TrialBudget, TrialTimeout
+from entity.function import Function
+from entity.trialResult import TrialResult
+
+
+class CoverageTracer:
+    """
+    This class is the base class of the coverage tracers that record the executed lines of a compiled function.
+    Here's what each class method does:
+
+    - __init__: Initializes a new instance of the class with an empty set of target code objects and executed lines.
+    - create: Creates the coverage tracer with the given backend name.
+    - budget: Gets or sets the time and step budget of a trial.
+    - source: Returns the source code of a function that should be compiled for the tracer.
+    - attach: Prepares the namespace and collects the code objects of the compiled source that the tracer should record.
+    - start: Starts recording the executed lines of a trial.
+    - stop: Stops recording and returns the executed line numbers of the trial.
+    - bitmap: Returns the coverage bitmap of the last trial over the probes of the instrumented code.
+    - run_batch: Calls a function with every argument tuple of a batch and returns the coverage of each call.
+
+    The line numbers are the 1-based line numbers of the compiled source, so they are also indexes of Function.code_lines starting at 1.
+    Every trial runs within the budget of the tracer, a trial that uses it up is stopped and its result is marked as timed out.
+
+    @category: Business Classes, Tracer
+    @import: CodeInstrumenter, BranchDistance, TrialBudget, TrialTimeout, Function, TrialResult
+    @see: CodeInstrumenter, BranchDistance, TrialBudget, Function, TrialResult
+    """
+
+    def __init__(self) -> None:
+        """
+        Initializes a new instance of the class.
+
+        Parameters:
+            None
+
+        Returns:
+            None
+
+        @category: Business Classes, Tracer
+        """
+        self._codes: set[CodeType] = set()
+        self._lines: set[int] = set()
+        self._source_map: list[int] = []
+        self._branch_map: dict[int, tuple[int, int]] = {}
+        self._budget: TrialBudget = TrialBudget()
+
+    @staticmethod
+    def create(_backend: str = "auto") -> "CoverageTracer":
+        """
+        Create a coverage tracer for the given backend.
+        The "probe" backend reads the integer probes of the instrumented code.
+        The "auto" backend uses sys.monitoring (PEP 669) on Python 3.12+ and falls back to sys.settrace on older versions,
+        both of them record the executed lines without changing the user's code.
+
+        Parameters:
+            _backend (str): The backend name, one of "probe", "auto", "monitoring" and "settrace".
+
+        Returns:
+            CoverageTracer: The coverage tracer.
+
+        Raises:
+            ValueError: If the backend name is unknown or the backend is not supported by the running Python version.
+        """
+        if _backend == "auto":
+            _backend = "monitoring" if hasattr(
+                sys, "monitoring") else "settrace"
+
+        if _backend == "monitoring":
+            if not hasattr(sys, "monitoring"):
+                raise ValueError(
+                    "The 'monitoring' coverage backend requires Python 3.12 or newer.")
+            return MonitoringCoverageTracer()
+        if _backend == "settrace":
+            return SettraceCoverageTracer()
+        if _backend == "probe":
+            return ProbeCoverageTracer()
+
+        raise ValueError(f"Unknown coverage backend: '{_backend}'")
+
+    @property
+    def budget(self) -> TrialBudget:
+        """
+        Returns the time and step budget of a trial.
+
+        Returns:
+            TrialBudget: The budget.
+        """
+        return self._budget
+
+    @budget.setter
+    def budget(self, _budget: TrialBudget) -> None:
+        """
+        Sets the time and step budget of a trial, before the tracer is attached.
+
+        Parameters:
+            _budget (TrialBudget): The budget.
+
+        Returns:
+            None
+        """
+        self._budget = _budget
+
+    def source(self, _function: Function) -> str:
+        """
+        Return the source code of the given function that should be compiled for the tracer.
+        The tracers record the user's code as it is, so this is the fixed source code of the function.
+
+        Parameters:
+            _function (Function): The function to compile.
+
+        Returns:
+            str: The source code to compile.
+        """
+        return "\n".join(_function.code_lines)
+
+    def attach(self, _function: Function, _module_code: CodeType, _namespace: dict[str, Any]) -> None:
+        """
+        Collect the code objects defined in the compiled module code as the targets of the tracer.
+        The module code itself is not a target since it is executed only once.
+        This is called before the module code is executed in the namespace.
+
+        Parameters:
+            _function (Function): The compiled function.
+            _module_code (CodeType): The compiled module code.
+            _namespace (dict[str, Any]): The namespace the module code will be executed in.
+
+        Returns:
+            None
+        """
+        self._source_map = _function.instrumented_code.source_map
+        self._branch_map = _function.instrumented_code.branch_map
+
+        codes: list[CodeType] = [_module_code]
+        while codes:
+            code: CodeType = codes.pop()
+            for const in code.co_consts:
+                if isinstance(const, CodeType):
+                    self._codes.add(const)
+                    codes.append(const)
+
+    def start(self) -> None:
+        """
+        Start recording the executed lines of a trial.
+
+        Parameters:
+            None
+
+        Returns:
+            None
+        """
+        raise NotImplementedError
+
+    def stop(self) -> set[int]:
+        """
+        Stop recording and return the executed line numbers of the trial.
+
+        Parameters:
+            None
+
+        Returns:
+            set[int]: The executed line numbers.
+        """
+        raise NotImplementedError
+
+    def bitmap(self) -> bytes:
+        """
+        Return the coverage bitmap of the last trial over the probes of the instrumented code.
+        The tracers only see lines, so a statement probe is reached when its line was executed and a branch probe
+        is reached when both its decision line and its target line were executed. A branch that leaves the function
+        is reached when its decision line was executed but none of the other targets of that decision.
+
+        Parameters:
+            None
+
+        Returns:
+            bytes: The coverage bitmap, one byte per probe.
+        """
+        lines: set[int] = self._lines
+        bitmap: bytearray = bytearray(
+            line in lines for line in self._source_map)
+
+        for probe_id, (decision_line, target_line) in self._branch_map.items():
+            if target_line:
+                bitmap[probe_id] = decision_line in lines and target_line in lines
+            else:
+                bitmap[probe_id] = decision_line in lines and not any(
+                    line in lines
+                    for branch_id, (decision, line) in self._branch_map.items()
+                    if decision == decision_line and branch_id != probe_id and line
+                )
+        return bytes(bitmap)
+
+    def run_batch(self, _target: Callable[..., Any], _batch: list[tuple[Any, ...]], _branch_distances: bool = False) -> list[TrialResult]:
+        """
+        Call the target with every argument tuple of the batch and return the coverage of each call.
+        An exception raised by a call is kept in its result instead of stopping the batch.
+        The tracers that only see lines do not record the comparisons.
+
+        Parameters:
+            _target (Callable[..., Any]): The compiled function.
+            _batch (list[tuple[Any, ...]]): The argument tuples.
+            _branch_distances (bool): Whether the branch distances and the operands of the comparisons are recorded. Defaults to False.
+
+        Returns:
+            list[TrialResult]: The coverage of every call, in the order of the batch.
+        """
+        budget: TrialBudget = self._budget
+        results: list[TrialResult] = []
+        for arg_values in _batch:
+            error: Exception | None = None
+            timed_out: bool = False
+            self.start()
+            budget.start()
+            try:
+                _target(*arg_values)
+            except Exception as exception:
+                error = exception
+            except TrialTimeout:
+                timed_out = True
+            finally:
+                executed_lines: set[int] = self.stop()
+            results.append(TrialResult(
+                executed_lines, self.bitmap(), error, _timed_out=timed_out))
+        return results
+
+
+class SettraceCoverageTracer(CoverageTracer):
+    """
+    This class is a coverage tracer that records the executed lines with sys.settrace.
+    Only the frames of the target code objects get a local trace function, so other code runs untraced.
+    Every traced line is a step of the trial budget.
+
+    - start: Installs the global trace function and keeps the previous one.
+    - stop: Restores the previous trace function and returns the executed lines.
+
+    @category: Business Classes, Tracer
+    """
+
+    def __init__(self) -> None:
+        """
+        Initializes a new instance of the class.
+
+        Parameters:
+            None
+
+        Returns:
+            None
+
+        @category: Business Classes, Tracer
+        """
+        super().__init__()
+        self.__previous_trace: Callable[..., Any] | None = None
+
+    def __global_trace(self, _frame: FrameType, _event: str, _arg: Any) -> Callable[..., Any] | None:
+        """
+        Return the local trace function for the frames of the target code objects.
+
+        Parameters:
+            _frame (FrameType): The frame of the called code.
+            _event (str): The trace event.
+            _arg (Any): The event argument.
+
+        Returns:
+            Callable[..., Any] | None: The local trace function, or None if the frame is not traced.
+        """
+        if _frame.f_code in self._codes:
+            return self.__local_trace
+        return None
+
+    def __local_trace(self, _frame: FrameType, _event: str, _arg: Any) -> Callable[..., Any]:
+        """
+        Record the line number of every line event and count it as a step of the trial budget.
+
+        Parameters:
+            _frame (FrameType): The traced frame.
+            _event (str): The trace event.
+            _arg (Any): The event argument.
+
+        Returns:
+            Callable[..., Any]: The local trace function itself.
+        """
+        if _event == "line":
+            self._lines.add(_frame.f_lineno)
+            self._budget.step()
+        return self.__local_trace
+
+    def start(self) -> None:
+        """
+        Install the global trace function and keep the previous one.
+
+        Parameters:
+            None
+
+        Returns:
+            None
+        """
+        self._lines = set()
+        self.__previous_trace = sys.gettrace()
+        sys.settrace(self.__global_trace)
+
+    def stop(self) -> set[int]:
+        """
+        Restore the previous trace function and return the executed lines.
+
+        Parameters:
+            None
+
+        Returns:
+            set[int]: The executed line numbers.
+        """
+        sys.settrace(self.__previous_trace)
+        return self._lines
+
+
+class MonitoringCoverageTracer(CoverageTracer):
+    """
+    This class is a coverage tracer that records the executed lines with sys.monitoring (PEP 669).
+    LINE events are enabled only on the target code objects and every line is disabled after its first event,
+    so a line costs one callback per trial at most. The JUMP events, the backward jumps of the loops, are the steps of the trial budget.
+
+    - __claim_tool_id: Claims a free sys.monitoring tool id for the process.
+    - __jump: Counts a jump as a step of the trial budget.
+    - start: Registers the callbacks, enables the LINE and JUMP events of the targets and restarts the disabled events.
+    - stop: Disables the LINE and JUMP events of the targets and returns the executed lines.
+
+    @category: Business Classes, Tracer
+    """
+
+    __tool_id: int | None = None
+
+    @classmethod
+    def __claim_tool_id(cls) -> int:
+        """
+        Claim a free sys.monitoring tool id once for the process.
+
+        Parameters:
+            None
+
+        Returns:
+            int: The claimed tool id.
+
+        Raises:
+            ValueError: If all tool ids are in use.
+        """
+        if cls.__tool_id is None:
+            monitoring: Any = getattr(sys, "monitoring")
+            for tool_id in [monitoring.COVERAGE_ID, *range(6)]:
+                if monitoring.get_tool(tool_id) is None:
+                    monitoring.use_tool_id(tool_id, "auto_test_tool")
+                    cls.__tool_id = tool_id
+                    break
+            else:
+                raise ValueError("All sys.monitoring tool ids are in use.")
+        return cls.__tool_id
+
+    def __line(self, _code: CodeType, _line_number: int) -> Any:
+        """
+        Record the line number of a LINE event and disable the event for the rest of the trial.
+
+        Parameters:
+            _code (CodeType): The code object of the executed line.
+            _line_number (int): The executed line number.
+
+        Returns:
+            Any: sys.monitoring.DISABLE
+        """
+        self._lines.add(_line_number)
+        return getattr(sys, "monitoring").DISABLE
+
+    def __jump(self, _code: CodeType, _instruction_offset: int, _destination_offset: int) -> Any:
+        """
+        Count a JUMP event as a step of the trial budget.
+
+        Parameters:
+            _code (CodeType): The code object of the jump.
+            _instruction_offset (int): The offset of the jump instruction.
+            _destination_offset (int): The offset the jump goes to.
+
+        Returns:
+            Any: None, the event stays enabled.
+        """
+        self._budget.step()
+
+    def start(self) -> None:
+        """
+        Register the callbacks, enable the LINE and JUMP events of the targets and restart the disabled events.
+
+        Parameters:
+            None
+
+        Returns:
+            None
+        """
+        monitoring: Any = getattr(sys, "monitoring")
+        tool_id: int = self.__claim_tool_id()
+
+        self._lines = set()
+        monitoring.register_callback(
+            tool_id, monitoring.events.LINE, self.__line)
+        monitoring.register_callback(
+            tool_id, monitoring.events.JUMP, self.__jump)
+        for code in self._codes:
+            monitoring.set_local_events(
+                tool_id, code, monitoring.events.LINE | monitoring.events.JUMP)
+        monitoring.restart_events()
+
+    def stop(self) -> set[int]:
+        """
+        Disable the LINE and JUMP events of the targets and return the executed lines.
+
+        Parameters:
+            None
+
+        Returns:
+            set[int]: The executed line numbers.
+        """
+        monitoring: Any = getattr(sys, "monitoring")
+        tool_id: int = self.__claim_tool_id()
+
+        for code in self._codes:
+            monitoring.set_local_events(
+                tool_id, code, monitoring.events.NO_EVENTS)
+        monitoring.register_callback(tool_id, monitoring.events.LINE, None)
+        monitoring.register_callback(tool_id, monitoring.events.JUMP, None)
+        return self._lines
+
+
+class ProbeCoverageTracer(CoverageTracer):
+    """
+    This class is a coverage tracer that reads the integer probes of the instrumented code of a function.
+    The probes write to a bytearray in the namespace, which is cleared before every trial and mapped to
+    line numbers with the source map of the instrumented code after it.
+    The instrumented conditions call the comparison recorder in the namespace when a batch asks for the branch distances.
+
+    - source: Returns the instrumented source code of the function.
+    - attach: Puts the probe array, the comparison recorder and the step counter of the budget into the namespace.
+    - start: Clears the probe array.
+    - stop: Returns the line numbers of the probes that were reached.
+    - bitmap: Returns a copy of the probe array.
+    - run_batch: Calls a function with every argument tuple of a batch in a loop that only clears and copies the probe array,
+    and turns the comparison recorder on for the batch if the branch distances are asked for.
+
+    @category: Business Classes, Tracer
+    """
+
+    def __init__(self) -> None:
+        """
+        Initializes a new instance of the class.
+
+        Parameters:
+            None
+
+        Returns:
+            None
+
+        @category: Business Classes, Tracer
+        """
+        super().__init__()
+        self.__probes: bytearray = bytearray()
+        self.__empty_probes: bytes = b""
+        self.__branch_distance: BranchDistance = BranchDistance()
+        self.__namespace: dict[str, Any] = {}
+        self.__distances_name: str = ""
+
+    @property
+    def probes(self) -> bytearray:
+        """
+        Returns the probe array of the last trial.
+
+        Returns:
+            bytearray: The probe array, a non zero item means the probe with that id was reached.
+        """
+        return self.__probes
+
+    def source(self, _function: Function) -> str:
+        """
+        Return the instrumented source code of the given function.
+
+        Parameters:
+            _function (Function): The function to compile.
+
+        Returns:
+            str: The instrumented source code.
+        """
+        return _function.instrumented_code.source
+
+    def attach(self, _function: Function, _module_code: CodeType, _namespace: dict[str, Any]) -> None:
+        """
+        Put the probe array sized to the probes of the function, the comparison recorder and the step counter of the budget into the namespace.
+
+        Parameters:
+            _function (Function): The compiled function.
+            _module_code (CodeType): The compiled module code.
+            _namespace (dict[str, Any]): The namespace the module code will be executed in.
+
+        Returns:
+            None
+        """
+        self._source_map = _function.instrumented_code.source_map
+        self._branch_map = _function.instrumented_code.branch_map
+        self.__probes = bytearray(len(self._source_map))
+        self.__empty_probes = bytes(len(self._source_map))
+        instrumenter: CodeInstrumenter = CodeInstrumenter()
+        self.__namespace = _namespace
+        self.__distances_name = instrumenter.distances_name
+        _namespace[instrumenter.probe_name] = self.__probes
+        _namespace[instrumenter.compare_name] = self.__branch_distance.compare
+        _namespace[instrumenter.distances_name] = False
+        _namespace[instrumenter.step_name] = self._budget.step
+
+    def start(self) -> None:
+        """
+        Clear the probe array in place and restart the comparison recorder.
+
+        Parameters:
+            None
+
+        Returns:
+            None
+        """
+        self.__probes[:] = self.__empty_probes
+        self.__branch_distance.clear()
+
+    def stop(self) -> set[int]:
+        """
+        Return the line numbers of the probes that were reached.
+
+        Parameters:
+            None
+
+        Returns:
+            set[int]: The executed line numbers.
+        """
+        return set(compress(self._source_map, self.__probes))
+
+    def bitmap(self) -> bytes:
+        """
+        Return a copy of the probe array of the last trial.
+
+        Parameters:
+            None
+
+        Returns:
+            bytes: The coverage bitmap, one byte per probe.
+        """
+        return bytes(self.__probes)
+
+    def run_batch(self, _target: Callable[..., Any], _batch: list[tuple[Any, ...]], _branch_distances: bool = False) -> list[TrialResult]:
+        """
+        Call the target with every argument tuple of the batch and return the coverage of each call.
+        The loop only clears and copies the probe array and restarts the budget around each call, and restarts the comparison recorder
+        when the branch distances are recorded.
+
+        Parameters:
+            _target (Callable[..., Any]): The compiled function.
+            _batch (list[tuple[Any, ...]]): The argument tuples.
+            _branch_distances (bool): Whether the branch distances and the operands of the comparisons are recorded. Defaults to False.
+
+        Returns:
+            list[TrialResult]: The coverage of every call, in the order of the batch.
+        """
+        probes: bytearray = self.__probes
+        empty_probes: bytes = self.__empty_probes
+        source_map: list[int] = self._source_map
+
+        branch_distance: BranchDistance = self.__branch_distance
+        distances: dict[int, tuple[float, float]] | None = None
+        operands: set[Any] | None = None
+        path: list[tuple[int, str, Any, Any, bool]] | None = None
+
+        budget: TrialBudget = self._budget
+        results: list[TrialResult] = []
+        self.__namespace[self.__distances_name] = _branch_distances
+        try:
+            for arg_values in _batch:
+                error: Exception | None = None
+                timed_out: bool = False
+                probes[:] = empty_probes
+                if _branch_distances:
+                    branch_distance.clear()
+                    distances = branch_distance.distances
+                    operands = branch_distance.operands
+                    path = branch_distance.path
+                budget.start()
+                try:
+                    _target(*arg_values)
+                except Exception as exception:
+                    error = exception
+                except TrialTimeout:
+                    timed_out = True
+                bitmap: bytes = bytes(probes)
+                results.append(TrialResult(
+                    set(compress(source_map, bitmap)), bitmap, error, distances, operands, path, timed_out))
+        finally:
+            self.__namespace[self.__distances_name] = False
+        return results
@@ -8,7 +8,6 @@ from PyQt5.QtGui import (
 )
 
 from core.showMessageBox import ShowMessageBox
-from business.codeAnalyzer import CodeAnalyzer
 
 
 class ExceptionManager:
@@ -23,11 +22,10 @@ class ExceptionManager:
             None
 
         @category: Business, Manager
-        @import: CodeAnalyzer, ShowMessageBox
-        @see: CodeAnalyzer, ShowMessageBox
+        @import: ShowMessageBox
+        @see: ShowMessageBox
         """
         self._smb = ShowMessageBox()
-        self._last_code_line = CodeAnalyzer().last_code_line
 
     # ----->> SYNTAX ERROR
     def handle_syntax_error(
@@ -51,9 +49,6 @@ class ExceptionManager:
         """
         wrong_code: str = str(_exception.text).replace("\n", "")
 
-        if self._last_code_line in wrong_code:
-            wrong_code = wrong_code.split("'")[1].replace("'", "")
-
         self.syntax_error(_exception, _function_code_lines)
         error_line_number: int = _function_code_lines.index(wrong_code)
         _lw_fixed_code.setCurrentRow(error_line_number)
@@ -74,8 +69,6 @@ class ExceptionManager:
         - None
         """
         wrong_code: str = str(_error.text).replace("\n", "")
-        if "_lcl_" in wrong_code:
-            wrong_code = wrong_code.split("'")[1].replace("'", "")
         error_line_number: int = _code_lines.index(wrong_code) + 1
 
         if " (" in _error.msg:
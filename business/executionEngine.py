@@ -0,0 +1,192 @@
+"""
+This class is an execution engine that compiles the code of a function once and calls it directly on every trial.
+"""
+import contextlib
+import os
+from types import CodeType
+from typing import Any, TextIO
+from business.coverageTracer import CoverageTracer
+from business.namespaceTemplate import NamespaceTemplate
+from business.trialBudget import TrialBudget, TrialTimeout
+from entity.compiledFunction import CompiledFunction
+from entity.function import Function
+from entity.trialResult import TrialResult
+
+
+class ExecutionEngine:
+    """
+    This class is an execution engine that compiles the code of a function once and calls it directly on every trial.
+    Here's what each class method does:
+
+    - __init__: Initializes a new instance of the class with the name of the coverage backend, the budget of a trial and the prelude mode.
+    - coverage_backend: Gets the name of the coverage backend.
+    - reuse_prelude: Gets whether the prelude of a module is executed once into a template namespace.
+    - compile: Executes the code of a function once and keeps the resulting function object and its coverage tracer on the Function.
+    - execute: Calls the compiled function with the given argument values and returns the coverage of the trial.
+    - execute_batch: Calls the compiled function with every argument tuple of a batch and returns the coverage of each trial.
+
+    The executed lines are recorded by a pluggable coverage tracer, the integer probes of the instrumented code by default.
+    Every trial runs within a wall clock timeout and a step budget, so an input that sends a loop into non-termination
+    gives a timed out result instead of hanging the tool.
+    The imports and the module level setup above the function are executed once per module text, every compile starts
+    from a copy of the namespace they built, and the globals a function rebinds are restored before each trial, see NamespaceTemplate.
+    What the tested code prints goes to the null device, so it does not mix with the output of the tool, a JSON report for example.
+
+    @category: Business Classes, Manager
+    @import: CoverageTracer, NamespaceTemplate, TrialBudget, TrialTimeout, CompiledFunction, Function, TrialResult
+    @see: CoverageTracer, NamespaceTemplate, TrialBudget, CompiledFunction, Function, TrialResult
+    """
+
+    # The stdout of the tested code, shared by the engines of the process.
+    __null_output: TextIO = open(os.devnull, "w", encoding="utf-8")
+
+    def __init__(
+        self,
+        _coverage_backend: str = "probe",
+        _trial_timeout: float = 1.0,
+        _trial_steps: int = 1_000_000,
+        _reuse_prelude: bool = True,
+    ) -> None:
+        """
+        Initializes a new instance of the class.
+
+        Parameters:
+            _coverage_backend (str): The name of the coverage backend, see CoverageTracer.create. Defaults to "probe".
+            _trial_timeout (float): The wall clock timeout of a trial in seconds, 0 turns it off. Defaults to 1.
+            _trial_steps (int): The step limit of a trial, loop iterations and calls, 0 turns it off. Defaults to 1_000_000.
+            _reuse_prelude (bool): Whether the prelude of a module is executed once into a template namespace,
+            otherwise the whole module is executed into an empty namespace on every compile. Defaults to True.
+
+        Returns:
+            None
+
+        @category: Business Classes, Manager
+        @import: CoverageTracer, CompiledFunction, Function, TrialResult
+        @see: CoverageTracer, CompiledFunction, Function, TrialResult
+        """
+        self.__coverage_backend: str = _coverage_backend
+        self.__trial_timeout: float = _trial_timeout
+        self.__trial_steps: int = _trial_steps
+        self.__reuse_prelude: bool = _reuse_prelude
+        self.__namespace_template: NamespaceTemplate = NamespaceTemplate()
+
+    @property
+    def coverage_backend(self) -> str:
+        """
+        Returns the name of the coverage backend.
+
+        Returns:
+            str: The name of the coverage backend.
+        """
+        return self.__coverage_backend
+
+    @property
+    def reuse_prelude(self) -> bool:
+        """
+        Returns whether the prelude of a module is executed once into a template namespace.
+
+        Returns:
+            bool: True if the compiles share the prelude, False otherwise.
+        """
+        return self.__reuse_prelude
+
+    def compile(self, _function: Function) -> CompiledFunction:
+        """
+        Execute the code of the given function once and keep the resulting function object on it.
+        The user's code is always compiled first, so syntax errors refer to the lines of Function.code_lines,
+        then the source the coverage tracer asks for is compiled and executed.
+        The prelude of the module is taken from the template namespace when the prelude is reused.
+        A function taken from a module runs in the namespace of its module, see Function.module_context.
+
+        Parameters:
+            _function (Function): The function to compile.
+
+        Returns:
+            CompiledFunction: The compiled function.
+        """
+        filename: str = f"<{_function.name}>"
+        plain_source: str = "\n".join(_function.code_lines)
+        module_code: CodeType = compile(plain_source, filename, "exec")
+
+        coverage_tracer: CoverageTracer = CoverageTracer.create(
+            self.__coverage_backend)
+        coverage_tracer.budget = TrialBudget(
+            self.__trial_timeout, self.__trial_steps)
+        source: str = coverage_tracer.source(_function)
+        namespace: dict[str, Any] = {}
+        with contextlib.redirect_stdout(self.__null_output):
+            if self.__reuse_prelude:
+                namespace, module_code = self.__namespace_template.overlay(plain_source, source, filename)
+            elif source != plain_source:
+                module_code = compile(source, filename, "exec")
+
+            if _function.module_context:
+                if self.__reuse_prelude:
+                    namespace = self.__namespace_template.module(_function.module_context, "<module>") | namespace
+                else:
+                    module_namespace: dict[str, Any] = {}
+                    exec(compile(_function.module_context, "<module>", "exec"), module_namespace)
+                    namespace = module_namespace | namespace
+
+            coverage_tracer.attach(_function, module_code, namespace)
+            exec(module_code, namespace)
+
+        target: Any = namespace[_function.name]
+        if self.__reuse_prelude:
+            target = self.__namespace_template.isolate(module_code, namespace, target)
+        compiled_function: CompiledFunction = CompiledFunction(
+            namespace, target, coverage_tracer
+        )
+        _function.compiled_function = compiled_function
+        return compiled_function
+
+    def execute(self, _function: Function, _arg_values: tuple[Any, ...]) -> TrialResult:
+        """
+        Call the compiled function with the given argument values and return the coverage of the trial.
+        The function is compiled on the first call. An exception of the function is raised again, a timeout is kept in the result.
+
+        Parameters:
+            _function (Function): The function to execute.
+            _arg_values (tuple[Any, ...]): The argument values the function is called with.
+
+        Returns:
+            TrialResult: The executed line numbers and the coverage bitmap of the trial.
+        """
+        compiled_function: CompiledFunction | None = _function.compiled_function
+        if compiled_function is None:
+            compiled_function = self.compile(_function)
+
+        coverage_tracer: CoverageTracer = compiled_function.coverage_tracer
+        timed_out: bool = False
+        coverage_tracer.start()
+        coverage_tracer.budget.start()
+        try:
+            with contextlib.redirect_stdout(self.__null_output):
+                compiled_function.target(*_arg_values)
+        except TrialTimeout:
+            timed_out = True
+        finally:
+            executed_lines: set[int] = coverage_tracer.stop()
+        return TrialResult(executed_lines, coverage_tracer.bitmap(), _timed_out=timed_out)
+
+    def execute_batch(self, _function: Function, _batch: list[tuple[Any, ...]], _branch_distances: bool = False) -> list[TrialResult]:
+        """
+        Call the compiled function with every argument tuple of the batch and return the coverage of each trial.
+        The whole batch runs in the driver loop of the coverage tracer, an exception of a trial is kept in its result.
+
+        Parameters:
+            _function (Function): The function to execute.
+            _batch (list[tuple[Any, ...]]): The argument tuples the function is called with.
+            _branch_distances (bool): Whether the branch distances and the operands of the comparisons are recorded,
+            only the probe coverage backend records them. Defaults to False.
+
+        Returns:
+            list[TrialResult]: The coverage of every trial, in the order of the batch.
+        """
+        compiled_function: CompiledFunction | None = _function.compiled_function
+        if compiled_function is None:
+            compiled_function = self.compile(_function)
+
+        coverage_tracer: CoverageTracer = compiled_function.coverage_tracer
+        with contextlib.redirect_stdout(self.__null_output):
+            return coverage_tracer.run_batch(compiled_function.target, _batch, _branch_distances)
@@ -2,11 +2,15 @@
 This class, FunctionManager, is responsible for managing functions and their operations. 
 """
 
+import math
 import random
 import string
+import sys
 from typing import Any
 from business.codeManager import CodeManaager
+from business.valueSampler import ValueSampler
 from entity.function import Function
+from entity.minedConstants import MinedConstants
 
 
 class FunctionManager:
@@ -16,13 +20,18 @@ class FunctionManager:
 
     - __init__(self): Initializes an instance of the class and sets up a CodeManaager object.
     - str_to_function(self, _code_str: str) -> Function: Converts a string representation of a function into a Function object. 
-    It extracts information such as branch count, code lines count, and executable lines.
+    It extracts information such as branch count, code lines count, instrumented code and executable lines.
+    - source_to_function(self, _source_code: str) -> Function: Converts source code into a Function object, code without a function is wrapped into one.
+    - str_to_support_case(self, _value: str, _is_str: bool) -> Any: Converts the text of a support case into its value.
     - __convert_type(self, _type: str) -> type[str] | type[float] | type[int] | None: Converts an input type string to the corresponding Python type.
     - parse_function_args(self, _function: Function) -> dict[str, Any]: Parses the function arguments of a given Function object and returns a dictionary mapping the argument names to their corresponding types.
-    - __create_values_to_arguments(self, _function: Function) -> dict[str, Any]: Generates a dictionary of random values for each argument of a given function.
-    - change_argument_value(self, _function: Function) -> str: Generates a string representation of the arguments for a given function.
-    - remove_function_calls_in_funcexeclines(self, _function: Function) -> None: Removes all function calls in the exec_lines attribute of the given _function.
-    - add_function_call_in_funcexeclines(self, _function: Function, pars: str) -> None: Adds a function call to the exec_lines list of a Function object.
+    - __mined_value(self, _function: Function, _arg_type: type | None, _letters: str) -> list[Any]: Picks a value of the given type from the literals mined from the function
+    or the operands its comparisons compared at run time.
+    - __create_values_to_arguments(self, _function: Function, _edges: tuple[int, int]) -> dict[str, Any]: Generates a dictionary of random values for each argument of a given function,
+    the literals mined from the conditions of the function are used with a high probability.
+    - create_argument_values(self, _function: Function) -> tuple[Any, ...]: Generates random values for the arguments of a given function as a tuple.
+    - create_argument_batch(self, _function: Function, _count: int) -> list[tuple[Any, ...]]: Generates the argument values of many trials at once.
+    - arguments_to_str(self, _arg_values: tuple[Any, ...] | list[Any]) -> str: Converts argument values to their string representation.
 
     @category: Business, Manager
     @import: Function, CodeManaager
@@ -44,6 +53,8 @@ class FunctionManager:
         @see: Function, CodeManaager
         """
         self.__cm = CodeManaager()
+        self.__sampler = ValueSampler()
+        self.__mined_value_rate: float = 0.5
 
     def str_to_function(self, _code_str: str) -> Function:
         """
@@ -59,16 +70,22 @@ class FunctionManager:
         code_lines: list[str] = self.__cm.get_code_lines(code)
 
         func: Function = Function()
-        func.branch_count = self.__cm.get_branched_count(code)
         func.code_lines_count = len(code_lines)
-        func.exec_lines = self.__cm.add_content_to_code(code)
+        func.instrumented_code = self.__cm.instrument_code(code)
+        func.control_flow_graph = self.__cm.build_control_flow_graph(
+            code, func.instrumented_code.branch_map)
+        func.branch_count = func.control_flow_graph.branch_count
+        func.exec_lines = func.instrumented_code.source
+        func.mined_constants = self.__cm.mine_constants(code)
+        func.branch_constraints = self.__cm.parse_branch_constraints(code)
 
         for line in code_lines:
             left_space_count: int = self.__cm.left_space_count(line)
 
             func.add_code_line = line
 
-            if line.startswith(f"{' '*left_space_count}def "):
+            # The first def is the tested function, the defs in its body are its nested helpers.
+            if not func.name and line.startswith(f"{' '*left_space_count}def "):
                 func.name = line.split("def ")[1].split("(")[0]
                 func.arguments = (
                     "(" +
@@ -78,6 +95,47 @@ class FunctionManager:
 
         return func
 
+    def source_to_function(self, _source_code: str) -> Function:
+        """
+        Converts source code into a Function object.
+        Code that does not define a function is indented into the body of a function named "This_Is_The_Way".
+
+        Parameters:
+            _source_code (str): The source code to convert.
+
+        Returns:
+            Function: The Function object representing the converted source code.
+        """
+        if any(line.strip().startswith("def ") and line.strip().endswith(":") for line in _source_code.split("\n")):
+            return self.str_to_function(_source_code)
+
+        func_lines: list[str] = ["def This_Is_The_Way():"] + [" " * 4 +
+                                                              line for line in _source_code.splitlines()]
+        return self.str_to_function("\n".join(func_lines))
+
+    def str_to_support_case(self, _value: str, _is_str: bool) -> Any:
+        """
+        Converts the text of a support case into its value.
+
+        Parameters:
+            _value (str): The text of the support case.
+            _is_str (bool): True if the support case is a string, otherwise it is a number.
+
+        Returns:
+            Any: The support case, a string, an int or a float.
+
+        Raises:
+            ValueError: If the text of a number support case is not a number.
+        """
+        if _is_str:
+            return _value
+
+        if _value.startswith("."):
+            _value = "0" + _value
+        elif _value.endswith("."):
+            _value = _value + "0"
+        return float(_value) if "." in _value else int(_value)
+
     def __convert_type(self, _type: str) -> type[str] | type[float] | type[int] | None:
         """
         Convert the input type string to the corresponding Python type.
@@ -113,12 +171,49 @@ class FunctionManager:
 
         return function_args
 
-    def __create_values_to_arguments(self, _function: Function) -> dict[str, Any]:
+    def __mined_value(self, _function: Function, _arg_type: type | None, _letters: str) -> list[Any]:
+        """
+        Picks a value of the given type from the literals mined from the conditions of the function,
+        or from the operands its comparisons compared at run time, which are picked first half of the time.
+        A string argument also gets a random string with a length mined from a len() check.
+
+        Args:
+            _function (Function): The function the literals were mined from.
+            _arg_type (type | None): The type of the argument, None if the argument has no type.
+            _letters (str): The characters of the random strings.
+
+        Returns:
+            list[Any]: A list with the picked value, empty if no literal or operand of the type was found.
+        """
+        sources: list[MinedConstants] = [
+            _function.observed_constants, _function.mined_constants]
+        if random.random() < 0.5:
+            sources.reverse()
+
+        for mined in sources:
+            candidates: list[Any] = []
+            if _arg_type in (int, None):
+                candidates += [
+                    int(number) for number in mined.numbers if isinstance(number, int) or (math.isfinite(number) and number.is_integer())]
+            if _arg_type in (float, None):
+                # An int beyond the float range, such as 10 ** 400, has no float value.
+                candidates += [
+                    float(number) for number in mined.numbers if -sys.float_info.max <= number <= sys.float_info.max]
+            if _arg_type in (str, None):
+                candidates += mined.strings
+                candidates += ["".join(random.choices(_letters, k=length)) for length in mined.lengths]
+            if candidates:
+                return [random.choice(candidates)]
+
+        return []
+
+    def __create_values_to_arguments(self, _function: Function, _edges: tuple[int, int]) -> dict[str, Any]:
         """
         Generates a dictionary of random values for each argument of a given function.
 
         Args:
             _function (Function): The function for which to generate the values.
+            _edges (tuple[int, int]): The left and the right edges drawn by the value sampler for the trial.
 
         Returns:
             dict[str, Any]: A dictionary mapping each argument name to its randomly generated value.
@@ -131,21 +226,20 @@ class FunctionManager:
         if len(_function.arguments) <= 2:
             return args
 
-        edge_right: int = random.choice(
-            [*range(11)] + [*range(101)] + [*range(1001)] + [*range(10001)]
-        )
-        edge_left: int = random.choice(
-            [*range(0, -10, -1)]
-            + [*range(-10, -101, -1)]
-            + [*range(-100, -1001, -1)]
-            + [*range(-1001, -10001, -1)]
-        )
+        edge_left, edge_right = _edges
 
         while len(args) < len(arguments):
             for arg, arg_type in arguments.items():
                 if arg in args:
                     continue
 
+                if random.random() < self.__mined_value_rate:
+                    mined_value: list[Any] = self.__mined_value(
+                        _function, arg_type, letters)
+                    if mined_value:
+                        args[arg] = mined_value[0]
+                        continue
+
                 if arg_type == int:
                     args[arg] = random.randint(edge_left, edge_right)
                 elif arg_type == float:
@@ -171,45 +265,42 @@ class FunctionManager:
 
         return args
 
-    def change_argument_value(self, _function: Function) -> str:
+    def create_argument_values(self, _function: Function) -> tuple[Any, ...]:
         """
-        Generates a string representation of the arguments for a given function.
+        Generates random values for the arguments of a given function as a tuple the function can be called with.
 
         Args:
             _function (Function): The function object for which the argument values need to be generated.
 
         Returns:
-            str: A string representation of the arguments in the format "(arg1,arg2,arg3,...)".
-
+            tuple[Any, ...]: The argument values in the order of the function arguments.
         """
-        arg_values: dict[str, Any] = self.__create_values_to_arguments(
-            _function)
-        return "(" + ",".join([f'"{val}"' if isinstance(val, str) else str(val) for val in arg_values.values()]) + ")" if arg_values else ""
+        return tuple(self.__create_values_to_arguments(_function, self.__sampler.edges()).values())
 
-    def remove_function_calls_in_funcexeclines(self, _function: Function) -> None:
+    def create_argument_batch(self, _function: Function, _count: int) -> list[tuple[Any, ...]]:
         """
-        Remove all function calls in the `exec_lines` attribute of the given `_function`.
+        Generates the argument values of many trials at once, the edges of the trials are drawn in one batch.
 
         Args:
-            _function (Function): The function object containing the `exec_lines` attribute.
+            _function (Function): The function object for which the argument values need to be generated.
+            _count (int): The number of trials.
 
         Returns:
-            None: This function does not return anything.
+            list[tuple[Any, ...]]: The argument values of every trial in the order of the function arguments.
         """
-        remove: str = f"\n\n{_function.name}"
-        _function.exec_lines = _function.exec_lines.split(remove)[0]
+        return [
+            tuple(self.__create_values_to_arguments(_function, edges).values())
+            for edges in self.__sampler.edges_batch(_count)
+        ]
 
-    def add_function_call_in_funcexeclines(
-        self, _function: Function, pars: str
-    ) -> None:
+    def arguments_to_str(self, _arg_values: tuple[Any, ...] | list[Any]) -> str:
         """
-        Add a function call to the exec_lines list of a Function object.
+        Converts argument values to their string representation.
 
-        Parameters:
-            _function (Function): The Function object to add the function call to.
-            pars (str): The parameters to be included in the function call.
+        Args:
+            _arg_values (tuple[Any, ...] | list[Any]): The argument values to convert.
 
         Returns:
-            None
+            str: A string representation of the arguments in the format "(arg1,arg2,arg3,...)".
         """
-        _function.exec_lines += f"\n\n{_function.name}{pars}"
+        return "(" + ",".join([f'"{val}"' if isinstance(val, str) else str(val) for val in _arg_values]) + ")" if _arg_values else ""
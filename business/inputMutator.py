@@ -0,0 +1,149 @@
+"""
+This class derives new argument values of a function by mutating the inputs of its corpus.
+"""
+import random
+from typing import Any
+from entity.minedConstants import MinedConstants
+
+
+class InputMutator:
+    """
+    This class derives new argument values of a function by mutating the inputs of its corpus.
+    Here's what each class method does:
+
+    - mutate: Derives new argument values from an input of the corpus.
+    - crossover: Combines the argument values of two inputs of the corpus.
+    - __mutate_value: Mutates a single argument value.
+    - __mutate_number: Flips a bit of a number, adds a small delta or substitutes a boundary.
+    - __mutate_string: Inserts, deletes or replaces characters of a string, or splices it with another string.
+
+    An input of the corpus already reached a new path, so a small change of it mostly takes the same outer branches
+    and tries the inner ones, which fresh random values reach only by chance.
+    The boundaries are 0, 1, -1, the powers of ten the input generator prefers and the literals mined from the function.
+
+    @category: Business Classes, Manager
+    @import: MinedConstants
+    @see: MinedConstants
+    """
+
+    __boundaries: tuple[int, ...] = (0, 1, -1, 10, -10, 100, -100, 1000, -1000, 10000, -10000)
+    __letters: str = "abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789!#$%&*+,-.:;<=>?@^_`|~ "
+
+    def mutate(self, _corpus: list[tuple[Any, ...]], _mined_constants: MinedConstants) -> tuple[Any, ...]:
+        """
+        Derives new argument values from an input of the corpus.
+        One or two argument values are mutated, or the input is crossed over with another input of the corpus.
+
+        Parameters:
+            _corpus (list[tuple[Any, ...]]): The argument values that reached new coverage, it must not be empty.
+            _mined_constants (MinedConstants): The literals mined from the function.
+
+        Returns:
+            tuple[Any, ...]: The new argument values.
+        """
+        values: list[Any] = list(random.choice(_corpus))
+        if len(_corpus) > 1 and random.random() < 0.2:
+            return self.crossover(tuple(values), random.choice(_corpus))
+
+        for _ in range(random.choice((1, 1, 1, 2))):
+            if values:
+                index: int = random.randrange(len(values))
+                values[index] = self.__mutate_value(
+                    values[index], _corpus, _mined_constants)
+        return tuple(values)
+
+    def crossover(self, _first: tuple[Any, ...], _second: tuple[Any, ...]) -> tuple[Any, ...]:
+        """
+        Combines the argument values of two inputs of the corpus, every value is taken from one of them.
+        Two strings at the same position are spliced.
+
+        Parameters:
+            _first (tuple[Any, ...]): The first argument values.
+            _second (tuple[Any, ...]): The second argument values.
+
+        Returns:
+            tuple[Any, ...]: The combined argument values.
+        """
+        values: list[Any] = []
+        for first, second in zip(_first, _second):
+            if isinstance(first, str) and isinstance(second, str) and random.random() < 0.5:
+                values.append(first[:random.randint(0, len(first))] +
+                              second[random.randint(0, len(second)):])
+            else:
+                values.append(random.choice((first, second)))
+        return tuple(values)
+
+    def __mutate_value(self, _value: Any, _corpus: list[tuple[Any, ...]], _mined_constants: MinedConstants) -> Any:
+        """
+        Mutates a single argument value.
+
+        Parameters:
+            _value (Any): The argument value.
+            _corpus (list[tuple[Any, ...]]): The corpus, its strings are spliced into string values.
+            _mined_constants (MinedConstants): The literals mined from the function.
+
+        Returns:
+            Any: The mutated value, of the same type as the given value.
+        """
+        if isinstance(_value, bool):
+            return not _value
+        if isinstance(_value, (int, float)):
+            return self.__mutate_number(_value, _mined_constants)
+        if isinstance(_value, str):
+            others: list[str] = [value for values in _corpus for value in values if isinstance(value, str)]
+            return self.__mutate_string(_value, others, _mined_constants)
+        return _value
+
+    def __mutate_number(self, _value: int | float, _mined_constants: MinedConstants) -> int | float:
+        """
+        Flips a bit of a number, adds a small delta or substitutes a boundary.
+
+        Parameters:
+            _value (int | float): The number.
+            _mined_constants (MinedConstants): The literals mined from the function.
+
+        Returns:
+            int | float: The mutated number, a float stays a float.
+        """
+        mutation: int = random.randrange(4)
+        if mutation == 0 and isinstance(_value, int):
+            return _value ^ (1 << random.randrange(16))
+        if mutation == 1 or mutation == 0:
+            delta: int | float = random.choice((1, 2, 3, 4, 8, 16)) * random.choice((1, -1))
+            if isinstance(_value, float):
+                delta = random.choice((0.1, 0.5, 1.0, 10.0)) * random.choice((1, -1))
+                return round(_value + delta, 1)
+            return _value + delta
+        if mutation == 2:
+            return -_value
+
+        boundaries: list[int | float] = [*self.__boundaries, *_mined_constants.numbers]
+        boundary: int | float = random.choice(boundaries)
+        return float(boundary) if isinstance(_value, float) else int(boundary)
+
+    def __mutate_string(self, _value: str, _others: list[str], _mined_constants: MinedConstants) -> str:
+        """
+        Inserts, deletes or replaces characters of a string, or splices it with another string.
+
+        Parameters:
+            _value (str): The string.
+            _others (list[str]): The strings of the corpus.
+            _mined_constants (MinedConstants): The literals mined from the function.
+
+        Returns:
+            str: The mutated string.
+        """
+        mutation: int = random.randrange(5)
+        position: int = random.randint(0, len(_value))
+        if mutation == 0:
+            return _value[:position] + random.choice(self.__letters) + _value[position:]
+        if mutation == 1 and _value:
+            return _value[:position] + _value[position + 1:]
+        if mutation == 2 and _value:
+            position = min(position, len(_value) - 1)
+            return _value[:position] + random.choice(self.__letters) + _value[position + 1:]
+        if mutation == 3 and _others:
+            other: str = random.choice(_others)
+            return _value[:position] + other[random.randint(0, len(other)):]
+
+        return random.choice([*_mined_constants.strings, ""])
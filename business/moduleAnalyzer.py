@@ -0,0 +1,259 @@
+"""
+This class discovers the functions of a module and generates the test cases of every one of them in one pass.
+"""
+import ast
+import symtable
+import textwrap
+from concurrent.futures import FIRST_COMPLETED, Future, wait
+from typing import Any, Callable
+from business.functionManager import FunctionManager
+from business.testCacheManager import TestCacheManager
+from business.testManager import TestManager
+from business.parallelTestManager import ParallelTestManager
+from entity.function import Function
+from entity.testCase import TestCase
+
+
+class ModuleAnalyzer:
+    """
+    This class discovers the functions of a module and generates the test cases of every one of them in one pass.
+    Here's what each class method does:
+
+    - __init__: Initializes a new instance of the class with the test manager, the number of test case pools of a function and the test case cache.
+    - discover: Parses a module once and builds a Function for every top level function and nested helper.
+    - analyze: Discovers the functions of a module and generates their test case pools.
+    - estimate_cost: Returns the estimated cost of the test case generation of a function.
+    - run: Generates the test case pools of the given functions, the most expensive first, and hands every result over as soon as it is ready.
+    - __definitions: Returns the functions defined in a body, with their qualified names and symbol tables, nested helpers included.
+    - __function_source: Returns the source of a function definition, dedented to the left margin.
+
+    Every Function keeps the whole module as its module context, so it runs beside the imports, the constants and the other functions
+    of its module, see Function.module_context. A nested helper is tested alone when it does not use the variables of the function
+    it is defined in, a helper that closes over them can not be called without its enclosing function and gets a ValueError.
+    Async functions, methods and the functions defined under a module level statement are not discovered.
+    With a parallel test manager of more than one job, every function is sent whole to a worker process, so the functions
+    of a module are tested side by side instead of one at a time, see ParallelTestManager.submit_function.
+    The functions are queued by their estimated cost, the branch count times the argument count, the most expensive first,
+    and only two functions per worker are in flight, so a worker that is done takes the next one from the shared queue of the pool
+    and the cheap functions fill the gaps at the end. The functions of many modules can be queued together, see run.
+    With a test case cache, a function whose source, module and settings did not change gets its pools from the cache
+    before anything is queued, and the pools of a finished function are saved to it, see TestCacheManager.
+
+    The result map is keyed by the qualified name of the function, "outer.helper" for a nested helper, and holds the Function
+    with its test case pools, or the exception that stopped the analysis of that function.
+
+    @category: Business Classes, Analyzer
+    @import: FunctionManager, TestCacheManager, TestManager, ParallelTestManager, Function, TestCase
+    @see: FunctionManager, TestCacheManager, TestManager, ParallelTestManager, Function
+    """
+
+    def __init__(
+        self,
+        _test_manager: TestManager,
+        _pool_count: int = 1,
+        _retry_limit: int = 10,
+        _test_cache: TestCacheManager | None = None,
+    ) -> None:
+        """
+        Initializes a new instance of the class.
+
+        Parameters:
+            _test_manager (TestManager): The test manager that generates the test cases.
+            _pool_count (int): The number of test case pools of every function. Defaults to 1.
+            _retry_limit (int): The number of attempts without a new pool before the generation of a function stops. Defaults to 10.
+            _test_cache (TestCacheManager | None): The cache of the generated test case pools. Defaults to None, no cache.
+
+        Returns:
+            None
+
+        @category: Business Classes, Analyzer
+        """
+        self.__test_manager: TestManager = _test_manager
+        self.__function_manager: FunctionManager = FunctionManager()
+        self.__pool_count: int = _pool_count
+        self.__retry_limit: int = _retry_limit
+        self.__test_cache: TestCacheManager | None = _test_cache
+
+    def discover(self, _source_code: str) -> dict[str, Function | Exception]:
+        """
+        Parses a module once and builds a Function for every top level function and nested helper.
+
+        Parameters:
+            _source_code (str): The source code of the module.
+
+        Returns:
+            dict[str, Function | Exception]: The functions keyed by their qualified names, in the order of the module,
+            a ValueError for a nested helper that uses the variables of its enclosing function.
+
+        Raises:
+            SyntaxError: If the module can not be parsed.
+        """
+        tree: ast.Module = ast.parse(_source_code)
+        module_table: symtable.SymbolTable = symtable.symtable(_source_code, "<module>", "exec")
+        lines: list[str] = _source_code.splitlines()
+
+        functions: dict[str, Function | Exception] = {}
+        for name, node, table in self.__definitions(tree.body, "", module_table):
+            # A recursive helper finds itself in the module namespace, where its def runs when it is tested alone.
+            free_names: list[str] = [
+                free_name for free_name in table.get_frees() if free_name != node.name] if isinstance(table, symtable.Function) else []
+            if free_names:
+                functions[name] = ValueError(
+                    f"{name} uses the variables {', '.join(free_names)} of its enclosing function, it can not be called alone.")
+                continue
+
+            function: Function = self.__function_manager.str_to_function(self.__function_source(lines, node))
+            function.module_context = _source_code
+            functions[name] = function
+        return functions
+
+    def analyze(self, _source_code: str) -> dict[str, Function | Exception]:
+        """
+        Discovers the functions of a module and generates their test case pools.
+        An exception raised by the test case generation of a function is kept as its result, the other functions go on.
+        The result map keeps the order of the module.
+
+        Parameters:
+            _source_code (str): The source code of the module.
+
+        Returns:
+            dict[str, Function | Exception]: The tested functions keyed by their qualified names, see discover.
+
+        Raises:
+            SyntaxError: If the module can not be parsed.
+        """
+        results: dict[str, Function | Exception] = self.discover(_source_code)
+        self.run(results, results.__setitem__)
+        return results
+
+    def estimate_cost(self, _function: Function) -> int:
+        """
+        Returns the estimated cost of the test case generation of a function.
+
+        Parameters:
+            _function (Function): The function.
+
+        Returns:
+            int: The branch count times the argument count, both counted as at least 1.
+        """
+        argument_count: int = len([argument for argument in _function.arguments.strip("()").split(",") if argument.strip()])
+        return max(_function.branch_count, 1) * max(argument_count, 1)
+
+    def run(
+        self,
+        _functions: dict[str, Function | Exception],
+        _result_handler: Callable[[str, Function | Exception], None],
+    ) -> None:
+        """
+        Generates the test case pools of the given functions, the most expensive first, and hands every result over as soon as it is ready.
+        An exception in place of a function is handed over first, then the functions found in the test case cache.
+        An exception raised by the test case generation of a function is handed over as its result, the other functions go on.
+
+        Parameters:
+            _functions (dict[str, Function | Exception]): The functions keyed by unique names, see discover.
+            _result_handler (Callable[[str, Function | Exception], None]): The callable that takes the name and the tested function,
+            or the exception that stopped it, in the order the functions finish.
+
+        Returns:
+            None
+        """
+        test_manager: TestManager = self.__test_manager
+        settings: dict[str, Any] = {
+            "pool_count": self.__pool_count, "retry_limit": self.__retry_limit, **test_manager.settings}
+
+        def finish(_name: str, _function: Function) -> None:
+            if self.__test_cache is not None and not test_manager.cancelled:
+                self.__test_cache.save_test_cases(_function, settings)
+            _result_handler(_name, _function)
+
+        queue: list[tuple[str, Function]] = []
+        for name, result in _functions.items():
+            if not isinstance(result, Function):
+                _result_handler(name, result)
+            elif self.__test_cache is not None and self.__test_cache.load_test_cases(result, settings):
+                _result_handler(name, result)
+            else:
+                queue.append((name, result))
+        # The queue is popped from its end, so the most expensive function is the last item.
+        queue.sort(key=lambda item: self.estimate_cost(item[1]))
+
+        if isinstance(test_manager, ParallelTestManager) and test_manager.jobs > 1 and len(queue) > 1:
+            for module_context in dict.fromkeys(function.module_context for _, function in queue):
+                test_manager.preload(module_context)
+
+            pending: dict[Future[list[list[TestCase]]], tuple[str, Function]] = {}
+            while True:
+                while queue and len(pending) < test_manager.jobs * 2 and not test_manager.cancelled:
+                    name, function = queue.pop()
+                    pending[test_manager.submit_function(function, self.__pool_count, self.__retry_limit)] = (name, function)
+                if not pending:
+                    break
+
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    name, function = pending.pop(future)
+                    try:
+                        for pool in future.result():
+                            function.add_test_case = pool
+                    except Exception as error:
+                        _result_handler(name, error)
+                        continue
+                    finish(name, function)
+            return
+
+        while queue and not test_manager.cancelled:
+            name, function = queue.pop()
+            try:
+                test_manager.generate_test_pools(function, self.__pool_count, self.__retry_limit)
+            except Exception as error:
+                _result_handler(name, error)
+                continue
+            finish(name, function)
+
+    def __definitions(
+        self, _body: list[ast.stmt], _prefix: str, _table: symtable.SymbolTable
+    ) -> list[tuple[str, ast.FunctionDef, symtable.SymbolTable]]:
+        """
+        Returns the functions defined in a body, with their qualified names and symbol tables, nested helpers included.
+        The defs under the compound statements of a function body are its helpers too, the bodies of classes are not walked.
+
+        Parameters:
+            _body (list[ast.stmt]): The statements of the module or of a function.
+            _prefix (str): The qualified name of the enclosing function followed by a dot, empty for the module.
+            _table (symtable.SymbolTable): The symbol table of the module or of the enclosing function.
+
+        Returns:
+            list[tuple[str, ast.FunctionDef, symtable.SymbolTable]]: The qualified name, the definition and the symbol table of every function.
+        """
+        children: list[symtable.SymbolTable] = [child for child in _table.get_children() if child.get_type() == "function"]
+        definitions: list[tuple[str, ast.FunctionDef, symtable.SymbolTable]] = []
+
+        nodes: list[ast.AST] = list(_body)
+        while nodes:
+            node: ast.AST = nodes.pop(0)
+            if isinstance(node, ast.FunctionDef):
+                matches: list[symtable.SymbolTable] = [child for child in children if child.get_name() == node.name]
+                table: symtable.SymbolTable = next(
+                    (child for child in matches if child.get_lineno() == node.lineno), matches[0])
+                name: str = _prefix + node.name
+                definitions.append((name, node, table))
+                definitions += self.__definitions(node.body, name + ".", table)
+            elif _prefix and isinstance(node, ast.stmt) and not isinstance(node, (ast.AsyncFunctionDef, ast.ClassDef)):
+                nodes[:0] = [child for child in ast.iter_child_nodes(node) if isinstance(child, (ast.stmt, ast.excepthandler, ast.match_case))]
+            elif _prefix and isinstance(node, (ast.excepthandler, ast.match_case)):
+                nodes[:0] = list(node.body)
+        return definitions
+
+    def __function_source(self, _lines: list[str], _node: ast.FunctionDef) -> str:
+        """
+        Returns the source of a function definition, dedented to the left margin.
+
+        Parameters:
+            _lines (list[str]): The lines of the module.
+            _node (ast.FunctionDef): The function definition.
+
+        Returns:
+            str: The source of the function with its decorators.
+        """
+        first_line: int = min([_node.lineno] + [decorator.lineno for decorator in _node.decorator_list])
+        return textwrap.dedent("\n".join(_lines[first_line - 1:_node.end_lineno]))
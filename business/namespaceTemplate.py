@@ -0,0 +1,172 @@
+"""
+This class executes the prelude of a module once into a template namespace and gives every compiled function a copy of it.
+"""
+import ast
+import dis
+from types import CodeType
+from typing import Any, Callable
+
+
+class NamespaceTemplate:
+    """
+    This class executes the prelude of a module once into a template namespace and gives every compiled function a copy of it.
+    Here's what each class method does:
+
+    - __init__: Initializes the template cache with the number of preludes it keeps.
+    - overlay: Returns a copy of the template namespace of the prelude of a module and the code of the rest of the module.
+    - module: Returns a copy of the template namespace of a whole module, the module a function was taken from.
+    - isolate: Returns the target, wrapped so that every call starts with the globals it rebinds restored.
+    - __template: Returns the template namespace of a code text, it is executed on the first call.
+    - __split: Splits the statements of a module into its prelude and the rest.
+    - __rebound_names: Returns the global names that the code objects of a module rebind.
+
+    The prelude is the run of statements above the first def or class of the module, the imports and module level setup
+    such as lookup tables. It is executed once per module text, and every compile gets a shallow copy of the namespace it built,
+    so a copy is a few dict entries instead of running the imports and the setup again. A binding of the copy does not reach the template,
+    the objects are shared, so a trial that mutates a module level list changes it for the next ones, as a plain import would.
+    A module with a `from __future__` import is not split, its statements must be compiled together.
+    The module a function was taken from, see Function.module_context, is executed whole the same way, so the functions
+    of one module share a single run of its code.
+
+    @category: Business Classes, Manager
+    @see: ExecutionEngine
+    """
+
+    def __init__(self, _max_templates: int = 64) -> None:
+        """
+        Initializes the template cache with the number of preludes it keeps.
+
+        Parameters:
+            _max_templates (int): The number of template namespaces kept, the oldest one is dropped first. Defaults to 64.
+
+        Returns:
+            None
+
+        @category: Business Classes, Manager
+        """
+        self.__max_templates: int = _max_templates
+        self.__templates: dict[str, dict[str, Any]] = {}
+
+    def overlay(self, _plain_source: str, _source: str, _filename: str) -> tuple[dict[str, Any], CodeType]:
+        """
+        Returns a copy of the template namespace of the prelude of a module and the code of the rest of the module.
+        The prelude is read from the user's code, the rest from the source the coverage tracer asks for, so the module level probes
+        of the instrumented source are dropped with the prelude, they are cleared before every trial anyway.
+
+        Parameters:
+            _plain_source (str): The user's code of the module.
+            _source (str): The source the coverage tracer executes, the instrumented code or the user's code.
+            _filename (str): The file name the code is compiled with.
+
+        Returns:
+            tuple[dict[str, Any], CodeType]: The namespace to execute the code in and the code to execute.
+        """
+        plain_prelude, _ = self.__split(ast.parse(_plain_source))
+        prelude, rest = self.__split(ast.parse(_source))
+        if not plain_prelude or not prelude:
+            return {}, compile(_source, _filename, "exec")
+
+        prelude_module: ast.Module = ast.Module(body=plain_prelude, type_ignores=[])
+        template: dict[str, Any] = self.__template(ast.unparse(prelude_module), prelude_module, _filename)
+        return dict(template), compile(ast.Module(body=rest, type_ignores=[]), _filename, "exec")
+
+    def module(self, _module_source: str, _filename: str) -> dict[str, Any]:
+        """
+        Returns a copy of the template namespace of a whole module, the module a function was taken from.
+
+        Parameters:
+            _module_source (str): The source of the module.
+            _filename (str): The file name the code is compiled with.
+
+        Returns:
+            dict[str, Any]: The namespace to execute the code of the function in.
+        """
+        return dict(self.__template(_module_source, _module_source, _filename))
+
+    def __template(self, _key: str, _code: str | ast.Module, _filename: str) -> dict[str, Any]:
+        """
+        Returns the template namespace of a code text, it is executed on the first call.
+
+        Parameters:
+            _key (str): The text the template is cached by.
+            _code (str | ast.Module): The code to execute.
+            _filename (str): The file name the code is compiled with.
+
+        Returns:
+            dict[str, Any]: The template namespace, it must not be changed by the caller.
+        """
+        template: dict[str, Any] | None = self.__templates.get(_key)
+        if template is None:
+            template = {}
+            exec(compile(_code, _filename, "exec"), template)
+            if len(self.__templates) >= self.__max_templates:
+                del self.__templates[next(iter(self.__templates))]
+            self.__templates[_key] = template
+        return template
+
+    def isolate(self, _module_code: CodeType, _namespace: dict[str, Any], _target: Callable[..., Any]) -> Callable[..., Any]:
+        """
+        Returns the target, wrapped so that every call starts with the globals it rebinds restored.
+        A target without a `global` statement is returned as it is, so only the functions that rebind their globals pay for the wrapper.
+        The globals rebound through `globals()` are not restored.
+
+        Parameters:
+            _module_code (CodeType): The executed module code.
+            _namespace (dict[str, Any]): The namespace the module code was executed in.
+            _target (Callable[..., Any]): The compiled function object.
+
+        Returns:
+            Callable[..., Any]: The function object to call on every trial.
+        """
+        names: set[str] = self.__rebound_names(_module_code)
+        if not names:
+            return _target
+
+        missing: object = object()
+        baseline: list[tuple[str, Any]] = [(name, _namespace.get(name, missing)) for name in sorted(names)]
+
+        def isolated_target(*_arg_values: Any) -> Any:
+            for name, value in baseline:
+                if value is missing:
+                    _namespace.pop(name, None)
+                else:
+                    _namespace[name] = value
+            return _target(*_arg_values)
+
+        return isolated_target
+
+    def __split(self, _tree: ast.Module) -> tuple[list[ast.stmt], list[ast.stmt]]:
+        """
+        Splits the statements of a module into its prelude and the rest.
+
+        Parameters:
+            _tree (ast.Module): The parsed module.
+
+        Returns:
+            tuple[list[ast.stmt], list[ast.stmt]]: The statements above the first def or class and the others,
+            no prelude if the module has a `from __future__` import.
+        """
+        definitions: tuple[type, ...] = (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)
+        if any(isinstance(node, ast.ImportFrom) and node.module == "__future__" for node in _tree.body):
+            return [], _tree.body
+        index: int = next((index for index, node in enumerate(_tree.body) if isinstance(node, definitions)), len(_tree.body))
+        return _tree.body[:index], _tree.body[index:]
+
+    def __rebound_names(self, _module_code: CodeType) -> set[str]:
+        """
+        Returns the global names that the code objects of a module rebind.
+
+        Parameters:
+            _module_code (CodeType): The module code.
+
+        Returns:
+            set[str]: The names stored or deleted with STORE_GLOBAL and DELETE_GLOBAL by the functions of the module.
+        """
+        names: set[str] = set()
+        codes: list[CodeType] = [const for const in _module_code.co_consts if isinstance(const, CodeType)]
+        while codes:
+            code: CodeType = codes.pop()
+            names |= {instruction.argval for instruction in dis.get_instructions(code)
+                      if instruction.opname in ("STORE_GLOBAL", "DELETE_GLOBAL")}
+            codes += [const for const in code.co_consts if isinstance(const, CodeType)]
+        return names
@@ -0,0 +1,505 @@
+"""
+This class is a test manager that splits the trial budget of the test case generation across a pool of worker processes.
+"""
+import ast
+import multiprocessing
+import multiprocessing.forkserver
+import os
+import random
+import sys
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from multiprocessing import shared_memory
+from typing import Any, Callable
+from business.functionManager import FunctionManager
+from business.testManager import TestManager
+from entity.function import Function
+from entity.minedConstants import MinedConstants
+from entity.testCase import TestCase
+from entity.trialResult import TrialResult
+
+
+class ParallelTestManager(TestManager):
+    """
+    This class is a test manager that splits the trial budget of the test case generation across a pool of worker processes.
+    Here's what each class method does:
+
+    - __init__: Initializes a new instance of the class with the worker count and the number of trials of a chunk.
+    - jobs: Gets the number of worker processes.
+    - executor: Gets the persistent process pool, it is created on the first use.
+    - preload: Sets the modules the fork server imports before it forks the workers.
+    - shutdown: Shuts the process pool down.
+    - silence_output: Points the stdout of a worker process at the null device.
+    - run_chunk: Runs a chunk of trials in a worker process with its own random seed and returns the trials that reached new coverage.
+    - run_function: Generates the test case pools of a function in a worker process.
+    - submit_function: Sends the test case generation of a whole function to a worker process.
+    - __attach: Attaches a worker to the shared coverage map of a generation.
+    - generate_test_cases: Generates test cases for a given function by running the solved trials, the concolic runs, the vectorized trials, a first random batch
+    and the branch distance search in the parent, then chunks of random trials in the worker processes,
+    and merging the coverage of the kept trials in the parent.
+
+    Every chunk gets an independent random seed, the corpus, the observed constants and the name of the shared coverage map of the generation.
+    The map is a shared memory bitmap with a byte per probe and a last byte for the timeouts, AFL style, the workers write the probes of their
+    trials into it, so every worker sees the coverage of the others while its chunk runs, and stops as soon as the branches are reached.
+    Only a trial that sets a new byte of the map is sent back to become a test case, so the traffic between the processes grows with
+    the new coverage instead of with the trials, and no fingerprint set is sent with the chunks.
+    The process pool is kept between calls, so generating several pools pays for the worker start only once.
+    Where the platform has a fork server, it imports the modules of the tool and the modules the target imports once,
+    and every worker is forked from it, so no worker starts an interpreter or imports them again.
+    In a worker, the functions of one coverage backend and budget share a test manager, so they share the prelude templates of its engine,
+    and the functions of one module run its code once per worker, see Function.module_context.
+    The functions of a module are tested side by side by sending each one whole to a worker, see ModuleAnalyzer.
+
+    @category: Business Classes, Manager
+    @import: TestManager, FunctionManager, Function, MinedConstants, TestCase, TrialResult
+    @see: TestManager, FunctionManager, Function, MinedConstants, TestCase, TrialResult
+    """
+
+    __worker_managers: dict[tuple[str, tuple[float, int]], TestManager] = {}
+    __worker_functions: dict[tuple[str, str, str, tuple[float, int]], Function] = {}
+    __worker_map: tuple[shared_memory.SharedMemory, set[bytes]] | None = None
+
+    def __init__(
+        self,
+        _jobs: int | None = None,
+        _chunk_size: int = 2_000,
+        _coverage_backend: str = "probe",
+        _message_handler: Callable[[str, str], None] | None = None,
+        _trial_timeout: float = 1.0,
+        _trial_steps: int = 1_000_000,
+    ) -> None:
+        """
+        Initializes a new instance of the class.
+
+        Parameters:
+            _jobs (int | None): The number of worker processes. Defaults to the CPU count.
+            _chunk_size (int): The number of trials a worker runs for one chunk. Defaults to 2_000.
+            _coverage_backend (str): The name of the coverage backend of the execution engine. Defaults to "probe".
+            _message_handler (Callable[[str, str], None] | None): The callable that shows the messages. Defaults to writing them to stderr.
+            _trial_timeout (float): The wall clock timeout of a trial in seconds, 0 turns it off. Defaults to 1.
+            _trial_steps (int): The step limit of a trial, loop iterations and calls, 0 turns it off. Defaults to 1_000_000.
+
+        Returns:
+            None
+
+        @category: Business Classes, Manager
+        @import: TestManager, FunctionManager, Function, TestCase, TrialResult
+        @see: TestManager, FunctionManager, Function, TestCase, TrialResult
+        """
+        super().__init__(_coverage_backend, _message_handler=_message_handler,
+                         _trial_timeout=_trial_timeout, _trial_steps=_trial_steps)
+        self.__jobs: int = _jobs or os.cpu_count() or 1
+        self.__chunk_size: int = _chunk_size
+        self.__coverage_backend: str = _coverage_backend
+        self.__executor: ProcessPoolExecutor | None = None
+        self.__preload: list[str] = [__name__]
+
+    @property
+    def jobs(self) -> int:
+        """
+        Returns the number of worker processes.
+
+        Returns:
+            int: The number of worker processes.
+        """
+        return self.__jobs
+
+    @property
+    def executor(self) -> ProcessPoolExecutor:
+        """
+        Returns the persistent process pool, it is created on the first use.
+        The workers are forked from a fork server that imported the preloaded modules, or spawned where there is no fork server,
+        so they do not inherit the state of a GUI process in either case.
+
+        Returns:
+            ProcessPoolExecutor: The process pool.
+        """
+        if self.__executor is None:
+            if "forkserver" in multiprocessing.get_all_start_methods():
+                context: Any = multiprocessing.get_context("forkserver")
+                # The fork server is shared by the pools of the process, the preload is used when it starts.
+                context.set_forkserver_preload(self.__preload)
+                # The fork server does not get the sys.path of this process, so it is started here with it in PYTHONPATH.
+                python_path: str | None = os.environ.get("PYTHONPATH")
+                os.environ["PYTHONPATH"] = os.pathsep.join(path for path in sys.path if path)
+                try:
+                    multiprocessing.forkserver.ensure_running()
+                finally:
+                    if python_path is None:
+                        del os.environ["PYTHONPATH"]
+                    else:
+                        os.environ["PYTHONPATH"] = python_path
+            else:
+                context = multiprocessing.get_context("spawn")
+            self.__executor = ProcessPoolExecutor(
+                max_workers=self.__jobs, mp_context=context, initializer=ParallelTestManager.silence_output)
+        return self.__executor
+
+    def preload(self, _source: str) -> None:
+        """
+        Sets the modules the fork server imports before it forks the workers, the modules of the tool and the ones the source imports.
+        It only takes effect before the process pool is created, a module that fails to import is skipped by the fork server.
+
+        Parameters:
+            _source (str): The source code of the target.
+
+        Returns:
+            None
+        """
+        try:
+            tree: ast.Module = ast.parse(_source)
+        except SyntaxError:
+            return
+
+        for node in tree.body:
+            names: list[str] = []
+            if isinstance(node, ast.Import):
+                names = [alias.name for alias in node.names]
+            elif isinstance(node, ast.ImportFrom) and node.module and not node.level:
+                names = [node.module]
+            self.__preload += [name for name in names if name not in self.__preload]
+
+    def shutdown(self) -> None:
+        """
+        Shuts the process pool down.
+
+        Parameters:
+            None
+
+        Returns:
+            None
+        """
+        if self.__executor is not None:
+            self.__executor.shutdown(cancel_futures=True)
+            self.__executor = None
+
+    @staticmethod
+    def silence_output() -> None:
+        """
+        Points the stdout of a worker process at the null device, it is the initializer of the workers.
+        The workers inherit the stdout of the tool, so what the tested code writes there, even below sys.stdout,
+        would mix with the report the tool streams, the JSON lines of a batch for example.
+
+        Parameters:
+            None
+
+        Returns:
+            None
+        """
+        null_device: int = os.open(os.devnull, os.O_WRONLY)
+        os.dup2(null_device, sys.stdout.fileno())
+        os.close(null_device)
+
+    @staticmethod
+    def run_chunk(
+        _source: str,
+        _module_context: str,
+        _support_cases: list[Any],
+        _corpus: list[tuple[Any, ...]],
+        _observed_constants: MinedConstants,
+        _coverage_backend: str,
+        _trial_budget: tuple[float, int],
+        _seed: int,
+        _tried_counts: int,
+        _check_point: int,
+        _coverage_map: str,
+    ) -> tuple[list[tuple[tuple[Any, ...], TrialResult]], TypeError | None]:
+        """
+        Runs a chunk of trials in a worker process with its own random seed and returns the trials that reached new coverage.
+        The function is built and compiled once per worker process and reused by the next chunks,
+        the functions of the same coverage backend and budget share the test manager of the worker.
+        The trials run in batches, the branches that are not reached yet are read from the coverage map before each batch.
+
+        Parameters:
+            _source (str): The fixed source code of the function.
+            _module_context (str): The source of the module the function was taken from, empty for a function that stands alone.
+            _support_cases (list[Any]): The support cases of the function.
+            _corpus (list[tuple[Any, ...]]): The corpus of the function in the parent.
+            _observed_constants (MinedConstants): The operands the comparisons of the function compared in the parent.
+            _coverage_backend (str): The name of the coverage backend of the execution engine.
+            _trial_budget (tuple[float, int]): The wall clock timeout and the step limit of a trial.
+            _seed (int): The random seed of the chunk.
+            _tried_counts (int): The number of trials that were made before the chunk.
+            _check_point (int): The trial number the chunk stops at.
+            _coverage_map (str): The name of the shared coverage map of the generation.
+
+        Returns:
+            tuple[list[tuple[tuple[Any, ...], TrialResult]], TypeError | None]: The argument values and coverage of the trials
+            that set a new byte of the coverage map, and the TypeError that stopped the chunk if the tested name is not callable.
+        """
+        test_manager: TestManager = ParallelTestManager.__worker_manager(_coverage_backend, _trial_budget)
+        key: tuple[str, str, str, tuple[float, int]] = (_source, _module_context, _coverage_backend, _trial_budget)
+        if key not in ParallelTestManager.__worker_functions:
+            ParallelTestManager.__worker_functions[key] = FunctionManager().str_to_function(_source)
+            ParallelTestManager.__worker_functions[key].module_context = _module_context
+
+        function: Function = ParallelTestManager.__worker_functions[key]
+        function.support_cases = _support_cases
+        function.corpus = list(_corpus)
+        function.observed_constants = _observed_constants
+
+        coverage_map, fingerprints = ParallelTestManager.__attach(_coverage_map)
+        timeout_index: int = len(function.instrumented_code.source_map)
+        branches: list[int] = list(function.control_flow_graph.branch_edges)
+
+        random.seed(_seed)
+        new_trials: list[tuple[tuple[Any, ...], TrialResult]] = []
+        type_error: TypeError | None = None
+        while _tried_counts < _check_point and type_error is None:
+            uncovered_branches: set[int] = {branch for branch in branches if not coverage_map[branch]}
+            if not uncovered_branches:
+                break
+            batch_end: int = min(_tried_counts + test_manager._batch_size, _check_point)
+            trials, type_error = test_manager.run_trials(
+                function, _tried_counts, batch_end, fingerprints, uncovered_branches)
+            _tried_counts = batch_end
+
+            for arg_values, trial_result in trials:
+                bitmap: bytes = trial_result.coverage_bitmap
+                new_probes: list[int] = [probe for probe, value in enumerate(bitmap) if value and not coverage_map[probe]]
+                if trial_result.timed_out and not coverage_map[timeout_index]:
+                    new_probes.append(timeout_index)
+                if new_probes:
+                    for probe in new_probes:
+                        coverage_map[probe] = 1
+                    new_trials.append((arg_values, trial_result))
+
+        return new_trials, type_error
+
+    @staticmethod
+    def run_function(
+        _source: str,
+        _module_context: str,
+        _support_cases: list[Any],
+        _coverage_backend: str,
+        _trial_budget: tuple[float, int],
+        _pool_count: int,
+        _retry_limit: int,
+    ) -> list[list[TestCase]]:
+        """
+        Generates the test case pools of a function in a worker process.
+        The trials of the function run in the worker alone, the functions of a module are spread across the workers instead.
+
+        Parameters:
+            _source (str): The fixed source code of the function.
+            _module_context (str): The source of the module the function was taken from, empty for a function that stands alone.
+            _support_cases (list[Any]): The support cases of the function.
+            _coverage_backend (str): The name of the coverage backend of the execution engine.
+            _trial_budget (tuple[float, int]): The wall clock timeout and the step limit of a trial.
+            _pool_count (int): The number of test case pools to generate.
+            _retry_limit (int): The number of attempts without a new pool before the generation stops.
+
+        Returns:
+            list[list[TestCase]]: The generated test case pools.
+        """
+        function: Function = FunctionManager().str_to_function(_source)
+        function.module_context = _module_context
+        function.support_cases = _support_cases
+        ParallelTestManager.__worker_manager(_coverage_backend, _trial_budget).generate_test_pools(
+            function, _pool_count, _retry_limit)
+        return function.test_cases
+
+    @staticmethod
+    def __worker_manager(_coverage_backend: str, _trial_budget: tuple[float, int]) -> TestManager:
+        """
+        Returns the test manager of a worker process for a coverage backend and a trial budget, it is created on the first use.
+
+        Parameters:
+            _coverage_backend (str): The name of the coverage backend of the execution engine.
+            _trial_budget (tuple[float, int]): The wall clock timeout and the step limit of a trial.
+
+        Returns:
+            TestManager: The test manager of the worker.
+        """
+        manager_key: tuple[str, tuple[float, int]] = (_coverage_backend, _trial_budget)
+        if manager_key not in ParallelTestManager.__worker_managers:
+            ParallelTestManager.__worker_managers[manager_key] = TestManager(
+                _coverage_backend, _trial_timeout=_trial_budget[0], _trial_steps=_trial_budget[1])
+        return ParallelTestManager.__worker_managers[manager_key]
+
+    def submit_function(self, _function: Function, _pool_count: int, _retry_limit: int) -> Future[list[list[TestCase]]]:
+        """
+        Sends the test case generation of a whole function to a worker process, see run_function.
+
+        Parameters:
+            _function (Function): The function to test.
+            _pool_count (int): The number of test case pools to generate.
+            _retry_limit (int): The number of attempts without a new pool before the generation stops.
+
+        Returns:
+            Future[list[list[TestCase]]]: The future of the generated test case pools.
+        """
+        if self.__executor is None:
+            self.preload(_function.module_context)
+        return self.executor.submit(
+            ParallelTestManager.run_function,
+            "\n".join(_function.code_lines),
+            _function.module_context,
+            _function.support_cases,
+            self.__coverage_backend,
+            (self._trial_timeout, self._trial_steps),
+            _pool_count,
+            _retry_limit,
+        )
+
+    @staticmethod
+    def __attach(_name: str) -> tuple[memoryview, set[bytes]]:
+        """
+        Attaches a worker to the shared coverage map of a generation.
+        A worker keeps the map of the last generation it ran a chunk of, with the fingerprints of the trials it kept for it.
+
+        Parameters:
+            _name (str): The name of the shared coverage map.
+
+        Returns:
+            tuple[memoryview, set[bytes]]: The bytes of the coverage map and the fingerprints of the kept trials of the worker.
+        """
+        worker_map: tuple[shared_memory.SharedMemory, set[bytes]] | None = ParallelTestManager.__worker_map
+        if worker_map is None or worker_map[0].name != _name:
+            if worker_map is not None:
+                worker_map[0].close()
+            worker_map = (shared_memory.SharedMemory(_name), set())
+            ParallelTestManager.__worker_map = worker_map
+        return worker_map[0].buf, worker_map[1]
+
+    def generate_test_cases(self, _function: Function) -> list[TestCase]:
+        """
+        Generates test cases for a given function in the worker processes.
+        Functions without arguments and a single job run in the calling process.
+
+        Parameters:
+            _function (Function): The function object for which test cases are to be generated.
+
+        Returns:
+            list[TestCase]: A list of test cases generated for the function.
+        """
+        if len(_function.arguments) <= 2 or self.__jobs <= 1:
+            return super().generate_test_cases(_function)
+
+        # Compiling here reports syntax errors of the function before any work is sent to the workers.
+        self._engine.compile(_function)
+
+        test_cases: list[TestCase] = []
+        fingerprints: set[bytes] = set()
+        uncovered_branches: set[int] = set(
+            _function.control_flow_graph.branch_edges)
+
+        trials, type_error = self.run_solved_trials(
+            _function, fingerprints, uncovered_branches)
+        if type_error is None:
+            concolic_trials, type_error = self.run_concolic_trials(
+                _function, fingerprints, uncovered_branches)
+            trials += concolic_trials
+        if type_error is None:
+            vectorized_trials, type_error = self.run_vectorized_trials(
+                _function, fingerprints, uncovered_branches)
+            trials += vectorized_trials
+        if type_error is None:
+            random_trials, type_error = self.run_trials(
+                _function, 0, self._batch_size, fingerprints, uncovered_branches)
+            trials += random_trials
+        if type_error is None:
+            search_trials, type_error = self.run_search_trials(
+                _function, fingerprints, uncovered_branches)
+            trials += search_trials
+        for arg_values, trial_result in trials:
+            test_cases.append(self.create_test_case(
+                _function, self._func_manager.arguments_to_str(arg_values), trial_result))
+
+        source: str = "\n".join(_function.code_lines)
+        if self.__executor is None:
+            self.preload(_function.module_context)
+            self.preload(source)
+        # The map has a byte per probe and a byte for the timeouts, it starts with the coverage of the trials of this process.
+        probe_count: int = len(_function.instrumented_code.source_map)
+        coverage_map: shared_memory.SharedMemory = shared_memory.SharedMemory(create=True, size=probe_count + 1)
+        pending: set[Future[Any]] = set()
+        try:
+            for test_case in test_cases:
+                for probe, value in enumerate(test_case.coverage_bitmap):
+                    if value:
+                        coverage_map.buf[probe] = 1
+                if test_case.outcome == "timeout":
+                    coverage_map.buf[probe_count] = 1
+
+            seeds: random.Random = random.Random()
+            check_point: int = 100_000
+            tried_counts: int = self._batch_size
+
+            while True:
+                while (
+                    len(pending) < self.__jobs * 2
+                    and tried_counts < check_point
+                    and type_error is None
+                    and (uncovered_branches or not test_cases)
+                    and not self.cancelled
+                ):
+                    chunk_end: int = min(
+                        tried_counts + self.__chunk_size, check_point)
+                    pending.add(self.executor.submit(
+                        ParallelTestManager.run_chunk,
+                        source,
+                        _function.module_context,
+                        _function.support_cases,
+                        _function.corpus,
+                        _function.observed_constants,
+                        self.__coverage_backend,
+                        (self._trial_timeout, self._trial_steps),
+                        seeds.getrandbits(64),
+                        tried_counts,
+                        chunk_end,
+                        coverage_map.name,
+                    ))
+                    tried_counts = chunk_end
+
+                if not pending:
+                    break
+
+                # The timeout lets a cancelled generation return without waiting for the running chunks.
+                done, pending = wait(
+                    pending, timeout=0.1, return_when=FIRST_COMPLETED)
+                for future in done:
+                    trials, chunk_type_error = future.result()
+                    type_error = type_error or chunk_type_error
+                    kept_values: list[tuple[Any, ...]] = []
+
+                    for arg_values, trial_result in trials:
+                        fingerprint: bytes = trial_result.fingerprint
+                        if fingerprint in fingerprints:
+                            continue
+                        fingerprints.add(fingerprint)
+
+                        bitmap: bytes = trial_result.coverage_bitmap
+                        uncovered_branches.difference_update(
+                            [branch for branch in uncovered_branches if bitmap[branch]])
+                        test_cases.append(self.create_test_case(
+                            _function, self._func_manager.arguments_to_str(arg_values), trial_result))
+                        if trial_result.timed_out:
+                            continue
+                        if arg_values not in _function.corpus:
+                            _function.corpus.append(arg_values)
+                            if len(_function.corpus) > self._corpus_size:
+                                del _function.corpus[0]
+                        kept_values.append(arg_values)
+
+                    if kept_values:
+                        self.log_comparisons(
+                            _function, self.run_batch(_function, kept_values, True))
+
+                if type_error is not None or self.cancelled or (not uncovered_branches and test_cases):
+                    break
+        finally:
+            # The chunks that did not start are dropped, and marking every probe as reached stops the running chunks
+            # after their current batch. The map is unlinked only when no worker uses it anymore.
+            for future in pending:
+                future.cancel()
+            coverage_map.buf[:probe_count] = b"\x01" * probe_count
+            wait(pending)
+            coverage_map.close()
+            coverage_map.unlink()
+
+        if type_error is not None:
+            self._message_handler("Type Error", str(type_error))
+
+        test_cases.sort(
+            key=lambda case: case.test_coverages_rate, reverse=True)
+        return test_cases
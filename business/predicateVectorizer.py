@@ -0,0 +1,282 @@
+"""
+This class compiles the path conditions of the numerical branches of a function into NumPy expressions and evaluates them over large candidate arrays.
+"""
+import ast
+import random
+from typing import Any, Callable
+from business.branchSolver import BranchSolver
+
+try:
+    import numpy
+except ImportError:  # NumPy is optional, the branches are left to the trials without it.
+    numpy = None
+
+
+class PredicateVectorizer:
+    """
+    This class compiles the path conditions of the numerical branches of a function into NumPy expressions and evaluates them over large candidate arrays.
+    Here's what each class method does:
+
+    - __init__: Initializes the vectorizer with the number of candidates of an evaluation.
+    - available: Gets whether NumPy is installed.
+    - compile: Compiles the path condition of every branch target of a function into a vectorized predicate.
+    - solve: Evaluates the vectorized predicates over candidate arrays and returns the first candidate that satisfies each one.
+    - __candidates: Draws the candidate array of an argument.
+    - __vectorize: Converts a condition into a NumPy expression that gives an array of booleans.
+    - __vectorize_value: Converts a numerical expression into a NumPy expression.
+
+    The path conditions are the ones of the branch solver, see BranchSolver.walk_paths, but any numerical expression of the arguments
+    is kept, `x % 7 == 3`, `x * x > y` or `abs(x - y) < 3`, which the linear solver can not model.
+    `and`, `or` and `not` become `&`, `|` and `numpy.logical_not`, so a condition is evaluated over a million candidates in a few array operations,
+    instead of a million calls of the function. The candidates are numbers of every magnitude and the mined literals of the function
+    with their neighbours. The array arithmetic is int64 and float64, so a candidate may overflow where Python would not,
+    the trial runner confirms every selected input before it is kept.
+    A path with a call other than abs, min and max, an argument assigned in the function or a string is skipped.
+
+    @category: Business Classes, Analyzer
+    @import: BranchSolver
+    @see: BranchSolver, CodeAnalyzer
+    """
+
+    __comparisons: tuple[type, ...] = (ast.Lt, ast.LtE, ast.Gt, ast.GtE, ast.Eq, ast.NotEq)
+    __operators: tuple[type, ...] = (ast.Add, ast.Sub, ast.Mult, ast.Div, ast.FloorDiv, ast.Mod, ast.Pow)
+    __calls: dict[str, tuple[str, int]] = {"abs": ("abs", 1), "min": ("minimum", 2), "max": ("maximum", 2)}
+
+    def __init__(self, _candidate_count: int = 1 << 20) -> None:
+        """
+        Initializes the vectorizer with the number of candidates of an evaluation.
+
+        Parameters:
+            _candidate_count (int): The number of candidate values of every argument. Defaults to 1 << 20.
+
+        Returns:
+            None
+
+        @category: Business Classes, Analyzer
+        """
+        self.__candidate_count: int = _candidate_count
+        self.__branch_solver: BranchSolver = BranchSolver()
+
+    @property
+    def available(self) -> bool:
+        """
+        Returns whether NumPy is installed.
+
+        Returns:
+            bool: True if the predicates can be vectorized, False otherwise.
+        """
+        return numpy is not None
+
+    def compile(self, _code_str: str, _arg_types: dict[str, Any]) -> list[tuple[list[str], Callable[..., Any]]]:
+        """
+        Compiles the path condition of every branch target of a function into a vectorized predicate.
+
+        Parameters:
+            _code_str (str): The code of the function.
+            _arg_types (dict[str, Any]): The type of every argument, None if the argument has no type.
+
+        Returns:
+            list[tuple[list[str], Callable[..., Any]]]: The arguments of every predicate that can be vectorized and the predicate,
+            which takes their candidate arrays as keyword arguments.
+        """
+        if numpy is None:
+            return []
+        try:
+            tree: ast.Module = ast.parse(_code_str)
+        except SyntaxError:
+            return []
+
+        function_node = next((node for node in tree.body if isinstance(
+            node, (ast.FunctionDef, ast.AsyncFunctionDef))), None)
+        if function_node is None:
+            return []
+
+        assigned: set[str] = {
+            node.id for node in ast.walk(function_node) if isinstance(node, ast.Name) and isinstance(node.ctx, ast.Store)
+        }
+        arguments: set[str] = {name for name, arg_type in _arg_types.items() if arg_type is not str} - assigned
+
+        paths: list[list[tuple[ast.expr, bool]]] = []
+        self.__branch_solver.walk_paths(function_node.body, [], paths)
+
+        predicates: dict[str, tuple[list[str], Callable[..., Any]]] = {}
+        for path in paths:
+            expressions: list[ast.expr] = []
+            for condition, polarity in path:
+                expression: ast.expr | None = self.__vectorize(condition, arguments)
+                if expression is None:
+                    break
+                expressions.append(expression if polarity else ast.UnaryOp(op=ast.Invert(), operand=expression))
+            else:
+                if not expressions:
+                    continue
+                body: ast.expr = expressions[0]
+                for expression in expressions[1:]:
+                    body = ast.BinOp(left=body, op=ast.BitAnd(), right=expression)
+                names: list[str] = sorted({node.id for node in ast.walk(body) if isinstance(
+                    node, ast.Name) and node.id in arguments})
+                source: str = ast.unparse(body)
+                if source not in predicates and names:
+                    lambda_source: str = f"lambda {', '.join(names)}: {source}"
+                    predicates[source] = (names, eval(lambda_source, {"numpy": numpy}))
+
+        return list(predicates.values())
+
+    def solve(
+        self,
+        _predicates: list[tuple[list[str], Callable[..., Any]]],
+        _arg_types: dict[str, Any],
+        _constants: list[int | float],
+    ) -> list[dict[str, Any]]:
+        """
+        Evaluates the vectorized predicates over candidate arrays and returns the first candidate that satisfies each one.
+
+        Parameters:
+            _predicates (list[tuple[list[str], Callable[..., Any]]]): The predicates returned by compile.
+            _arg_types (dict[str, Any]): The type of every argument, None if the argument has no type.
+            _constants (list[int | float]): The numbers mined from the function and observed in its comparisons.
+
+        Returns:
+            list[dict[str, Any]]: The values of the arguments of every predicate that a candidate satisfies.
+        """
+        if numpy is None or not _predicates:
+            return []
+
+        generator = numpy.random.default_rng(random.getrandbits(64))
+        candidates: dict[str, Any] = {}
+        solutions: list[dict[str, Any]] = []
+        with numpy.errstate(all="ignore"):
+            for names, predicate in _predicates:
+                for name in names:
+                    if name not in candidates:
+                        candidates[name] = self.__candidates(generator, _arg_types.get(name), _constants)
+                try:
+                    mask = numpy.broadcast_to(predicate(**{name: candidates[name] for name in names}), (self.__candidate_count,))
+                except (ArithmeticError, TypeError, ValueError):
+                    continue
+                index: int = int(numpy.argmax(mask))
+                if mask[index]:
+                    solutions.append({name: candidates[name][index].item() for name in names})
+        return solutions
+
+    def __candidates(self, _generator: Any, _arg_type: Any, _constants: list[int | float]) -> Any:
+        """
+        Draws the candidate array of an argument.
+        Three quarters are numbers of a random magnitude up to 2 ** 31, the rest are the mined numbers and their negations moved by -2 to 2.
+        A float argument also gets a random fraction.
+
+        Parameters:
+            _generator (numpy.random.Generator): The random generator, seeded from the random module.
+            _arg_type (Any): The type of the argument, None if the argument has no type.
+            _constants (list[int | float]): The mined numbers.
+
+        Returns:
+            numpy.ndarray: The candidates, int64 unless the argument is a float.
+        """
+        count: int = self.__candidate_count
+        shifts = 31 - _generator.integers(0, 32, count)
+        values = _generator.integers(-(1 << 31), 1 << 31, count) >> shifts
+        constants = [value for value in _constants if abs(value) < 1 << 31]
+        if _arg_type is float:
+            values = values + _generator.random(count)
+            constants = numpy.array(constants or [0.0], dtype=numpy.float64)
+        else:
+            constants = numpy.array([int(value) for value in constants] or [0], dtype=numpy.int64)
+
+        mined: int = count // 4
+        signs = _generator.choice(numpy.array([-1, 1]), mined)
+        values[:mined] = _generator.choice(constants, mined) * signs + _generator.integers(-2, 3, mined)
+        return values
+
+    def __vectorize(self, _condition: ast.expr, _arguments: set[str]) -> ast.expr | None:
+        """
+        Converts a condition into a NumPy expression that gives an array of booleans.
+
+        Parameters:
+            _condition (ast.expr): The condition.
+            _arguments (set[str]): The numerical arguments that are not assigned in the function.
+
+        Returns:
+            ast.expr | None: The expression, None if the condition can not be vectorized.
+        """
+        if isinstance(_condition, ast.BoolOp):
+            values: list[ast.expr | None] = [self.__vectorize(value, _arguments) for value in _condition.values]
+            if any(value is None for value in values):
+                return None
+            operator: ast.operator = ast.BitAnd() if isinstance(_condition.op, ast.And) else ast.BitOr()
+            expression: ast.expr = values[0]  # type: ignore
+            for value in values[1:]:
+                expression = ast.BinOp(left=expression, op=operator, right=value)  # type: ignore
+            return expression
+
+        if isinstance(_condition, ast.UnaryOp) and isinstance(_condition.op, ast.Not):
+            operand: ast.expr | None = self.__vectorize(_condition.operand, _arguments)
+            if operand is None:
+                return None
+            # A condition without arguments folds to a Python bool, and ~True is -2, logical_not negates both.
+            return ast.Call(
+                func=ast.Attribute(value=ast.Name(id="numpy", ctx=ast.Load()), attr="logical_not", ctx=ast.Load()),
+                args=[operand], keywords=[])
+
+        if isinstance(_condition, ast.Compare):
+            operands: list[ast.expr | None] = [self.__vectorize_value(operand, _arguments)
+                                                for operand in [_condition.left, *_condition.comparators]]
+            if any(operand is None for operand in operands) or not all(isinstance(op, self.__comparisons) for op in _condition.ops):
+                return None
+            comparisons: list[ast.expr] = [
+                ast.Compare(left=operands[index], ops=[op], comparators=[operands[index + 1]])  # type: ignore
+                for index, op in enumerate(_condition.ops)
+            ]
+            expression = comparisons[0]
+            for comparison in comparisons[1:]:
+                expression = ast.BinOp(left=expression, op=ast.BitAnd(), right=comparison)
+            return expression
+
+        value: ast.expr | None = self.__vectorize_value(_condition, _arguments)
+        if value is None:
+            return None
+        return ast.Compare(left=value, ops=[ast.NotEq()], comparators=[ast.Constant(value=0)])
+
+    def __vectorize_value(self, _node: ast.expr, _arguments: set[str]) -> ast.expr | None:
+        """
+        Converts a numerical expression into a NumPy expression.
+
+        Parameters:
+            _node (ast.expr): The expression.
+            _arguments (set[str]): The numerical arguments that are not assigned in the function.
+
+        Returns:
+            ast.expr | None: The expression, None if it is not a numerical expression of the arguments.
+        """
+        if isinstance(_node, ast.Constant):
+            if isinstance(_node.value, (int, float)) and abs(_node.value) < 1 << 62:
+                return ast.Constant(value=_node.value)
+            return None
+
+        if isinstance(_node, ast.Name):
+            return ast.Name(id=_node.id, ctx=ast.Load()) if _node.id in _arguments else None
+
+        if isinstance(_node, ast.UnaryOp) and isinstance(_node.op, (ast.USub, ast.UAdd)):
+            operand: ast.expr | None = self.__vectorize_value(_node.operand, _arguments)
+            return None if operand is None else ast.UnaryOp(op=_node.op, operand=operand)
+
+        if isinstance(_node, ast.BinOp) and isinstance(_node.op, self.__operators):
+            if isinstance(_node.op, ast.Pow) and not (
+                    isinstance(_node.right, ast.Constant) and type(_node.right.value) is int and 0 <= _node.right.value <= 8):
+                return None
+            left: ast.expr | None = self.__vectorize_value(_node.left, _arguments)
+            right: ast.expr | None = self.__vectorize_value(_node.right, _arguments)
+            if left is None or right is None:
+                return None
+            return ast.BinOp(left=left, op=_node.op, right=right)
+
+        if isinstance(_node, ast.Call) and isinstance(_node.func, ast.Name) and _node.func.id in self.__calls and not _node.keywords:
+            function_name, arg_count = self.__calls[_node.func.id]
+            args: list[ast.expr | None] = [self.__vectorize_value(arg, _arguments) for arg in _node.args]
+            if len(args) != arg_count or any(arg is None for arg in args):
+                return None
+            return ast.Call(
+                func=ast.Attribute(value=ast.Name(id="numpy", ctx=ast.Load()), attr=function_name, ctx=ast.Load()),
+                args=args, keywords=[])  # type: ignore
+
+        return None
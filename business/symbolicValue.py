@@ -0,0 +1,305 @@
+"""
+These classes are the symbolic argument values of a concolic run, they compute like their concrete values and track a linear expression over the arguments.
+"""
+from typing import Any, Callable
+
+
+class SymbolicValue:
+    """
+    This class is the base class of the symbolic argument values of a concolic run.
+    Here's what each class method does:
+
+    - coefficients: Gets the coefficient of every argument in the expression of the value.
+    - constant: Gets the constant of the expression of the value.
+    - linear: Returns the linear expression of a symbolic or a concrete number.
+    - create: Creates the symbolic value of a concrete result with the given expression.
+
+    A symbolic number is an int or a float, so the tested function computes with it as usual. Addition, subtraction,
+    negation and multiplication or division by a concrete number keep the expression linear, every other operation
+    returns a plain number, so the expression is dropped where it can not be modelled and the run goes on concretely.
+
+    @category: Business Classes, Analyzer
+    """
+
+    _coefficients: dict[str, float]
+    _constant: float
+
+    @property
+    def coefficients(self) -> dict[str, float]:
+        """
+        Returns the coefficient of every argument in the expression of the value.
+
+        Returns:
+            dict[str, float]: The coefficients, keyed by argument name.
+        """
+        return self._coefficients
+
+    @property
+    def constant(self) -> float:
+        """
+        Returns the constant of the expression of the value.
+
+        Returns:
+            float: The constant.
+        """
+        return self._constant
+
+    @staticmethod
+    def linear(_value: Any) -> tuple[dict[str, float], float] | None:
+        """
+        Returns the linear expression of a symbolic or a concrete number.
+
+        Parameters:
+            _value (Any): The value.
+
+        Returns:
+            tuple[dict[str, float], float] | None: The coefficients and the constant, None if the value is not a number
+            or an int beyond the float range.
+        """
+        if isinstance(_value, (SymbolicInt, SymbolicFloat)):
+            return _value.coefficients, _value.constant
+        if type(_value) in (int, float, bool):
+            try:
+                return {}, float(_value)
+            except OverflowError:
+                return None
+        return None
+
+    @staticmethod
+    def create(_concrete: Any, _coefficients: dict[str, float], _constant: float) -> Any:
+        """
+        Creates the symbolic value of a concrete result with the given expression.
+
+        Parameters:
+            _concrete (Any): The concrete result.
+            _coefficients (dict[str, float]): The coefficients of the expression, the zero coefficients are dropped.
+            _constant (float): The constant of the expression.
+
+        Returns:
+            Any: A symbolic int or float, or the concrete result if the expression holds no argument.
+        """
+        coefficients: dict[str, float] = {
+            name: value for name, value in _coefficients.items() if value}
+        if not coefficients:
+            return _concrete
+        if type(_concrete) is int:
+            return SymbolicInt(_concrete, coefficients, _constant)
+        if type(_concrete) is float:
+            return SymbolicFloat(_concrete, coefficients, _constant)
+        return _concrete
+
+
+def _concrete(_value: Any) -> Any:
+    """
+    Returns the plain number of a symbolic number.
+
+    Parameters:
+        _value (Any): The value.
+
+    Returns:
+        Any: The plain int or float, or the value itself.
+    """
+    if isinstance(_value, SymbolicInt):
+        return int(_value)
+    if isinstance(_value, SymbolicFloat):
+        return float(_value)
+    return _value
+
+
+def _combine(_left: Any, _right: Any, _operation: Callable[[Any, Any], Any], _kind: str) -> Any:
+    """
+    Computes an operation of two numbers and the expression of its result.
+
+    Parameters:
+        _left (Any): The left operand.
+        _right (Any): The right operand.
+        _operation (Callable[[Any, Any], Any]): The concrete operation.
+        _kind (str): "add", "sub", "mul" or "div".
+
+    Returns:
+        Any: The result, symbolic while it is linear, NotImplemented if the operands do not support the operation.
+    """
+    try:
+        concrete: Any = _operation(_concrete(_left), _concrete(_right))
+    except TypeError:
+        return NotImplemented
+
+    left = SymbolicValue.linear(_left)
+    right = SymbolicValue.linear(_right)
+    if left is None or right is None:
+        return concrete
+
+    (left_coefficients, left_constant), (right_coefficients, right_constant) = left, right
+    if _kind in ("add", "sub"):
+        sign: int = 1 if _kind == "add" else -1
+        coefficients: dict[str, float] = dict(left_coefficients)
+        for name, value in right_coefficients.items():
+            coefficients[name] = coefficients.get(name, 0.0) + sign * value
+        return SymbolicValue.create(concrete, coefficients, left_constant + sign * right_constant)
+
+    if _kind == "mul" and not (left_coefficients and right_coefficients):
+        scale, (coefficients, constant) = (right_constant, left) if left_coefficients else (left_constant, right)
+        return SymbolicValue.create(concrete, {name: value * scale for name, value in coefficients.items()}, constant * scale)
+
+    if _kind == "div" and not right_coefficients and right_constant:
+        return SymbolicValue.create(
+            concrete, {name: value / right_constant for name, value in left_coefficients.items()}, left_constant / right_constant)
+
+    return concrete
+
+
+class SymbolicInt(SymbolicValue, int):
+    """
+    This class is a symbolic int argument value of a concolic run.
+
+    - __new__: Creates the int with its expression.
+    - __add__, __radd__, __sub__, __rsub__, __mul__, __rmul__, __truediv__, __rtruediv__, __neg__, __pos__:
+    Compute the result and its expression.
+
+    @category: Business Classes, Analyzer
+    """
+
+    def __new__(cls, _value: int, _coefficients: dict[str, float], _constant: float = 0.0) -> "SymbolicInt":
+        """
+        Creates the int with its expression.
+
+        Parameters:
+            _value (int): The concrete value.
+            _coefficients (dict[str, float]): The coefficient of every argument in the expression.
+            _constant (float): The constant of the expression. Defaults to 0.
+
+        Returns:
+            SymbolicInt: The symbolic int.
+        """
+        instance: SymbolicInt = int.__new__(cls, _value)
+        instance._coefficients = _coefficients
+        instance._constant = _constant
+        return instance
+
+    def __add__(self, other: Any) -> Any:
+        return _combine(self, other, lambda left, right: left + right, "add")
+
+    def __radd__(self, other: Any) -> Any:
+        return _combine(other, self, lambda left, right: left + right, "add")
+
+    def __sub__(self, other: Any) -> Any:
+        return _combine(self, other, lambda left, right: left - right, "sub")
+
+    def __rsub__(self, other: Any) -> Any:
+        return _combine(other, self, lambda left, right: left - right, "sub")
+
+    def __mul__(self, other: Any) -> Any:
+        return _combine(self, other, lambda left, right: left * right, "mul")
+
+    def __rmul__(self, other: Any) -> Any:
+        return _combine(other, self, lambda left, right: left * right, "mul")
+
+    def __truediv__(self, other: Any) -> Any:
+        return _combine(self, other, lambda left, right: left / right, "div")
+
+    def __rtruediv__(self, other: Any) -> Any:
+        return _combine(other, self, lambda left, right: left / right, "div")
+
+    def __neg__(self) -> Any:
+        return _combine(0, self, lambda left, right: left - right, "sub")
+
+    def __pos__(self) -> Any:
+        return self
+
+
+class SymbolicFloat(SymbolicValue, float):
+    """
+    This class is a symbolic float argument value of a concolic run.
+
+    - __new__: Creates the float with its expression.
+    - __add__, __radd__, __sub__, __rsub__, __mul__, __rmul__, __truediv__, __rtruediv__, __neg__, __pos__:
+    Compute the result and its expression.
+
+    @category: Business Classes, Analyzer
+    """
+
+    def __new__(cls, _value: float, _coefficients: dict[str, float], _constant: float = 0.0) -> "SymbolicFloat":
+        """
+        Creates the float with its expression.
+
+        Parameters:
+            _value (float): The concrete value.
+            _coefficients (dict[str, float]): The coefficient of every argument in the expression.
+            _constant (float): The constant of the expression. Defaults to 0.
+
+        Returns:
+            SymbolicFloat: The symbolic float.
+        """
+        instance: SymbolicFloat = float.__new__(cls, _value)
+        instance._coefficients = _coefficients
+        instance._constant = _constant
+        return instance
+
+    def __add__(self, other: Any) -> Any:
+        return _combine(self, other, lambda left, right: left + right, "add")
+
+    def __radd__(self, other: Any) -> Any:
+        return _combine(other, self, lambda left, right: left + right, "add")
+
+    def __sub__(self, other: Any) -> Any:
+        return _combine(self, other, lambda left, right: left - right, "sub")
+
+    def __rsub__(self, other: Any) -> Any:
+        return _combine(other, self, lambda left, right: left - right, "sub")
+
+    def __mul__(self, other: Any) -> Any:
+        return _combine(self, other, lambda left, right: left * right, "mul")
+
+    def __rmul__(self, other: Any) -> Any:
+        return _combine(other, self, lambda left, right: left * right, "mul")
+
+    def __truediv__(self, other: Any) -> Any:
+        return _combine(self, other, lambda left, right: left / right, "div")
+
+    def __rtruediv__(self, other: Any) -> Any:
+        return _combine(other, self, lambda left, right: left / right, "div")
+
+    def __neg__(self) -> Any:
+        return _combine(0.0, self, lambda left, right: left - right, "sub")
+
+    def __pos__(self) -> Any:
+        return self
+
+
+class SymbolicStr(SymbolicValue, str):
+    """
+    This class is a symbolic str argument value of a concolic run.
+    Only the argument itself is symbolic, every string operation returns a plain str.
+
+    - __new__: Creates the str with the name of its argument.
+    - name: Gets the name of the argument.
+
+    @category: Business Classes, Analyzer
+    """
+
+    def __new__(cls, _value: str, _name: str) -> "SymbolicStr":
+        """
+        Creates the str with the name of its argument.
+
+        Parameters:
+            _value (str): The concrete value.
+            _name (str): The name of the argument.
+
+        Returns:
+            SymbolicStr: The symbolic str.
+        """
+        instance: SymbolicStr = str.__new__(cls, _value)
+        instance._coefficients = {}
+        instance._constant = 0.0
+        instance.__name = _name
+        return instance
+
+    @property
+    def name(self) -> str:
+        """
+        Returns the name of the argument.
+
+        Returns:
+            str: The name of the argument.
+        """
+        return self.__name
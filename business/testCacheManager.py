@@ -0,0 +1,257 @@
+"""
+The TestCacheManager class is responsible for reusing the test case pools generated for unchanged functions.
+"""
+import ast
+import hashlib
+import json
+from typing import Any
+from dataAccess.testCacheDal import TestCacheDal
+from entity.function import Function
+from entity.testCase import TestCase
+
+
+class TestCacheManager:
+    """The TestCacheManager class is responsible for reusing the test case pools generated for unchanged functions.
+    Here's what each class method does:
+
+    - __init__(_directory: str, _max_bytes: int): Initializes a new instance of the class and creates an instance of the TestCacheDal class.
+    - key(_function: Function, _settings: dict[str, Any]) -> str: Returns the cache key of a function and the settings of its generation.
+    - load_test_cases(_function: Function, _settings: dict[str, Any]) -> bool: Adds the cached test case pools and corpus of a function to it.
+    - save_test_cases(_function: Function, _settings: dict[str, Any]) -> bool: Saves the test case pools and corpus of a function to the cache.
+    - __context_digest(_module_context: str, _code_str: str) -> bytes: Returns the digest of the part of a module a function depends on.
+    - __module_parts(_module_context: str) -> tuple[bytes, dict | None]: Splits a module into the digest of its other statements and its definitions.
+    - __referenced_names(_node: ast.AST) -> list[str]: Returns the names a piece of code refers to.
+    - __test_case_to_entry(_test_case: TestCase) -> dict[str, Any]: Converts a test case into a cache entry.
+    - __entry_to_test_case(_entry: dict[str, Any]) -> TestCase: Converts a cache entry into a test case.
+
+    The cache is content addressed, the key is a blake2b digest of the source of the function, of the part of the module it depends on
+    and of the settings of the generation, so a changed function, dependency or setting gets a new key instead of a stale entry.
+    The source is hashed as it is, the tested lines of the entries are indexes into the code lines, so a formatting edit changes the key.
+    The part of the module is its imports, constants and other statements that are not definitions, and the functions and classes
+    the function refers to by name, followed through the definitions they refer to, so an edit to an unrelated function of the module
+    keeps the key. A dependency that is not named, for example a function reached through getattr or globals(), is not followed. A cache hit reads one compressed file,
+    the function is still parsed and instrumented from its source, which takes milliseconds, and its trials are not run again.
+
+    @category: Business, Manager
+    @import: TestCacheDal, Function, TestCase
+    @see: TestCacheDal, Function, TestCase
+    """
+
+    # The version of the entries, it changes when the instrumentation or the format of the entries changes.
+    __format_version: int = 2
+
+    def __init__(self, _directory: str, _max_bytes: int = 256 * 1024 * 1024) -> None:
+        """
+        Initializes a new instance of the class.
+
+        Parameters:
+            _directory (str): The directory of the cache.
+            _max_bytes (int): The size cap of the cache in bytes, the least recently used entries are evicted above it. Defaults to 256 MiB.
+
+        Returns:
+            None
+
+        @category: Business, Manager
+        @import: TestCacheDal
+        @see: TestCacheDal
+        """
+        self._tc = TestCacheDal(_directory, _max_bytes)
+        self.__module_digests: dict[str, tuple[bytes, dict[str, list[tuple[str, list[str]]]] | None]] = {}
+
+    def key(self, _function: Function, _settings: dict[str, Any]) -> str:
+        """
+        Returns the cache key of a function and the settings of its generation.
+
+        Args:
+            _function (Function): The function.
+            _settings (dict[str, Any]): The settings that change the generated test cases, they must be serializable to JSON.
+
+        Returns:
+            str: The hexadecimal key.
+        """
+        code_str: str = "\n".join(_function.code_lines)
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(str(self.__format_version).encode())
+        digest.update(self.__context_digest(_function.module_context, code_str))
+        for text in (
+            code_str,
+            repr(_function.support_cases),
+            json.dumps(_settings, sort_keys=True),
+        ):
+            digest.update(b"\0" + text.encode("utf-8"))
+        return digest.hexdigest()
+
+    def load_test_cases(self, _function: Function, _settings: dict[str, Any]) -> bool:
+        """
+        Adds the cached test case pools and corpus of a function to it.
+
+        Args:
+            _function (Function): The function, its code and module context must be set.
+            _settings (dict[str, Any]): The settings of the generation.
+
+        Returns:
+            bool: True if the cache had the test cases of the function, False otherwise.
+        """
+        entry: dict[str, Any] | None = self._tc.load_entry(self.key(_function, _settings))
+        if entry is None:
+            return False
+
+        try:
+            pools: list[list[TestCase]] = [
+                [self.__entry_to_test_case(case) for case in pool] for pool in entry["pools"]]
+            corpus: list[tuple[Any, ...]] = [tuple(values) for values in entry["corpus"]]
+        except (KeyError, TypeError, ValueError):
+            return False
+
+        for pool in pools:
+            _function.add_test_case = pool
+        _function.corpus = corpus
+        return True
+
+    def save_test_cases(self, _function: Function, _settings: dict[str, Any]) -> bool:
+        """
+        Saves the test case pools and corpus of a function to the cache.
+        The inputs of the corpus that are not JSON values are left out.
+
+        Args:
+            _function (Function): The tested function.
+            _settings (dict[str, Any]): The settings of the generation.
+
+        Returns:
+            bool: True if the test cases were successfully saved, False otherwise.
+        """
+        entry: dict[str, Any] = {
+            "signature": _function.signature,
+            "pools": [[self.__test_case_to_entry(case) for case in pool] for pool in _function.test_cases],
+            "corpus": [
+                list(values) for values in _function.corpus
+                if all(value is None or isinstance(value, (bool, int, float, str)) for value in values)
+            ],
+        }
+        return self._tc.save_entry(self.key(_function, _settings), entry)
+
+    def __context_digest(self, _module_context: str, _code_str: str) -> bytes:
+        """
+        Returns the digest of the part of a module a function depends on: the module level statements that are not definitions,
+        such as the imports and the constants, and the definitions the function refers to by name, with the definitions they refer to.
+        An edit to another function of the module keeps the key.
+
+        Args:
+            _module_context (str): The source of the module, empty for a function that stands alone.
+            _code_str (str): The code of the function.
+
+        Returns:
+            bytes: The blake2b digest of the statements, the digest of the whole module if the function or the module can not be parsed.
+        """
+        prelude, definitions = self.__module_parts(_module_context)
+        try:
+            pending: list[str] = self.__referenced_names(ast.parse(_code_str))
+        except (SyntaxError, ValueError):
+            pending = list(definitions) if definitions is not None else []
+        if definitions is None:
+            return prelude
+
+        digest = hashlib.blake2b(prelude, digest_size=16)
+        visited: set[str] = set()
+        while pending:
+            name: str = pending.pop()
+            if name in visited or name not in definitions:
+                continue
+            visited.add(name)
+            for source, names in definitions[name]:
+                digest.update(b"\0" + source.encode("utf-8"))
+                pending += names
+        return digest.digest()
+
+    def __module_parts(self, _module_context: str) -> tuple[bytes, dict[str, list[tuple[str, list[str]]]] | None]:
+        """
+        Splits a module into the digest of its module level statements that are not definitions and its definitions,
+        it is computed once per module and shared by the keys of its functions. The parts of the last 64 modules are kept.
+
+        Args:
+            _module_context (str): The source of the module.
+
+        Returns:
+            tuple[bytes, dict[str, list[tuple[str, list[str]]]] | None]: The blake2b digest of the statements that are not definitions,
+            and the source and the referenced names of every function or class definition keyed by its name,
+            None if the module can not be parsed, then the digest covers the whole module.
+        """
+        parts: tuple[bytes, dict[str, list[tuple[str, list[str]]]] | None] | None = self.__module_digests.get(_module_context)
+        if parts is not None:
+            return parts
+
+        digest = hashlib.blake2b(digest_size=16)
+        definitions: dict[str, list[tuple[str, list[str]]]] | None = {}
+        try:
+            tree: ast.Module = ast.parse(_module_context)
+        except (SyntaxError, ValueError):
+            digest.update(_module_context.encode("utf-8"))
+            definitions = None
+        else:
+            lines: list[str] = _module_context.splitlines()
+            for node in tree.body:
+                # The decorators are a part of the definition.
+                first_line: int = min([node.lineno] + [decorator.lineno for decorator in getattr(node, "decorator_list", [])])
+                source: str = "\n".join(lines[first_line - 1:node.end_lineno])
+                if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)):
+                    definitions.setdefault(node.name, []).append((source, self.__referenced_names(node)))
+                else:
+                    digest.update(b"\0" + source.encode("utf-8"))
+
+        parts = digest.digest(), definitions
+        if len(self.__module_digests) >= 64:
+            del self.__module_digests[next(iter(self.__module_digests))]
+        self.__module_digests[_module_context] = parts
+        return parts
+
+    def __referenced_names(self, _node: ast.AST) -> list[str]:
+        """
+        Returns the names a piece of code refers to.
+
+        Args:
+            _node (ast.AST): The parsed code.
+
+        Returns:
+            list[str]: The names that are read, without duplicates.
+        """
+        return list(dict.fromkeys(node.id for node in ast.walk(_node) if isinstance(node, ast.Name)))
+
+    def __test_case_to_entry(self, _test_case: TestCase) -> dict[str, Any]:
+        """
+        Converts a test case into a cache entry.
+
+        Args:
+            _test_case (TestCase): The test case.
+
+        Returns:
+            dict[str, Any]: The attributes of the test case as JSON values, the coverage bitmap as hexadecimal text.
+        """
+        return {
+            "test_values": _test_case.test_values,
+            "tested_lines": _test_case.tested_lines,
+            "tested_branches_count": _test_case.tested_branches_count,
+            "covered_edges": [list(edge) for edge in sorted(_test_case.covered_edges)],
+            "test_coverages_rate": _test_case.test_coverages_rate,
+            "coverage_bitmap": _test_case.coverage_bitmap.hex(),
+            "outcome": _test_case.outcome,
+        }
+
+    def __entry_to_test_case(self, _entry: dict[str, Any]) -> TestCase:
+        """
+        Converts a cache entry into a test case.
+
+        Args:
+            _entry (dict[str, Any]): The cache entry, see __test_case_to_entry.
+
+        Returns:
+            TestCase: The test case.
+        """
+        test_case: TestCase = TestCase()
+        test_case.test_values = _entry["test_values"]
+        test_case.tested_lines = list(_entry["tested_lines"])
+        test_case.tested_branches_count = int(_entry["tested_branches_count"])
+        test_case.covered_edges = {(int(edge[0]), int(edge[1])) for edge in _entry["covered_edges"]}
+        test_case.test_coverages_rate = float(_entry["test_coverages_rate"])
+        test_case.coverage_bitmap = bytes.fromhex(_entry["coverage_bitmap"])
+        test_case.outcome = _entry["outcome"]
+        return test_case
@@ -2,12 +2,21 @@
 This class is a test manager that provides methods for executing code, generating test cases, and calculating the number of tested branches in a given set of code lines.
 """
 import random
-from typing import Any
+import sys
+import threading
+from typing import Any, Callable
 from business.functionManager import FunctionManager
 from business.codeManager import CodeManaager
+from business.executionEngine import ExecutionEngine
+from business.branchSolver import BranchSolver
+from business.inputMutator import InputMutator
+from business.branchDistance import BranchDistance
+from business.concolicExecutor import ConcolicExecutor
+from business.predicateVectorizer import PredicateVectorizer
 from entity.function import Function
+from entity.controlFlowGraph import ControlFlowGraph
 from entity.testCase import TestCase
-from core.showMessageBox import ShowMessageBox
+from entity.trialResult import TrialResult
 
 
 class TestManager:
@@ -15,112 +24,654 @@ class TestManager:
     This class is a test manager that provides methods for executing code, generating test cases, and calculating the number of tested branches in a given set of code lines. 
     Here's what each class method does:
 
-    - __init__: Initializes a new instance of the class and sets up the function manager, code manager, and show message box objects.
-    - lcl: Retrieves the last code line from the code manager.
-    - execute_code: Executes the given code and returns the value of the last executed line.
-    - get_tested_bracnhed_count: Calculates the number of tested branch counts based on the given code lines and the current line number.
-    - generate_test_cases: Generates test cases for a given function by randomly selecting argument values and checking the number of tested branches.
+    - __init__: Initializes a new instance of the class and sets up the function manager, code manager, execution engine, and the message handler.
+    - cancelled: Gets or sets whether the running test case generation is cancelled.
+    - message_handler: Gets or sets the callable that shows the messages of the test case generation.
+    - settings: Gets the settings of the test case generation, the ones that change the generated test cases.
+    - create_test_case: Creates a test case from the coverage of a trial.
+    - covers_all_branches: Checks whether the given test cases reach every branch target of the function together.
+    - run_trials: Runs random trials of a function in batches until every branch target is reached or the trial budget is used.
+    - admit_batch: Runs a batch of trials and keeps the trials with a new coverage fingerprint.
+    - admit_results: Keeps the trials of a batch that ran with a new coverage fingerprint.
+    - log_comparisons: Adds the operands the comparisons of trials compared to the observed constants of the function.
+    - run_solved_trials: Runs the trials the branch solver computes from the constraints of the branches of the function.
+    - run_vectorized_trials: Runs the trials whose inputs NumPy selects for the path conditions of the numerical branches of the function.
+    - run_concolic_trials: Runs the function with symbolic arguments and flips the comparisons of its paths one at a time.
+    - run_search_trials: Searches inputs for the uncovered branches of the conditions by their branch distance.
+    - __neighbours: Returns the inputs next to an input of the search.
+    - run_batch: Runs a batch of trials of a function in one driver loop of the execution engine.
+    - generate_test_cases: Generates test cases for a given function by randomly selecting argument values and admitting the trials with a new coverage fingerprint.
+    - generate_test_pools: Generates the test case pools of a function, the pools that reach every branch together are added to it.
+    The inputs the branch solver computes for numerical branches are tried first, then the concolic runs flip the comparisons
+    of the paths the function took. The path conditions of numerical branches the linear solver can not model are evaluated
+    with NumPy over a million candidates at once, and the random trials reach the rest.
+    A share of every batch mutates the corpus of the function, the inputs that reached new coverage, which reaches nested branches
+    far sooner than fresh random values. The corpus is kept on the function, so the next pools start from it.
+    The kept trials run once more with the comparisons recorded, and the operands they compared at run time, computed values
+    the constant miner can not see in the code, are fed back to the input generator next to the mined literals.
+    After the first random batch, the branches of the conditions that are still not reached are searched by hill climbing
+    on their branch distance, which finds the equality branches over wide ranges that random trials miss.
+    The function is compiled once by the execution engine and called directly with the argument values on every trial.
+    The coverage of a trial is the branch edges of the control flow graph it traversed, read from the coverage bitmap of the engine.
+    Trials are compared by the fingerprint of their coverage bitmap, so inputs that take different paths are kept apart.
+    The test manager does not depend on a user interface, the messages are shown by the message handler, they are written to stderr by default.
+    The cancel flag is checked between batches, so a cancelled generation stops within one batch even when it runs on another thread.
+    Every trial runs within a wall clock timeout and a step budget, an input that does not end becomes a test case with the "timeout" outcome.
 
     @category: Business Classes, Manager
-    @import: FunctionManager, CodeManaager, Funciton, TextCase, ShowMessageBox
-    @see: FunctionManager, CodeManaager, Funciton, TextCase, ShowMessageBox
+    @import: FunctionManager, CodeManaager, ExecutionEngine, BranchSolver, InputMutator, BranchDistance, ConcolicExecutor, PredicateVectorizer, Funciton, TextCase, TrialResult
+    @see: FunctionManager, CodeManaager, ExecutionEngine, BranchSolver, InputMutator, BranchDistance, ConcolicExecutor, PredicateVectorizer, Funciton, TextCase, TrialResult
     """
 
-    def __init__(self) -> None:
+    def __init__(
+        self,
+        _coverage_backend: str = "probe",
+        _batch_size: int = 256,
+        _message_handler: Callable[[str, str], None] | None = None,
+        _mutation_rate: float = 0.5,
+        _corpus_size: int = 256,
+        _search_generations: int = 64,
+        _concolic_executions: int = 64,
+        _trial_timeout: float = 1.0,
+        _trial_steps: int = 1_000_000,
+    ) -> None:
         """
         Initializes a new instance of the class.
 
         Parameters:
-            None
+            _coverage_backend (str): The name of the coverage backend of the execution engine. Defaults to "probe".
+            _batch_size (int): The number of trials that run in one batch. Defaults to 256.
+            _message_handler (Callable[[str, str], None] | None): The callable that shows the messages, it takes the title and the message.
+            Defaults to writing the messages to stderr.
+            _mutation_rate (float): The share of the random trials of a batch that mutate the corpus, 0 turns the mutations off. Defaults to 0.5.
+            _corpus_size (int): The number of inputs the corpus of a function keeps, the oldest input is dropped first. Defaults to 256.
+            _search_generations (int): The number of moves of the branch distance search for every uncovered branch,
+            0 turns the search off. Defaults to 64.
+            _concolic_executions (int): The number of concolic runs of a function, 0 turns the concolic runs off. Defaults to 64.
+            _trial_timeout (float): The wall clock timeout of a trial in seconds, 0 turns it off. Defaults to 1.
+            _trial_steps (int): The step limit of a trial, loop iterations and calls, 0 turns it off. Defaults to 1_000_000.
 
         Returns:
             None
         
         @category: Business Classes, Manager
-        @import: FunctionManager, CodeManaager, Funciton, TextCase, ShowMessageBox
-        @see: FunctionManager, CodeManaager, Funciton, TextCase, ShowMessageBox
+        @import: FunctionManager, CodeManaager, ExecutionEngine, BranchSolver, InputMutator, BranchDistance, ConcolicExecutor, PredicateVectorizer, Funciton, TextCase
+        @see: FunctionManager, CodeManaager, ExecutionEngine, BranchSolver, InputMutator, BranchDistance, ConcolicExecutor, PredicateVectorizer, Funciton, TextCase
         """
         self._func_manager = FunctionManager()
         self._code_manager = CodeManaager()
-        self._smb = ShowMessageBox()
+        self._engine = ExecutionEngine(
+            _coverage_backend, _trial_timeout, _trial_steps)
+        self._trial_timeout: float = _trial_timeout
+        self._trial_steps: int = _trial_steps
+        self._branch_solver = BranchSolver()
+        self._mutator = InputMutator()
+        self._branch_distance = BranchDistance()
+        self._concolic_executor = ConcolicExecutor(self._branch_solver)
+        self._predicate_vectorizer = PredicateVectorizer()
+        self._batch_size: int = _batch_size
+        self._mutation_rate: float = _mutation_rate
+        self._corpus_size: int = _corpus_size
+        self._search_generations: int = _search_generations
+        self._concolic_executions: int = _concolic_executions
+        self._cancel_event: threading.Event = threading.Event()
+        self._message_handler: Callable[[str, str], None] = _message_handler or self.__write_message
+
+    def __write_message(self, _title: str, _message: str) -> None:
+        """
+        Writes a message of the test case generation to stderr.
+
+        Parameters:
+            _title (str): The title of the message.
+            _message (str): The message.
+
+        Returns:
+            None
+        """
+        print(f"{_title}: {_message}", file=sys.stderr)
 
     @property
-    def lcl(self) -> str:
+    def cancelled(self) -> bool:
         """
-        Retrieve the last code line from the code manager.
+        Returns whether the running test case generation is cancelled.
 
         Returns:
-            str: The last code line as a string.
+            bool: True if the generation is cancelled, False otherwise.
         """
-        return self._code_manager.last_code_line
+        return self._cancel_event.is_set()
 
-    def execute_code(self, _code_with_contents: str) -> Any:
+    @cancelled.setter
+    def cancelled(self, _cancelled: bool) -> None:
         """
-        Execute the given code and return the value of the last executed line.
+        Cancels the running test case generation or clears the cancel flag.
 
         Parameters:
-            _code_with_contents (str): The code to be executed.
+            _cancelled (bool): True to cancel the generation, False to clear the cancel flag.
 
         Returns:
-            Any: The value of the last executed line.
+            None
         """
-        exec_content: dict[Any, Any] = {}
-        exec(_code_with_contents, exec_content)
-        return exec_content.get(self._code_manager.last_code_line)
+        if _cancelled:
+            self._cancel_event.set()
+        else:
+            self._cancel_event.clear()
 
-    def get_tested_bracnhed_count(self, _code_lines: list[str], _current_line: int) -> int:
+    @property
+    def message_handler(self) -> Callable[[str, str], None]:
         """
-        Calculate the number of tested branched counts based on the given code lines and current line.
+        Returns the callable that shows the messages of the test case generation.
+
+        Returns:
+            Callable[[str, str], None]: The callable, it takes the title and the message.
+        """
+        return self._message_handler
+
+    @message_handler.setter
+    def message_handler(self, _message_handler: Callable[[str, str], None]) -> None:
+        """
+        Sets the callable that shows the messages of the test case generation.
 
         Parameters:
-            _code_lines (list[str]): The list of code lines to analyze.
-            _current_line (int): The current line number.
+            _message_handler (Callable[[str, str], None]): The callable, it takes the title and the message.
 
         Returns:
-            int: The number of tested branched counts.
+            None
         """
+        self._message_handler = _message_handler
 
-        line_count: int = 0
-        last_line_spaces_count: int = 0
-        branch_line_spaces_count: int = 0
-        tested_branched_counts: int = 0
+    @property
+    def settings(self) -> dict[str, Any]:
+        """
+        Returns the settings of the test case generation, the ones that change the generated test cases.
 
-        left_space_loop = 1024
-        branc_line: str = ""
-        for line in _code_lines:
-            if self._code_manager.is_branched_line(line):
-                branch_line_spaces_count = self._code_manager.left_space_count(
-                    line)
+        Returns:
+            dict[str, Any]: The coverage backend, the search parameters and the trial budget.
+        """
+        return {
+            "coverage_backend": self._engine.coverage_backend,
+            "batch_size": self._batch_size,
+            "mutation_rate": self._mutation_rate,
+            "corpus_size": self._corpus_size,
+            "search_generations": self._search_generations,
+            "concolic_executions": self._concolic_executions,
+            "trial_timeout": self._trial_timeout,
+            "trial_steps": self._trial_steps,
+        }
+
+    def create_test_case(self, _function: Function, _test_values: str, _trial_result: TrialResult) -> TestCase:
+        """
+        Creates a test case from the coverage of a trial.
+        The coverage rate is the share of the branch edges the trial traversed, code without branches is fully covered
+        by a trial that returns, and the tested lines are the lines the trial executed.
 
-                branc_line = line
-                left_space = self._code_manager.left_space_count(line)
-                if "for " in line or "while " in line:
-                    left_space_loop = self._code_manager.left_space_count(line)
+        Parameters:
+            _function (Function): The tested function.
+            _test_values (str): The string representation of the argument values of the trial.
+            _trial_result (TrialResult): The coverage of the trial.
 
-                    line_count += 1
-                    continue
-                if left_space > left_space_loop:
-                    line_count += 1
-                    continue
+        Returns:
+            TestCase: The test case.
+        """
+        control_flow_graph: ControlFlowGraph = _function.control_flow_graph
+        covered_edges: set[tuple[int, int]] = control_flow_graph.covered_arcs(_trial_result.coverage_bitmap)
+        executed_lines: list[int] = sorted(
+            line for line in _trial_result.executed_lines if 0 < line <= _function.code_lines_count)
+
+        test_case: TestCase = TestCase()
+        test_case.test_values = _test_values
+        test_case.tested_lines = [_function.code_lines[line - 1] for line in executed_lines]
+        test_case.tested_branches_count = len(covered_edges)
+        test_case.covered_edges = covered_edges
+        if control_flow_graph.branch_count:
+            test_case.test_coverages_rate = round(
+                (len(covered_edges) / control_flow_graph.branch_count) * 100, 2)
+        elif not _trial_result.timed_out:
+            # Code without branches has a single path, a trial that returns takes all of it.
+            test_case.test_coverages_rate = 100.0
+        elif _function.code_lines_count:
+            test_case.test_coverages_rate = round(
+                (len(executed_lines) / _function.code_lines_count) * 100, 2)
+        test_case.coverage_bitmap = _trial_result.coverage_bitmap
+        test_case.outcome = "timeout" if _trial_result.timed_out else "return"
+        return test_case
 
-                tested_branched_counts += 1
-            line_count += 1
-            if line_count == _current_line:
-                last_line_spaces_count = self._code_manager.left_space_count(
-                    line)
-                break
-        if (
-            last_line_spaces_count == branch_line_spaces_count
-            and last_line_spaces_count >= 8
-            and not ("for " in branc_line or "while " in branc_line)
+    def covers_all_branches(self, _function: Function, _test_cases: list[TestCase]) -> bool:
+        """
+        Checks whether the given test cases reach every branch target of the function together.
+
+        Parameters:
+            _function (Function): The tested function.
+            _test_cases (list[TestCase]): The test cases to check.
+
+        Returns:
+            bool: True if every branch edge of the control flow graph is taken by at least one test case, False otherwise.
+        """
+        return not _function.control_flow_graph.uncovered_branches(
+            test_case.coverage_bitmap for test_case in _test_cases)
+
+    def run_trials(
+        self,
+        _function: Function,
+        _tried_counts: int,
+        _check_point: int,
+        _fingerprints: set[bytes],
+        _uncovered_branches: set[int],
+    ) -> tuple[list[tuple[tuple[Any, ...], TrialResult]], TypeError | None]:
+        """
+        Runs random trials of a function in batches until every branch target is reached, the trial budget is used
+        or the generation is cancelled.
+        A trial is kept when the fingerprint of its coverage bitmap is not in the given fingerprints.
+        The given fingerprints and uncovered branches are updated with the kept trials.
+
+        Parameters:
+            _function (Function): The function to test.
+            _tried_counts (int): The number of trials that were already made, the first trials use the support cases.
+            _check_point (int): The trial number the search stops at.
+            _fingerprints (set[bytes]): The fingerprints of the trials that were already kept.
+            _uncovered_branches (set[int]): The branch probes that are not reached yet.
+
+        Returns:
+            tuple[list[tuple[tuple[Any, ...], TrialResult]], TypeError | None]: The argument values and coverage of the kept trials,
+            and the TypeError that stopped the search if the tested name is not callable.
+        """
+        trials: list[tuple[tuple[Any, ...], TrialResult]] = []
+
+        support_count: int = len(_function.support_cases)
+        arg_count: int = len(_function.signature.replace(
+            "(", "").replace(")", "").split(","))
+        while (
+            (_uncovered_branches or not (_fingerprints or trials))
+            and _tried_counts < _check_point
+            and not self._cancel_event.is_set()
         ):
-            tested_branched_counts -= 1
+            batch_end: int = min(_tried_counts + self._batch_size, _check_point)
+            support_end: int = _tried_counts
+            if support_count > 0:
+                support_end = max(
+                    min(batch_end, _function.branch_count - 1), _tried_counts)
+
+            batch: list[tuple[Any, ...]] = [
+                tuple(random.choices(_function.support_cases, k=arg_count))
+                for _ in range(_tried_counts, support_end)
+            ]
+            mutation_count: int = round(
+                (batch_end - support_end) * self._mutation_rate) if _function.corpus else 0
+            batch += [
+                self._mutator.mutate(_function.corpus, _function.mined_constants)
+                for _ in range(mutation_count)
+            ]
+            batch += self._func_manager.create_argument_batch(
+                _function, batch_end - support_end - mutation_count)
+
+            tried_counts, type_error = self.admit_batch(
+                _function, batch, _fingerprints, _uncovered_branches, trials)
+            _tried_counts += tried_counts
+            if type_error is not None:
+                return trials, type_error
+
+        return trials, None
+
+    def admit_batch(
+        self,
+        _function: Function,
+        _batch: list[tuple[Any, ...]],
+        _fingerprints: set[bytes],
+        _uncovered_branches: set[int],
+        _trials: list[tuple[tuple[Any, ...], TrialResult]],
+    ) -> tuple[int, TypeError | None]:
+        """
+        Runs a batch of trials and keeps the trials with a new coverage fingerprint.
+        The argument values of a kept trial are added to the corpus of the function, and the kept trials run again
+        with the comparisons recorded to collect the operands they compared.
+        A TypeError of a trial skips the trial, other exceptions are raised again.
+
+        Parameters:
+            _function (Function): The function to test.
+            _batch (list[tuple[Any, ...]]): The argument tuples of the trials.
+            _fingerprints (set[bytes]): The fingerprints of the trials that were already kept, the new fingerprints are added.
+            _uncovered_branches (set[int]): The branch probes that are not reached yet, the reached branches are removed.
+            _trials (list[tuple[tuple[Any, ...], TrialResult]]): The kept trials, the new trials are appended.
+
+        Returns:
+            tuple[int, TypeError | None]: The number of the processed trials, the processing stops when every branch is reached,
+            and the TypeError that stops the search if the tested name is not callable.
+        """
+        kept_count: int = len(_trials)
+        admitted: tuple[int, TypeError | None] = self.admit_results(
+            _function, _batch, self.run_batch(_function, _batch), _fingerprints, _uncovered_branches, _trials)
+        if len(_trials) > kept_count:
+            self.log_comparisons(_function, self.run_batch(
+                _function, [arg_values for arg_values, result in _trials[kept_count:] if not result.timed_out], True))
+        return admitted
+
+    def admit_results(
+        self,
+        _function: Function,
+        _batch: list[tuple[Any, ...]],
+        _results: list[TrialResult],
+        _fingerprints: set[bytes],
+        _uncovered_branches: set[int],
+        _trials: list[tuple[tuple[Any, ...], TrialResult]],
+    ) -> tuple[int, TypeError | None]:
+        """
+        Keeps the trials of a batch that ran with a new coverage fingerprint, see admit_batch.
+        A trial that timed out is kept as a test case with the "timeout" outcome, but it is not added to the corpus.
+
+        Parameters:
+            _function (Function): The tested function.
+            _batch (list[tuple[Any, ...]]): The argument tuples of the trials.
+            _results (list[TrialResult]): The coverage of every trial, in the order of the batch.
+            _fingerprints (set[bytes]): The fingerprints of the trials that were already kept, the new fingerprints are added.
+            _uncovered_branches (set[int]): The branch probes that are not reached yet, the reached branches are removed.
+            _trials (list[tuple[tuple[Any, ...], TrialResult]]): The kept trials, the new trials are appended.
+
+        Returns:
+            tuple[int, TypeError | None]: The number of the processed trials and the TypeError that stops the search
+            if the tested name is not callable.
+        """
+        tried_counts: int = 0
+        for arg_values, trial_result in zip(_batch, _results):
+            tried_counts += 1
+
+            error: Exception | None = trial_result.error
+            if isinstance(error, TypeError):
+                if "'list' object is not callable" == str(error):
+                    return tried_counts, error
+                continue
+            if error is not None:
+                raise error
+
+            fingerprint: bytes = trial_result.fingerprint
+            if fingerprint not in _fingerprints:
+                _fingerprints.add(fingerprint)
+
+                bitmap: bytes = trial_result.coverage_bitmap
+                _uncovered_branches.difference_update(
+                    [branch for branch in _uncovered_branches if bitmap[branch]])
+
+                _trials.append((arg_values, trial_result))
+                if not trial_result.timed_out and arg_values not in _function.corpus:
+                    _function.corpus.append(arg_values)
+                    if len(_function.corpus) > self._corpus_size:
+                        del _function.corpus[0]
+
+                if not _uncovered_branches:
+                    break
+
+        return tried_counts, None
+
+    def log_comparisons(self, _function: Function, _results: list[TrialResult]) -> None:
+        """
+        Adds the operands the comparisons of trials compared at run time to the observed constants of the function.
+
+        Parameters:
+            _function (Function): The tested function.
+            _results (list[TrialResult]): The results of trials that ran with the comparisons recorded.
+
+        Returns:
+            None
+        """
+        values: list[Any] = [
+            value for result in _results for value in result.compared_values]
+        if values:
+            _function.observed_constants = self._code_manager.merge_observed_constants(
+                _function.observed_constants, values)
+
+    def run_solved_trials(
+        self,
+        _function: Function,
+        _fingerprints: set[bytes],
+        _uncovered_branches: set[int],
+    ) -> tuple[list[tuple[tuple[Any, ...], TrialResult]], TypeError | None]:
+        """
+        Runs the trials the branch solver computes from the constraints of the branches of the function.
+        The arguments a solution does not constrain get random values.
+
+        Parameters:
+            _function (Function): The function to test.
+            _fingerprints (set[bytes]): The fingerprints of the trials that were already kept.
+            _uncovered_branches (set[int]): The branch probes that are not reached yet.
+
+        Returns:
+            tuple[list[tuple[tuple[Any, ...], TrialResult]], TypeError | None]: The argument values and coverage of the kept trials,
+            and the TypeError that stopped the search if the tested name is not callable.
+        """
+        trials: list[tuple[tuple[Any, ...], TrialResult]] = []
+        if not _function.branch_constraints:
+            return trials, None
+
+        arg_types: dict[str, Any] = self._func_manager.parse_function_args(
+            _function)
+        solutions: list[dict[str, Any]] = self._branch_solver.solve(
+            _function.branch_constraints, arg_types)
+        batch: list[tuple[Any, ...]] = [
+            tuple(solution.get(name, value) for name, value in zip(arg_types, random_values))
+            for solution, random_values in zip(solutions, self._func_manager.create_argument_batch(_function, len(solutions)))
+        ]
+
+        _, type_error = self.admit_batch(
+            _function, batch, _fingerprints, _uncovered_branches, trials)
+        return trials, type_error
+
+    def run_vectorized_trials(
+        self,
+        _function: Function,
+        _fingerprints: set[bytes],
+        _uncovered_branches: set[int],
+    ) -> tuple[list[tuple[tuple[Any, ...], TrialResult]], TypeError | None]:
+        """
+        Runs the trials whose inputs NumPy selects for the path conditions of the numerical branches of the function.
+        Every path condition is evaluated over a million candidates in one shot, see PredicateVectorizer,
+        and only the first candidate that satisfies it runs, to confirm it. The arguments a path does not use get random values.
+        Nothing runs without NumPy or when a branch of the function is not numerical.
+
+        Parameters:
+            _function (Function): The function to test.
+            _fingerprints (set[bytes]): The fingerprints of the trials that were already kept.
+            _uncovered_branches (set[int]): The branch probes that are not reached yet.
+
+        Returns:
+            tuple[list[tuple[tuple[Any, ...], TrialResult]], TypeError | None]: The argument values and coverage of the kept trials,
+            and the TypeError that stopped the search if the tested name is not callable.
+        """
+        trials: list[tuple[tuple[Any, ...], TrialResult]] = []
+        code_str: str = "\n".join(_function.code_lines)
+        if not _uncovered_branches or not self._predicate_vectorizer.available or not self._code_manager.is_branches_numerical(code_str):
+            return trials, None
+
+        arg_types: dict[str, Any] = self._func_manager.parse_function_args(
+            _function)
+        solutions: list[dict[str, Any]] = self._predicate_vectorizer.solve(
+            self._predicate_vectorizer.compile(code_str, arg_types), arg_types,
+            _function.mined_constants.numbers + _function.observed_constants.numbers)
+        batch: list[tuple[Any, ...]] = [
+            tuple(solution.get(name, value) for name, value in zip(arg_types, random_values))
+            for solution, random_values in zip(solutions, self._func_manager.create_argument_batch(_function, len(solutions)))
+        ]
+
+        _, type_error = self.admit_batch(
+            _function, batch, _fingerprints, _uncovered_branches, trials)
+        return trials, type_error
+
+    def run_concolic_trials(
+        self,
+        _function: Function,
+        _fingerprints: set[bytes],
+        _uncovered_branches: set[int],
+    ) -> tuple[list[tuple[tuple[Any, ...], TrialResult]], TypeError | None]:
+        """
+        Runs the function with symbolic arguments and flips the comparisons of its paths one at a time.
+        The runs start from a few inputs of the corpus and random inputs, every run adds the inputs that flip the comparisons
+        of its path, see ConcolicExecutor, and the flips of the comparisons of the uncovered branches run first.
+        Every input also runs with its concrete argument values, that run is admitted like a random trial.
+
+        Parameters:
+            _function (Function): The function to test.
+            _fingerprints (set[bytes]): The fingerprints of the trials that were already kept.
+            _uncovered_branches (set[int]): The branch probes that are not reached yet.
+
+        Returns:
+            tuple[list[tuple[tuple[Any, ...], TrialResult]], TypeError | None]: The argument values and coverage of the kept trials,
+            and the TypeError that stopped the search if the tested name is not callable.
+        """
+        trials: list[tuple[tuple[Any, ...], TrialResult]] = []
+        if self._concolic_executions <= 0 or self._engine.coverage_backend != "probe":
+            return trials, None
+
+        condition_map = _function.instrumented_code.condition_map
+        arg_types: dict[str, Any] = self._func_manager.parse_function_args(
+            _function)
+        arg_names: list[str] = list(arg_types)
+        queue: list[tuple[int, tuple[Any, ...]]] = [
+            (-1, arg_values) for arg_values in random.sample(_function.corpus, min(len(_function.corpus), 4))]
+        queue += [(-1, arg_values)
+                  for arg_values in self._func_manager.create_argument_batch(_function, 2)]
+        flipped: set[tuple[tuple[int, bool], ...]] = set()
+        executed: set[str] = set()
+
+        for _ in range(self._concolic_executions):
+            if not _uncovered_branches or self._cancel_event.is_set():
+                break
+            if not queue:
+                queue = [(-1, self._func_manager.create_argument_batch(_function, 1)[0])]
+
+            targets: set[int] = {
+                compare_id
+                for branch in _uncovered_branches & condition_map.keys()
+                for compare_id in self._concolic_executor.compare_ids(condition_map[branch][1])
+            }
+            index: int = next((index for index, (compare_id, _) in enumerate(
+                queue) if compare_id in targets), 0)
+            arg_values: tuple[Any, ...] = queue.pop(index)[1]
+            if repr(arg_values) in executed:
+                continue
+            executed.add(repr(arg_values))
+
+            # The symbolic arguments are subclasses of int and str, so code that checks the type of an argument may take another path
+            # with them. The trial is admitted from a concrete run, the symbolic run only gives the path conditions.
+            result: TrialResult = self.run_batch(_function, [arg_values], True)[0]
+            _, type_error = self.admit_results(
+                _function, [arg_values], [result], _fingerprints, _uncovered_branches, trials)
+            if type_error is not None:
+                return trials, type_error
+            self.log_comparisons(_function, [result])
+            symbolic_result: TrialResult = self.run_batch(
+                _function, [self._concolic_executor.symbolize(arg_names, arg_values)], True)[0]
+            queue += self._concolic_executor.expand(
+                arg_types, arg_values, symbolic_result.path_conditions, flipped)
+
+        return trials, None
+
+    def run_search_trials(
+        self,
+        _function: Function,
+        _fingerprints: set[bytes],
+        _uncovered_branches: set[int],
+    ) -> tuple[list[tuple[tuple[Any, ...], TrialResult]], TypeError | None]:
+        """
+        Searches inputs for the uncovered branches of the conditions by their branch distance.
+        For every branch, the search starts from the closest input of the corpus and a few random inputs, and moves to the
+        closest neighbour while it gets closer. The neighbours move every number by the powers of two in both directions,
+        so every move at least halves the distance of a numerical comparison and a far equality is reached in a few moves.
+        The search restarts from a random input when no neighbour is closer.
+        Every trial of the search is admitted like a random trial.
+
+        Parameters:
+            _function (Function): The function to test.
+            _fingerprints (set[bytes]): The fingerprints of the trials that were already kept.
+            _uncovered_branches (set[int]): The branch probes that are not reached yet.
+
+        Returns:
+            tuple[list[tuple[tuple[Any, ...], TrialResult]], TypeError | None]: The argument values and coverage of the kept trials,
+            and the TypeError that stopped the search if the tested name is not callable.
+        """
+        trials: list[tuple[tuple[Any, ...], TrialResult]] = []
+        condition_map = _function.instrumented_code.condition_map
+        if self._search_generations <= 0 or self._engine.coverage_backend != "probe":
+            return trials, None
+
+        for branch in sorted(_uncovered_branches & condition_map.keys()):
+            outcome, predicate = condition_map[branch]
+            batch: list[tuple[Any, ...]] = random.sample(
+                _function.corpus, min(len(_function.corpus), 16))
+            batch += self._func_manager.create_argument_batch(_function, 8)
+            current_fitness: float = float("inf")
+
+            for _ in range(self._search_generations):
+                if branch not in _uncovered_branches or self._cancel_event.is_set():
+                    break
+
+                results: list[TrialResult] = self.run_batch(
+                    _function, batch, True)
+                kept_count: int = len(trials)
+                _, type_error = self.admit_results(
+                    _function, batch, results, _fingerprints, _uncovered_branches, trials)
+                self.log_comparisons(
+                    _function, [result for _, result in trials[kept_count:]])
+                if type_error is not None:
+                    return trials, type_error
+
+                fitness, index = min(
+                    (self._branch_distance.fitness(predicate, outcome, result.branch_distances)
+                     if result.error is None else float("inf"), index)
+                    for index, result in enumerate(results)
+                )
+                if fitness < current_fitness:
+                    current, current_fitness = batch[index], fitness
+                else:
+                    current = self._func_manager.create_argument_batch(_function, 1)[0]
+                    current_fitness = float("inf")
+                batch = self.__neighbours(_function, current)
 
-        return tested_branched_counts
+        return trials, None
+
+    def __neighbours(self, _function: Function, _values: tuple[Any, ...]) -> list[tuple[Any, ...]]:
+        """
+        Returns the inputs next to an input of the search.
+        Every number is moved by the powers of two up to 2 ** 32 in both directions, a float also by the halves down to 1 / 16,
+        and a few mutations of the input change the strings.
+
+        Parameters:
+            _function (Function): The tested function.
+            _values (tuple[Any, ...]): The argument values of the input.
+
+        Returns:
+            list[tuple[Any, ...]]: The neighbour inputs, the input itself first.
+        """
+        neighbours: list[tuple[Any, ...]] = [_values]
+        for index, value in enumerate(_values):
+            if isinstance(value, (int, float)) and not isinstance(value, bool):
+                exponents: range = range(-4 if isinstance(value, float) else 0, 33)
+                for step in (2 ** exponent for exponent in exponents):
+                    for direction in (step, -step):
+                        neighbour: list[Any] = list(_values)
+                        neighbour[index] = value + direction
+                        neighbours.append(tuple(neighbour))
+        neighbours += [
+            self._mutator.mutate([_values], _function.mined_constants) for _ in range(4)
+        ]
+        return neighbours
+
+    def run_batch(self, _function: Function, _batch: list[tuple[Any, ...]], _branch_distances: bool = False) -> list[TrialResult]:
+        """
+        Runs a batch of trials of a function in one driver loop of the execution engine.
+        An exception raised by a trial is kept in its result.
+
+        Parameters:
+            _function (Function): The function to test.
+            _batch (list[tuple[Any, ...]]): The argument tuples of the trials.
+            _branch_distances (bool): Whether the branch distances and the operands of the comparisons are recorded. Defaults to False.
+
+        Returns:
+            list[TrialResult]: The coverage of every trial, in the order of the batch.
+        """
+        return self._engine.execute_batch(_function, _batch, _branch_distances)
 
     def generate_test_cases(self, _function: Function) -> list[TestCase]:
         """
         Generates test cases for a given function.
+        A trial becomes a test case when the fingerprint of its coverage bitmap is new, and the search stops
+        as soon as every branch target of the function is reached.
 
         Parameters:
             _function (Function): The function object for which test cases are to be generated.
@@ -129,108 +680,95 @@ class TestManager:
             list[TestCase]: A list of test cases generated for the function.
         """
         test_cases: list[TestCase] = []
-        branch_pools: set[int] = set()
 
         if len(_function.arguments) > 2:
-            tried_counts: int = 0
             check_point: int = 100_000
-            parameters: str = ""
-
-            support_count: int = len(_function.support_cases)
-            arg_count: int = len(_function.signature.replace(
-                "(", "").replace(")", "").split(","))
-            while (
-                len(branch_pools) < _function.branch_count and tried_counts < check_point
-            ):
-                tried_counts += 1
-
-                if support_count > 0 and _function.branch_count - tried_counts > 0:
-                    arg_values: list[Any] = random.choices(
-                        _function.support_cases, k=arg_count)
-                    if len(arg_values) > 0:
-                        parameters = (
-                            "("
-                            + ",".join(
-                                f'"{val}"' if isinstance(
-                                    val, str) else str(val)
-                                for val in arg_values
-                            )
-                            + ")"
-                        )
-                else:
-                    parameters = self._func_manager.change_argument_value(
-                        _function)
-
-                self._func_manager.remove_function_calls_in_funcexeclines(
-                    _function)
-                self._func_manager.add_function_call_in_funcexeclines(
-                    _function, parameters
-                )
-
-                try:
-                    result: Any = self.execute_code(_function.exec_lines)
-
-                    current_line_count: int = (
-                        _function.code_lines.index(result) + 1
-                    )
-                    tested_branches_count: int = self.get_tested_bracnhed_count(
-                        _function.code_lines, current_line_count
-                    )
-
-                    if (
-                        tested_branches_count not in branch_pools
-                        and tested_branches_count > 0
-                    ):
-                        branch_pools.add(tested_branches_count)
-
-                        test_case: TestCase = TestCase()
-                        test_case.test_values = parameters
-                        test_case.tested_lines = _function.code_lines[
-                            :current_line_count
-                        ]
-                        test_case.tested_branches_count = tested_branches_count
-                        test_case.test_coverages_rate = round(
-                            (current_line_count / _function.code_lines_count) * 100, 2
-                        )
-                        test_cases.append(test_case)
-
-                    if tried_counts == check_point:
-                        break
-
-                except TypeError as te:
-                    if "'list' object is not callable" == str(te):
-                        message = str(te)
-                        title = "Type Error"
-
-                        self._smb.show_message(title, message)
-
-                        break
+            fingerprints: set[bytes] = set()
+            uncovered_branches: set[int] = set(
+                _function.control_flow_graph.branch_edges)
+
+            trials, type_error = self.run_solved_trials(
+                _function, fingerprints, uncovered_branches)
+            if type_error is None:
+                concolic_trials, type_error = self.run_concolic_trials(
+                    _function, fingerprints, uncovered_branches)
+                trials += concolic_trials
+            if type_error is None:
+                vectorized_trials, type_error = self.run_vectorized_trials(
+                    _function, fingerprints, uncovered_branches)
+                trials += vectorized_trials
+            if type_error is None:
+                random_trials, type_error = self.run_trials(
+                    _function, 0, self._batch_size, fingerprints, uncovered_branches)
+                trials += random_trials
+            if type_error is None:
+                search_trials, type_error = self.run_search_trials(
+                    _function, fingerprints, uncovered_branches)
+                trials += search_trials
+            if type_error is None:
+                random_trials, type_error = self.run_trials(
+                    _function, self._batch_size, check_point, fingerprints, uncovered_branches)
+                trials += random_trials
+
+            for arg_values, trial_result in trials:
+                test_cases.append(self.create_test_case(
+                    _function, self._func_manager.arguments_to_str(arg_values), trial_result))
+
+            if type_error is not None:
+                self._message_handler("Type Error", str(type_error))
 
         else:
-            self._func_manager.remove_function_calls_in_funcexeclines(
-                _function)
-            self._func_manager.add_function_call_in_funcexeclines(
-                _function, _function.arguments
-            )
-
-            result = self.execute_code(_function.exec_lines)
-
-            current_line_count: int = (
-                _function.code_lines.index(result) + 1
-            )
-            tested_branches_count: int = self.get_tested_bracnhed_count(
-                _function.code_lines, current_line_count
-            )
-
-            test_case: TestCase = TestCase()
-            test_case.test_values = _function.arguments
-            test_case.tested_lines = _function.code_lines[:current_line_count]
-            test_case.tested_branches_count = tested_branches_count
-            test_case.test_coverages_rate = round(
-                (current_line_count / _function.code_lines_count) * 100, 2
-            )
-            test_cases.append(test_case)
+            trial_result = self._engine.execute(_function, ())
+            test_cases.append(self.create_test_case(
+                _function, _function.arguments, trial_result))
 
         test_cases.sort(
             key=lambda case: case.test_coverages_rate, reverse=True)
         return test_cases
+
+    def generate_test_pools(
+        self,
+        _function: Function,
+        _pool_count: int,
+        _retry_limit: int,
+        _pool_handler: Callable[[list[TestCase]], None] | None = None,
+        _retry_handler: Callable[[], bool] | None = None,
+    ) -> int:
+        """
+        Generates the test case pools of a function.
+        A pool is kept when its test cases reach every branch of the function together, a function without branches gets one pool.
+
+        Parameters:
+            _function (Function): The function to test, the kept pools are added to its test cases.
+            _pool_count (int): The number of test case pools to generate.
+            _retry_limit (int): The number of attempts without a new pool before the generation stops.
+            _pool_handler (Callable[[list[TestCase]], None] | None): The callable that takes every kept pool. Defaults to None.
+            _retry_handler (Callable[[], bool] | None): The callable that is asked whether to go on when the retry limit is reached,
+            the attempts are counted again from zero if it returns True. Defaults to None, the generation stops.
+
+        Returns:
+            int: The number of generated pools.
+        """
+        current_count: int = 0
+        try_count: int = 0
+        while current_count < _pool_count and not self.cancelled:
+            if try_count >= _retry_limit:
+                if _retry_handler is None or not _retry_handler() or self.cancelled:
+                    break
+                try_count = 0
+
+            test_cases_list: list[TestCase] = self.generate_test_cases(_function)
+            try_count += 1
+            if self.cancelled:
+                break
+
+            if _function.branch_count == 0 or self.covers_all_branches(_function, test_cases_list):
+                _function.add_test_case = test_cases_list
+                current_count += 1
+                try_count = 0
+                if _pool_handler is not None:
+                    _pool_handler(test_cases_list)
+                if _function.branch_count == 0:
+                    break
+
+        return current_count
@@ -0,0 +1,159 @@
+"""
+This class runs the test case generation of a function on a worker thread and reports its progress with Qt signals.
+"""
+import threading
+from PyQt5.QtCore import (
+    QThread as thread,
+    pyqtSignal as signal,
+)
+from business.testManager import TestManager
+from entity.function import Function
+from entity.testCase import TestCase
+
+
+class TestWorkerManager(thread):
+    """
+    This class runs the test case generation of a function on a worker thread and reports its progress with Qt signals.
+    Here's what each class method does:
+
+    - __init__: Initializes a new instance of the class with the test manager, the function and the number of test case pools.
+    - cancel: Cancels the generation, the test manager stops within one batch of trials.
+    - answer_retry: Answers the question that is asked when the retry limit is reached.
+    - run: Generates the test case pools of the function and emits the signals of the generation.
+    - __pool_generated: Emits a new test case pool and the completed percentage of the pools.
+    - __ask_retry: Asks the GUI whether to go on when the retry limit is reached and waits for answer_retry.
+
+    Signals:
+    - progress_changed (float): The completed percentage of the test case pools.
+    - test_cases_generated (list): The test cases of a new pool that reaches every branch of the function.
+    - retry_limit_reached: Many attempts did not give a new pool, the worker waits for answer_retry.
+    - message_requested (str, str): The title and the text of a message of the test manager.
+    - generation_failed (object): The exception that stopped the generation.
+    - generation_finished (bool): The generation is over, True if it was cancelled.
+
+    The signals are delivered on the GUI thread, so the slots may update the widgets directly.
+
+    @category: Business Classes, Manager, UI
+    @import: TestManager, Function, TestCase
+    @see: TestManager, Function, TestCase
+    """
+
+    progress_changed = signal(float)
+    test_cases_generated = signal(list)
+    retry_limit_reached = signal()
+    message_requested = signal(str, str)
+    generation_failed = signal(object)
+    generation_finished = signal(bool)
+
+    def __init__(self, _test_manager: TestManager, _function: Function, _pool_count: int, _retry_limit: int = 10) -> None:
+        """
+        Initializes a new instance of the class.
+
+        Parameters:
+            _test_manager (TestManager): The test manager that generates the test cases.
+            _function (Function): The function to test.
+            _pool_count (int): The number of test case pools to generate.
+            _retry_limit (int): The number of attempts without a new pool before the retry question is asked. Defaults to 10.
+
+        Returns:
+            None
+
+        @category: Business Classes, Manager, UI
+        @import: TestManager, Function, TestCase
+        @see: TestManager, Function, TestCase
+        """
+        super().__init__()
+        self.__test_manager: TestManager = _test_manager
+        self.__function: Function = _function
+        self.__pool_count: int = _pool_count
+        self.__retry_limit: int = _retry_limit
+        self.__retry_event: threading.Event = threading.Event()
+        self.__retry: bool = False
+        self.__generated_count: int = 0
+
+    def cancel(self) -> None:
+        """
+        Cancels the generation, the test manager stops within one batch of trials.
+
+        Parameters:
+            None
+
+        Returns:
+            None
+        """
+        self.__test_manager.cancelled = True
+        self.answer_retry(False)
+
+    def answer_retry(self, _retry: bool) -> None:
+        """
+        Answers the question that is asked when the retry limit is reached.
+
+        Parameters:
+            _retry (bool): True to continue the generation, False to stop it.
+
+        Returns:
+            None
+        """
+        self.__retry = _retry
+        self.__retry_event.set()
+
+    def run(self) -> None:
+        """
+        Generates the test case pools of the function and emits the signals of the generation, see TestManager.generate_test_pools.
+        A pool is kept when its test cases reach every branch of the function together.
+
+        Parameters:
+            None
+
+        Returns:
+            None
+        """
+        message_handler = self.__test_manager.message_handler
+        self.__test_manager.message_handler = self.message_requested.emit
+        self.__test_manager.cancelled = False
+        self.__generated_count = 0
+        try:
+            self.__test_manager.generate_test_pools(
+                self.__function, self.__pool_count, self.__retry_limit, self.__pool_generated, self.__ask_retry)
+
+        except Exception as e:
+            # The tested function may raise anything, see TestManager.admit_results, the GUI shows it instead of losing the thread.
+            self.generation_failed.emit(e)
+            return
+
+        finally:
+            self.__test_manager.message_handler = message_handler
+
+        self.generation_finished.emit(self.__test_manager.cancelled)
+
+    def __pool_generated(self, _test_cases: list[TestCase]) -> None:
+        """
+        Emits a new test case pool and the completed percentage of the pools.
+
+        Parameters:
+            _test_cases (list[TestCase]): The test cases of the new pool.
+
+        Returns:
+            None
+        """
+        self.__generated_count += 1
+        self.test_cases_generated.emit(_test_cases)
+        # A function without branches gets one pool only.
+        pool_count: int = 1 if self.__function.branch_count == 0 else self.__pool_count
+        self.progress_changed.emit(
+            min(round(100 / pool_count * self.__generated_count, 2), 100.0))
+
+    def __ask_retry(self) -> bool:
+        """
+        Asks the GUI whether to go on when the retry limit is reached and waits for answer_retry.
+
+        Parameters:
+            None
+
+        Returns:
+            bool: True to continue the generation, False to stop it.
+        """
+        self.__retry_event.clear()
+        self.retry_limit_reached.emit()
+        self.__retry_event.wait()
+        return self.__retry
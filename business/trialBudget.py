@@ -0,0 +1,113 @@
+"""
+This class is the time and step budget of a trial, it stops a trial that does not end.
+"""
+import time
+
+
+class TrialTimeout(BaseException):
+    """
+    This exception stops a trial that used up its budget.
+    It is a BaseException like KeyboardInterrupt, so an `except Exception` of the tested code does not swallow it.
+
+    @category: Business Classes, Tracer
+    """
+
+
+class TrialBudget:
+    """
+    This class is the time and step budget of a trial, it stops a trial that does not end.
+    Here's what each class method does:
+
+    - __init__: Initializes the budget with the wall clock timeout and the step limit of a trial.
+    - timeout: Gets the wall clock timeout of a trial in seconds.
+    - max_steps: Gets the step limit of a trial.
+    - start: Starts the budget of a new trial.
+    - step: Counts a step of the trial and raises TrialTimeout when the budget is used up.
+
+    A step is an iteration of a loop or a call of a function of the instrumented code, see CodeInstrumenter,
+    or a traced line for the tracers that see lines. The clock is only read every 1024 steps, so a step costs a decrement.
+    A trial that hangs in one call of a builtin, without a step, can not be stopped.
+
+    @category: Business Classes, Tracer
+    @import: TrialTimeout
+    @see: TrialTimeout, CodeInstrumenter, CoverageTracer
+    """
+
+    __check_interval: int = 1024
+
+    def __init__(self, _timeout: float = 1.0, _max_steps: int = 1_000_000) -> None:
+        """
+        Initializes the budget with the wall clock timeout and the step limit of a trial.
+
+        Parameters:
+            _timeout (float): The wall clock timeout of a trial in seconds, 0 turns it off. Defaults to 1.
+            _max_steps (int): The step limit of a trial, 0 turns it off. Defaults to 1_000_000.
+
+        Returns:
+            None
+
+        @category: Business Classes, Tracer
+        """
+        self.__timeout: float = _timeout
+        self.__max_steps: int = _max_steps
+        self.__deadline: float = 0.0
+        self.__steps: int = 0
+        self.__remaining: int = self.__check_interval
+
+    @property
+    def timeout(self) -> float:
+        """
+        Returns the wall clock timeout of a trial.
+
+        Returns:
+            float: The timeout in seconds, 0 if it is off.
+        """
+        return self.__timeout
+
+    @property
+    def max_steps(self) -> int:
+        """
+        Returns the step limit of a trial.
+
+        Returns:
+            int: The step limit, 0 if it is off.
+        """
+        return self.__max_steps
+
+    def start(self) -> None:
+        """
+        Starts the budget of a new trial.
+
+        Parameters:
+            None
+
+        Returns:
+            None
+        """
+        self.__deadline = time.perf_counter() + self.__timeout if self.__timeout > 0 else 0.0
+        self.__steps = 0
+        self.__remaining = self.__check_interval
+
+    def step(self) -> None:
+        """
+        Counts a step of the trial and checks the budget every 1024 steps.
+
+        Parameters:
+            None
+
+        Returns:
+            None
+
+        Raises:
+            TrialTimeout: If the trial used up its steps or its time.
+        """
+        self.__remaining -= 1
+        if self.__remaining > 0:
+            return
+
+        self.__steps += self.__check_interval
+        self.__remaining = self.__check_interval
+        if 0 < self.__max_steps <= self.__steps:
+            raise TrialTimeout(f"The trial used up its budget of {self.__max_steps} steps.")
+        if self.__deadline and time.perf_counter() > self.__deadline:
+            raise TrialTimeout(f"The trial ran longer than {self.__timeout} seconds.")
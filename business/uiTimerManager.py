@@ -54,7 +54,7 @@ class UiProgressBarValueManager:
         self.__pb.setValue(pb_value + 1)
         if self.__pb.value() == _rate:
             _timer.stop()
-            del _timer
+            _timer.deleteLater()
 
     def __decrease_value(self, _rate: int, _timer: timer) -> None:
         """
@@ -70,7 +70,7 @@ class UiProgressBarValueManager:
         self.__pb.setValue(self.__pb.value() - 1)
         if self.__pb.value() == _rate:
             _timer.stop()
-            del _timer
+            _timer.deleteLater()
 
     def up_value(self, _rate: int) -> None:
         """
@@ -82,7 +82,7 @@ class UiProgressBarValueManager:
         Returns:
             None: This function does not return anything.
         """
-        _timer = timer()
+        _timer = timer(self.__pb)
         _timer.timeout.connect(lambda: self.__increase_value(_rate, _timer))
         _timer.start(10)
 
@@ -96,7 +96,7 @@ class UiProgressBarValueManager:
         Returns:
             None
         """
-        _timer = timer()
+        _timer = timer(self.__pb)
         _timer.timeout.connect(lambda: self.__decrease_value(_rate, _timer))
         _timer.start(10)
 
@@ -168,7 +168,7 @@ class UiLabelTextManager:
         self.__lbl.setText(lbl_txt)
         if self.__current_value == _tested_value:
             _timer.stop()
-            del _timer
+            _timer.deleteLater()
 
     def __decrease_value(self, _tested_value: int, _timer: timer) -> None:
         """
@@ -188,7 +188,7 @@ class UiLabelTextManager:
         self.__lbl.setText(lbl_txt)
         if self.__current_value == _tested_value:
             _timer.stop()
-            del _timer
+            _timer.deleteLater()
 
     def up_value(self, _value: int) -> None:
         """
@@ -200,7 +200,7 @@ class UiLabelTextManager:
         Returns:
             None
         """
-        _timer = timer()
+        _timer = timer(self.__lbl)
         _timer.timeout.connect(lambda: self.__increase_value(_value, _timer))
         _timer.start(50)
 
@@ -214,7 +214,7 @@ class UiLabelTextManager:
         Returns:
             None
         """
-        _timer = timer()
+        _timer = timer(self.__lbl)
         _timer.timeout.connect(lambda: self.__decrease_value(_value, _timer))
         _timer.start(50)
 
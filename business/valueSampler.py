@@ -0,0 +1,142 @@
+"""
+This class samples the boundary biased edges the input generator draws its numbers and string lengths from.
+"""
+import random
+from typing import Any
+from bisect import bisect_right
+from itertools import accumulate
+
+try:
+    import numpy
+except ImportError:  # NumPy is optional, batches are drawn with the random module without it.
+    numpy = None
+
+
+class ValueSampler:
+    """
+    This class samples the boundary biased edges the input generator draws its numbers and string lengths from.
+    Here's what each class method does:
+
+    - __init__: Initializes the cumulative tables of the right and the left edge distributions.
+    - __draw: Draws a value from a distribution with one uniform draw and a bisect over its cumulative table.
+    - edge_right: Draws the right edge, a number between 0 and 10_000.
+    - edge_left: Draws the left edge, a number between -10_000 and 0.
+    - edges: Draws the left and the right edges of a trial.
+    - edges_batch: Draws the left and the right edges of many trials at once, with NumPy if it is installed.
+    - __draw_batch: Draws many values from a distribution with NumPy.
+
+    The edges used to be picked from the concatenation of the ranges 0..10, 0..100, 0..1_000 and 0..10_000,
+    so small numbers are picked more often than large ones. Picking from that list is the same as picking one of
+    the ranges with a probability proportional to its length and a uniform number in it,
+    so the tables hold only the four ranges and a draw costs no allocation.
+
+    @category: Business Classes, Manager
+    """
+
+    def __init__(self) -> None:
+        """
+        Initializes the cumulative tables of the right and the left edge distributions.
+        A distribution is a list of (start, step, length) ranges.
+
+        Parameters:
+            None
+
+        Returns:
+            None
+
+        @category: Business Classes, Manager
+        """
+        self.__right_ranges: list[tuple[int, int, int]] = [
+            (0, 1, 11), (0, 1, 101), (0, 1, 1001), (0, 1, 10001)
+        ]
+        self.__left_ranges: list[tuple[int, int, int]] = [
+            (0, -1, 10), (-10, -1, 91), (-100, -1, 901), (-1001, -1, 9000)
+        ]
+        self.__right_table: list[int] = list(
+            accumulate(length for _, _, length in self.__right_ranges))
+        self.__left_table: list[int] = list(
+            accumulate(length for _, _, length in self.__left_ranges))
+
+    def __draw(self, _ranges: list[tuple[int, int, int]], _table: list[int]) -> int:
+        """
+        Draws a value from a distribution with one uniform draw and a bisect over its cumulative table.
+
+        Parameters:
+            _ranges (list[tuple[int, int, int]]): The (start, step, length) ranges of the distribution.
+            _table (list[int]): The cumulative lengths of the ranges.
+
+        Returns:
+            int: The drawn value.
+        """
+        index: int = random.randrange(_table[-1])
+        range_index: int = bisect_right(_table, index)
+        start, step, length = _ranges[range_index]
+        return start + step * (index - _table[range_index] + length)
+
+    def edge_right(self) -> int:
+        """
+        Draws the right edge, a number between 0 and 10_000.
+
+        Returns:
+            int: The right edge.
+        """
+        return self.__draw(self.__right_ranges, self.__right_table)
+
+    def edge_left(self) -> int:
+        """
+        Draws the left edge, a number between -10_000 and 0.
+
+        Returns:
+            int: The left edge.
+        """
+        return self.__draw(self.__left_ranges, self.__left_table)
+
+    def edges(self) -> tuple[int, int]:
+        """
+        Draws the left and the right edges of a trial.
+
+        Returns:
+            tuple[int, int]: The left and the right edges.
+        """
+        return self.edge_left(), self.edge_right()
+
+    def edges_batch(self, _count: int) -> list[tuple[int, int]]:
+        """
+        Draws the left and the right edges of many trials at once.
+        With NumPy the draws of the whole batch are vectorized, otherwise they are drawn one by one.
+
+        Parameters:
+            _count (int): The number of trials.
+
+        Returns:
+            list[tuple[int, int]]: The left and the right edges of every trial.
+        """
+        if numpy is None:
+            return [self.edges() for _ in range(_count)]
+
+        generator = numpy.random.default_rng(random.getrandbits(64))
+        lefts = self.__draw_batch(
+            generator, self.__left_ranges, self.__left_table, _count)
+        rights = self.__draw_batch(
+            generator, self.__right_ranges, self.__right_table, _count)
+        return list(zip(lefts.tolist(), rights.tolist()))
+
+    def __draw_batch(self, _generator: Any, _ranges: list[tuple[int, int, int]], _table: list[int], _count: int) -> Any:
+        """
+        Draws many values from a distribution with NumPy.
+
+        Parameters:
+            _generator (numpy.random.Generator): The random generator, seeded from the random module.
+            _ranges (list[tuple[int, int, int]]): The (start, step, length) ranges of the distribution.
+            _table (list[int]): The cumulative lengths of the ranges.
+            _count (int): The number of values.
+
+        Returns:
+            numpy.ndarray: The drawn values.
+        """
+        starts, steps, lengths = (numpy.array(column)
+                                  for column in zip(*_ranges))
+        table = numpy.array(_table)
+        indexes = _generator.integers(0, _table[-1], _count)
+        range_indexes = numpy.searchsorted(table, indexes, side="right")
+        return starts[range_indexes] + steps[range_indexes] * (indexes - table[range_indexes] + lengths[range_indexes])
@@ -0,0 +1,68 @@
+"""
+The CorpusDal class is responsible for loading and saving the corpus of a function.
+"""
+
+import json
+import os
+from typing import Any
+
+
+class CorpusDal:
+    """The CorpusDal class is responsible for loading and saving the corpus of a function. Here's a summary of what each class method does:
+
+    - load_corpus(self, _file_name: str) -> list[tuple[Any, ...]]:
+    Loads the argument values of the corpus from a JSON file.
+    It returns an empty corpus if the file does not exist or can not be read.
+
+    - save_corpus(self, _file_name: str, _corpus: list[tuple[Any, ...]]) -> bool:
+    Saves the argument values of the corpus to a JSON file.
+    It returns True if the corpus was successfully saved, False otherwise.
+
+    Every input of the corpus is saved as a JSON list, so only number, string and boolean argument values are kept.
+
+        @category: Data Access
+    """
+
+    def load_corpus(self, _file_name: str) -> list[tuple[Any, ...]]:
+        """
+        Loads the argument values of the corpus from a JSON file.
+
+        Args:
+            _file_name (str): The name of the corpus file.
+
+        Returns:
+            list[tuple[Any, ...]]: The argument values of the corpus, empty if the file does not exist or can not be read.
+        """
+        if not _file_name or not os.path.exists(_file_name):
+            return []
+
+        try:
+            with open(_file_name, encoding="utf-8") as file:
+                inputs: Any = json.load(file)
+        except (OSError, ValueError):
+            return []
+
+        if not isinstance(inputs, list):
+            return []
+        return [tuple(values) for values in inputs if isinstance(values, list)]
+
+    def save_corpus(self, _file_name: str, _corpus: list[tuple[Any, ...]]) -> bool:
+        """
+        Saves the argument values of the corpus to a JSON file.
+
+        Args:
+            _file_name (str): The name of the corpus file.
+            _corpus (list[tuple[Any, ...]]): The argument values of the corpus.
+
+        Returns:
+            bool: True if the corpus was successfully saved, False otherwise.
+        """
+        if not _file_name:
+            return False
+
+        try:
+            with open(_file_name, "w", encoding="utf-8") as file:
+                json.dump([list(values) for values in _corpus], file)
+            return True
+        except (OSError, TypeError, ValueError):
+            return False
@@ -0,0 +1,155 @@
+"""
+The TestCacheDal class is responsible for reading and writing the entries of the on-disk test case cache.
+"""
+
+import gzip
+import json
+import os
+from typing import Any
+
+
+class TestCacheDal:
+    """The TestCacheDal class is responsible for reading and writing the entries of the on-disk test case cache.
+    Here's a summary of what each class method does:
+
+    - __init__(self, _directory: str, _max_bytes: int):
+    Initializes the cache with its directory and its size cap.
+
+    - load_entry(self, _key: str) -> dict[str, Any] | None:
+    Loads the entry of a key, and marks it as the most recently used one.
+    It returns None if there is no entry for the key or it can not be read.
+
+    - save_entry(self, _key: str, _entry: dict[str, Any]) -> bool:
+    Saves the entry of a key and evicts the least recently used entries while the cache is above its size cap.
+    It returns True if the entry was successfully saved, False otherwise.
+
+    - __evict(self) -> None:
+    Deletes the least recently used entries until the cache fits its size cap.
+
+    - __scan(self) -> list[tuple[float, int, str]]:
+    Returns the last use, the size and the path of every entry of the cache.
+
+    Every entry is a gzip compressed JSON file named after its key. The modification time of an entry file is its last use,
+    a load touches it, so the eviction drops the entries that were not used for the longest time first.
+    An entry is written to a temporary file and renamed, so a reader never sees a half written entry.
+    The size of the cache is read from the directory on the first save and kept up to date by the saves,
+    so the directory is only scanned again when the cache is above its size cap.
+
+        @category: Data Access
+    """
+
+    def __init__(self, _directory: str, _max_bytes: int = 256 * 1024 * 1024) -> None:
+        """
+        Initializes the cache with its directory and its size cap.
+
+        Args:
+            _directory (str): The directory of the cache, it is created on the first save.
+            _max_bytes (int): The size cap of the cache in bytes. Defaults to 256 MiB.
+
+        Returns:
+            None
+
+        @category: Data Access
+        """
+        self._directory: str = _directory
+        self._max_bytes: int = _max_bytes
+        self._total_bytes: int | None = None
+
+    def load_entry(self, _key: str) -> dict[str, Any] | None:
+        """
+        Loads the entry of a key, and marks it as the most recently used one.
+
+        Args:
+            _key (str): The key of the entry.
+
+        Returns:
+            dict[str, Any] | None: The entry, None if there is no entry for the key or it can not be read.
+        """
+        file_name: str = os.path.join(self._directory, f"{_key}.json.gz")
+        if not os.path.exists(file_name):
+            return None
+
+        try:
+            with gzip.open(file_name, "rt", encoding="utf-8") as file:
+                entry: Any = json.load(file)
+            os.utime(file_name)
+        except (OSError, EOFError, ValueError):
+            return None
+
+        return entry if isinstance(entry, dict) else None
+
+    def save_entry(self, _key: str, _entry: dict[str, Any]) -> bool:
+        """
+        Saves the entry of a key and evicts the least recently used entries while the cache is above its size cap.
+
+        Args:
+            _key (str): The key of the entry.
+            _entry (dict[str, Any]): The entry, it must be serializable to JSON.
+
+        Returns:
+            bool: True if the entry was successfully saved, False otherwise.
+        """
+        file_name: str = os.path.join(self._directory, f"{_key}.json.gz")
+        temporary_name: str = f"{file_name}.{os.getpid()}.tmp"
+        try:
+            os.makedirs(self._directory, exist_ok=True)
+            if self._total_bytes is None:
+                self._total_bytes = sum(size for _, size, _ in self.__scan())
+            old_size: int = os.path.getsize(file_name) if os.path.exists(file_name) else 0
+            with gzip.open(temporary_name, "wt", encoding="utf-8") as file:
+                json.dump(_entry, file, separators=(",", ":"))
+            new_size: int = os.path.getsize(temporary_name)
+            os.replace(temporary_name, file_name)
+        except (OSError, TypeError, ValueError):
+            if os.path.exists(temporary_name):
+                os.remove(temporary_name)
+            return False
+
+        self._total_bytes += new_size - old_size
+        if self._total_bytes > self._max_bytes:
+            self.__evict()
+        return True
+
+    def __evict(self) -> None:
+        """
+        Deletes the least recently used entries until the cache fits its size cap.
+
+        Args:
+            None
+
+        Returns:
+            None
+        """
+        entries: list[tuple[float, int, str]] = self.__scan()
+        total_bytes: int = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total_bytes <= self._max_bytes:
+                break
+            try:
+                os.remove(path)
+            except OSError:
+                continue
+            total_bytes -= size
+        self._total_bytes = total_bytes
+
+    def __scan(self) -> list[tuple[float, int, str]]:
+        """
+        Returns the last use, the size and the path of every entry of the cache.
+
+        Args:
+            None
+
+        Returns:
+            list[tuple[float, int, str]]: The modification time, the size in bytes and the path of every entry file,
+            empty if the directory can not be read.
+        """
+        entries: list[tuple[float, int, str]] = []
+        try:
+            with os.scandir(self._directory) as directory:
+                for item in directory:
+                    if item.name.endswith(".json.gz") and item.is_file():
+                        status: os.stat_result = item.stat()
+                        entries.append((status.st_mtime, status.st_size, item.path))
+        except OSError:
+            return []
+        return entries
@@ -0,0 +1,66 @@
+"""
+This class definition is for a class called "CompiledFunction".
+"""
+from typing import Any, Callable
+
+
+class CompiledFunction:
+    """
+    This class definition is for a class called "CompiledFunction".
+    It holds the result of compiling the code of a Function once, so that trials can call it directly:
+
+    - __init__: Initializes the object with the namespace, the target function object and the coverage tracer.
+    - namespace: Gets the namespace dictionary the code was executed in.
+    - target: Gets the compiled function object that is called on every trial.
+    - coverage_tracer: Gets the coverage tracer that records the executed lines of the compiled code.
+
+    @category: Entity Classes
+    """
+
+    def __init__(self, _namespace: dict[str, Any], _target: Callable[..., Any], _coverage_tracer: Any) -> None:
+        """
+        Initializes the object with the namespace, the target function object and the coverage tracer.
+
+        Parameters:
+            _namespace (dict[str, Any]): The namespace the code was executed in.
+            _target (Callable[..., Any]): The compiled function object.
+            _coverage_tracer (Any): The coverage tracer attached to the compiled code, a CoverageTracer.
+
+        Returns:
+            None
+
+        @category: Entity Classes
+        """
+        self.__namespace: dict[str, Any] = _namespace
+        self.__target: Callable[..., Any] = _target
+        self.__coverage_tracer: Any = _coverage_tracer
+
+    @property
+    def namespace(self) -> dict[str, Any]:
+        """
+        Returns the namespace the code was executed in.
+
+        Returns:
+            dict[str, Any]: The namespace dictionary.
+        """
+        return self.__namespace
+
+    @property
+    def target(self) -> Callable[..., Any]:
+        """
+        Returns the compiled function object.
+
+        Returns:
+            Callable[..., Any]: The function object that is called on every trial.
+        """
+        return self.__target
+
+    @property
+    def coverage_tracer(self) -> Any:
+        """
+        Returns the coverage tracer attached to the compiled code.
+
+        Returns:
+            Any: The coverage tracer, a CoverageTracer.
+        """
+        return self.__coverage_tracer
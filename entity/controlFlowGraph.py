@@ -0,0 +1,166 @@
+"""
+This class definition is for a class called "ControlFlowGraph".
+"""
+from typing import Iterable
+
+# The block id of the exit of the function, the target of the returns, the raises and the end of the function.
+EXIT_BLOCK: int = -1
+
+
+class ControlFlowGraph:
+    """
+    This class definition is for a class called "ControlFlowGraph".
+    It holds the control flow graph of the code of a Function, built once from its ast:
+
+    - __init__: Initializes the object with the basic blocks, their successors, the branch edges and the loop back edges.
+    - blocks: Gets the first and the last line of every basic block, indexed by block id.
+    - successors: Gets the successor block ids of every basic block, indexed by block id.
+    - branch_edges: Gets the (source block, target block) pair of every branch edge, keyed by branch probe id.
+    - back_edges: Gets the (source block, loop header block) pair of every loop back edge.
+    - branch_arcs: Gets the (from line, to line) arc of every branch edge, keyed by branch probe id.
+    - branch_count: Gets the number of branch edges.
+    - covered_branches: Returns the branch probe ids a coverage bitmap reached.
+    - covered_arcs: Returns the (from line, to line) arcs of the branch edges a coverage bitmap reached.
+    - uncovered_branches: Returns the branch probe ids that none of the coverage bitmaps reached.
+
+    A basic block is a run of statements that execute one after the other, the graph is kept as plain lists and tuples.
+    A branch edge is an edge that is taken on one outcome of a decision, the body and the else part of `if`,
+    the body and the exit of a loop, an `except` handler or a `case`. It is keyed by the id of the branch probe
+    the instrumented code writes when it is taken, see InstrumentedCode.branch_map, so the branches a trial took are
+    read from its coverage bitmap. A target block of EXIT_BLOCK means the branch leaves the function.
+    The arc of a branch edge is the line of its decision and the line it goes to, 0 if it leaves the function,
+    so the coverage of a test case is the arcs it traversed and not the last line it reached.
+
+    @category: Entity Classes
+    """
+
+    def __init__(
+        self,
+        _blocks: list[tuple[int, int]],
+        _successors: list[tuple[int, ...]],
+        _branch_edges: dict[int, tuple[int, int]],
+        _back_edges: list[tuple[int, int]],
+        _branch_arcs: dict[int, tuple[int, int]] | None = None,
+    ) -> None:
+        """
+        Initializes the object with the basic blocks, their successors, the branch edges and the loop back edges.
+
+        Parameters:
+            _blocks (list[tuple[int, int]]): The first and the last line of every basic block, indexed by block id.
+            _successors (list[tuple[int, ...]]): The successor block ids of every basic block, indexed by block id.
+            _branch_edges (dict[int, tuple[int, int]]): The (source block, target block) pair of every branch edge, keyed by branch probe id.
+            _back_edges (list[tuple[int, int]]): The (source block, loop header block) pair of every loop back edge.
+            _branch_arcs (dict[int, tuple[int, int]] | None): The (from line, to line) arc of every branch edge, keyed by branch probe id.
+            Defaults to None, no arcs.
+
+        Returns:
+            None
+
+        @category: Entity Classes
+        """
+        self.__blocks: list[tuple[int, int]] = _blocks
+        self.__successors: list[tuple[int, ...]] = _successors
+        self.__branch_edges: dict[int, tuple[int, int]] = _branch_edges
+        self.__back_edges: list[tuple[int, int]] = _back_edges
+        self.__branch_arcs: dict[int, tuple[int, int]] = _branch_arcs or {}
+
+    @property
+    def blocks(self) -> list[tuple[int, int]]:
+        """
+        Returns the first and the last line of every basic block, indexed by block id.
+
+        Returns:
+            list[tuple[int, int]]: The line ranges of the blocks.
+        """
+        return self.__blocks
+
+    @property
+    def successors(self) -> list[tuple[int, ...]]:
+        """
+        Returns the successor block ids of every basic block, indexed by block id.
+
+        Returns:
+            list[tuple[int, ...]]: The successors of the blocks.
+        """
+        return self.__successors
+
+    @property
+    def branch_edges(self) -> dict[int, tuple[int, int]]:
+        """
+        Returns the (source block, target block) pair of every branch edge, keyed by branch probe id.
+
+        Returns:
+            dict[int, tuple[int, int]]: The branch edges.
+        """
+        return self.__branch_edges
+
+    @property
+    def back_edges(self) -> list[tuple[int, int]]:
+        """
+        Returns the (source block, loop header block) pair of every loop back edge.
+
+        Returns:
+            list[tuple[int, int]]: The back edges.
+        """
+        return self.__back_edges
+
+    @property
+    def branch_arcs(self) -> dict[int, tuple[int, int]]:
+        """
+        Returns the (from line, to line) arc of every branch edge, keyed by branch probe id.
+
+        Returns:
+            dict[int, tuple[int, int]]: The branch arcs, a to line of 0 leaves the function.
+        """
+        return self.__branch_arcs
+
+    @property
+    def branch_count(self) -> int:
+        """
+        Returns the number of branch edges.
+
+        Returns:
+            int: The number of branch edges.
+        """
+        return len(self.__branch_edges)
+
+    def covered_branches(self, _coverage_bitmap: bytes) -> list[int]:
+        """
+        Returns the branch probe ids a coverage bitmap reached.
+
+        Parameters:
+            _coverage_bitmap (bytes): The coverage bitmap of a trial.
+
+        Returns:
+            list[int]: The ids of the branch probes the trial took.
+        """
+        return [probe for probe in self.__branch_edges if probe < len(_coverage_bitmap) and _coverage_bitmap[probe]]
+
+    def covered_arcs(self, _coverage_bitmap: bytes) -> set[tuple[int, int]]:
+        """
+        Returns the (from line, to line) arcs of the branch edges a coverage bitmap reached.
+
+        Parameters:
+            _coverage_bitmap (bytes): The coverage bitmap of a trial.
+
+        Returns:
+            set[tuple[int, int]]: The arcs the trial traversed.
+        """
+        return {self.__branch_arcs[probe] for probe in self.covered_branches(_coverage_bitmap) if probe in self.__branch_arcs}
+
+    def uncovered_branches(self, _coverage_bitmaps: Iterable[bytes]) -> set[int]:
+        """
+        Returns the branch probe ids that none of the coverage bitmaps reached.
+
+        Parameters:
+            _coverage_bitmaps (Iterable[bytes]): The coverage bitmaps of the trials.
+
+        Returns:
+            set[int]: The ids of the branch probes that were not taken.
+        """
+        uncovered: set[int] = set(self.__branch_edges)
+        for bitmap in _coverage_bitmaps:
+            uncovered.difference_update(self.covered_branches(bitmap))
+            if not uncovered:
+                break
+        return uncovered
@@ -3,6 +3,10 @@ This class definition is for a class called "Function".
 """
 from typing import Any
 from entity.testCase import TestCase
+from entity.compiledFunction import CompiledFunction
+from entity.controlFlowGraph import ControlFlowGraph
+from entity.instrumentedCode import InstrumentedCode
+from entity.minedConstants import MinedConstants
 
 
 class Function:
@@ -15,15 +19,23 @@ class Function:
     - signature: Gets or sets the signature of the function.
     - arguments: Gets or sets the arguments of the function.
     - code_lines: Gets or adds a code line to the list of code lines.
+    - module_context: Gets or sets the source of the module the function was taken from, it runs before the function.
     - exec_lines: Gets or sets the execution lines of the function.
-    - branch_count: Gets or sets the branch count of the function.
+    - instrumented_code: Gets or sets the instrumented code of the function with its source map.
+    - control_flow_graph: Gets or sets the control flow graph of the function, its branch edges are keyed by the branch probes.
+    - mined_constants: Gets or sets the literals mined from the conditions of the function.
+    - observed_constants: Gets or sets the operands the comparisons of the function compared at run time.
+    - branch_constraints: Gets or sets the linear constraints of the path conditions of the branches of the function.
+    - corpus: Gets or sets the argument values that reached new coverage, they are kept between the test case pools.
+    - branch_count: Gets or sets the branch count of the function, the number of branch edges of its control flow graph.
     - code_lines_count: Gets or sets the number of lines of code in the function.
     - test_cases: Gets or adds a test case to the list of test cases associated with the function.
     - support_cases: Gets or sets the support cases associated with the function.
+    - compiled_function: Gets or sets the compiled instrumented code of the function.
 
     @category: Entity Classes
-    @see: TestCase (Entity Class)
-    @import: TestCase (Entity Class)
+    @see: TestCase (Entity Class), CompiledFunction (Entity Class), ControlFlowGraph (Entity Class), InstrumentedCode (Entity Class), MinedConstants (Entity Class)
+    @import: TestCase (Entity Class), CompiledFunction (Entity Class), ControlFlowGraph (Entity Class), InstrumentedCode (Entity Class), MinedConstants (Entity Class)
     """
 
     def __init__(self) -> None:
@@ -38,11 +50,19 @@ class Function:
         self.__signature: str = ""
         self.__arguments: str = ""
         self.__code_lines: list[str] = []
+        self.__module_context: str = ""
         self.__exec_lines: str = ""
+        self.__instrumented_code: InstrumentedCode = InstrumentedCode("", [], {})
+        self.__control_flow_graph: ControlFlowGraph = ControlFlowGraph([], [], {}, [])
+        self.__mined_constants: MinedConstants = MinedConstants([], [], [])
+        self.__observed_constants: MinedConstants = MinedConstants([], [], [])
+        self.__branch_constraints: list[list[tuple[str, dict[str, float], float]]] = []
+        self.__corpus: list[tuple[Any, ...]] = []
         self.__branch_count: int = 0
         self.__code_lines_count: int = 0
         self.__test_cases: list[list[TestCase]] = []
         self.__support_values: list[Any] = []
+        self.__compiled_function: CompiledFunction | None = None
 
     @property
     def name(self) -> str:
@@ -140,6 +160,31 @@ class Function:
         """
         self.__code_lines.append(_code_line)
 
+    @property
+    def module_context(self) -> str:
+        """
+        Get the source of the module the function was taken from.
+        The execution engine runs it before the code of the function, so the function sees the imports, the constants
+        and the other functions of its module.
+
+        Returns:
+            str: The source of the module, empty for a function that stands alone.
+        """
+        return self.__module_context
+
+    @module_context.setter
+    def module_context(self, _module_context: str) -> None:
+        """
+        Setter method for the `module_context` attribute.
+
+        Parameters:
+            _module_context (str): The new source of the module of the function.
+
+        Returns:
+            None: This method does not return anything.
+        """
+        self.__module_context = _module_context
+
     @property
     def exec_lines(self) -> str:
         """
@@ -154,6 +199,7 @@ class Function:
     def exec_lines(self, _exec_line: str) -> None:
         """
         Setter method for the `exec_lines` attribute.
+        The compiled function is dropped when the execution lines change.
 
         Parameters:
             _exec_line (str): The new value for the `exec_lines` attribute.
@@ -161,8 +207,149 @@ class Function:
         Returns:
             None: This method does not return anything.
         """
+        self.__compiled_function = None
         self.__exec_lines = _exec_line
 
+    @property
+    def instrumented_code(self) -> InstrumentedCode:
+        """
+        Get the instrumented code of the function with its source map.
+
+        Returns:
+            InstrumentedCode: The instrumented code of the function.
+        """
+        return self.__instrumented_code
+
+    @instrumented_code.setter
+    def instrumented_code(self, _instrumented_code: InstrumentedCode) -> None:
+        """
+        Setter method for the `instrumented_code` attribute.
+        The compiled function is dropped when the instrumented code changes.
+
+        Parameters:
+            _instrumented_code (InstrumentedCode): The new instrumented code of the function.
+
+        Returns:
+            None: This method does not return anything.
+        """
+        self.__compiled_function = None
+        self.__instrumented_code = _instrumented_code
+
+    @property
+    def control_flow_graph(self) -> ControlFlowGraph:
+        """
+        Get the control flow graph of the function.
+
+        Returns:
+            ControlFlowGraph: The control flow graph of the function.
+        """
+        return self.__control_flow_graph
+
+    @control_flow_graph.setter
+    def control_flow_graph(self, _control_flow_graph: ControlFlowGraph) -> None:
+        """
+        Setter method for the `control_flow_graph` attribute.
+
+        Parameters:
+            _control_flow_graph (ControlFlowGraph): The new control flow graph of the function.
+
+        Returns:
+            None: This method does not return anything.
+        """
+        self.__control_flow_graph = _control_flow_graph
+
+    @property
+    def mined_constants(self) -> MinedConstants:
+        """
+        Get the literals mined from the conditions of the function.
+
+        Returns:
+            MinedConstants: The mined numbers, strings and lengths.
+        """
+        return self.__mined_constants
+
+    @mined_constants.setter
+    def mined_constants(self, _mined_constants: MinedConstants) -> None:
+        """
+        Setter method for the `mined_constants` attribute.
+
+        Parameters:
+            _mined_constants (MinedConstants): The new mined literals of the function.
+
+        Returns:
+            None: This method does not return anything.
+        """
+        self.__mined_constants = _mined_constants
+
+    @property
+    def observed_constants(self) -> MinedConstants:
+        """
+        Get the operands the comparisons of the function compared at run time, they are kept between the test case pools.
+
+        Returns:
+            MinedConstants: The observed numbers and strings.
+        """
+        return self.__observed_constants
+
+    @observed_constants.setter
+    def observed_constants(self, _observed_constants: MinedConstants) -> None:
+        """
+        Setter method for the `observed_constants` attribute.
+
+        Parameters:
+            _observed_constants (MinedConstants): The new observed operands of the function.
+
+        Returns:
+            None: This method does not return anything.
+        """
+        self.__observed_constants = _observed_constants
+
+    @property
+    def branch_constraints(self) -> list[list[tuple[str, dict[str, float], float]]]:
+        """
+        Get the linear constraints of the path conditions of the branches of the function.
+
+        Returns:
+            list[list[tuple[str, dict[str, float], float]]]: A conjunction of (operator, coefficients, constant) constraints for every branch target.
+        """
+        return self.__branch_constraints
+
+    @branch_constraints.setter
+    def branch_constraints(self, _branch_constraints: list[list[tuple[str, dict[str, float], float]]]) -> None:
+        """
+        Setter method for the `branch_constraints` attribute.
+
+        Parameters:
+            _branch_constraints (list[list[tuple[str, dict[str, float], float]]]): The new constraints of the branches.
+
+        Returns:
+            None: This method does not return anything.
+        """
+        self.__branch_constraints = _branch_constraints
+
+    @property
+    def corpus(self) -> list[tuple[Any, ...]]:
+        """
+        Get the argument values that reached new coverage, they are kept between the test case pools.
+
+        Returns:
+            list[tuple[Any, ...]]: The corpus of the function.
+        """
+        return self.__corpus
+
+    @corpus.setter
+    def corpus(self, _corpus: list[tuple[Any, ...]]) -> None:
+        """
+        Setter method for the `corpus` attribute.
+
+        Parameters:
+            _corpus (list[tuple[Any, ...]]): The new corpus of the function.
+
+        Returns:
+            None: This method does not return anything.
+        """
+        self.__corpus = _corpus
+
     @property
     def branch_count(self) -> int:
         """
@@ -254,3 +441,26 @@ class Function:
             None: This method does not return anything.
         """
         self.__support_values = _support_values
+
+    @property
+    def compiled_function(self) -> CompiledFunction | None:
+        """
+        Returns the compiled instrumented code of the function.
+
+        Returns:
+            CompiledFunction | None: The compiled function, or None if the function is not compiled yet.
+        """
+        return self.__compiled_function
+
+    @compiled_function.setter
+    def compiled_function(self, _compiled_function: CompiledFunction | None) -> None:
+        """
+        Setter method for the compiled_function attribute.
+
+        Parameters:
+            _compiled_function (CompiledFunction | None): The compiled instrumented code of the function.
+
+        Returns:
+            None: This method does not return anything.
+        """
+        self.__compiled_function = _compiled_function
@@ -0,0 +1,103 @@
+"""
+This class definition is for a class called "InstrumentedCode".
+"""
+from typing import Any
+
+# A predicate tree of a condition: ("compare", compare id), ("not", predicate), ("and", predicates) or ("or", predicates).
+Predicate = tuple[str, Any]
+
+
+class InstrumentedCode:
+    """
+    This class definition is for a class called "InstrumentedCode".
+    It holds the output of the code instrumenter:
+
+    - __init__: Initializes the object with the instrumented source, the source map and the branch map.
+    - source: Gets the instrumented source code.
+    - source_map: Gets the line number of every probe, indexed by probe id.
+    - branch_map: Gets the (decision line, target line) pair of every branch probe, keyed by probe id.
+    - condition_map: Gets the (outcome, predicate) pair of the condition of every branch probe of an `if` or `while`, keyed by probe id.
+    - probe_count: Gets the number of probes.
+
+    A target line of 0 means the branch leaves the function.
+    The outcome of a condition is True for the branch into the body and False for the else part or the exit of the loop.
+
+    @category: Entity Classes
+    """
+
+    def __init__(
+        self,
+        _source: str,
+        _source_map: list[int],
+        _branch_map: dict[int, tuple[int, int]],
+        _condition_map: dict[int, tuple[bool, Predicate]] | None = None,
+    ) -> None:
+        """
+        Initializes the object with the instrumented source, the source map, the branch map and the condition map.
+
+        Parameters:
+            _source (str): The instrumented source code.
+            _source_map (list[int]): The line number of every probe, indexed by probe id.
+            _branch_map (dict[int, tuple[int, int]]): The (decision line, target line) pair of every branch probe.
+            _condition_map (dict[int, tuple[bool, Predicate]] | None): The (outcome, predicate) pair of the condition of every
+            branch probe of an `if` or `while`. Defaults to no conditions.
+
+        Returns:
+            None
+
+        @category: Entity Classes
+        """
+        self.__source: str = _source
+        self.__source_map: list[int] = _source_map
+        self.__branch_map: dict[int, tuple[int, int]] = _branch_map
+        self.__condition_map: dict[int, tuple[bool, Predicate]] = _condition_map or {}
+
+    @property
+    def source(self) -> str:
+        """
+        Returns the instrumented source code.
+
+        Returns:
+            str: The instrumented source code.
+        """
+        return self.__source
+
+    @property
+    def source_map(self) -> list[int]:
+        """
+        Returns the line number of every probe, indexed by probe id.
+
+        Returns:
+            list[int]: The source map.
+        """
+        return self.__source_map
+
+    @property
+    def branch_map(self) -> dict[int, tuple[int, int]]:
+        """
+        Returns the (decision line, target line) pair of every branch probe, keyed by probe id.
+
+        Returns:
+            dict[int, tuple[int, int]]: The branch map.
+        """
+        return self.__branch_map
+
+    @property
+    def condition_map(self) -> dict[int, tuple[bool, Predicate]]:
+        """
+        Returns the (outcome, predicate) pair of the condition of every branch probe of an `if` or `while`, keyed by probe id.
+
+        Returns:
+            dict[int, tuple[bool, Predicate]]: The condition map.
+        """
+        return self.__condition_map
+
+    @property
+    def probe_count(self) -> int:
+        """
+        Returns the number of probes.
+
+        Returns:
+            int: The number of probes.
+        """
+        return len(self.__source_map)
@@ -0,0 +1,87 @@
+"""
+This class definition is for a class called "MinedConstants".
+"""
+from typing import Any
+
+
+class MinedConstants:
+    """
+    This class definition is for a class called "MinedConstants".
+    It holds the literals the constant miner found in the conditions of a function:
+
+    - __init__: Initializes the object with the mined numbers, strings and lengths.
+    - numbers: Gets the mined numbers with their neighbours.
+    - strings: Gets the mined strings.
+    - lengths: Gets the mined lengths of the len() checks with their neighbours.
+    - is_empty: Gets whether nothing was mined.
+    - values: Returns the mined numbers and strings together.
+
+    @category: Entity Classes
+    """
+
+    def __init__(self, _numbers: list[int | float], _strings: list[str], _lengths: list[int]) -> None:
+        """
+        Initializes the object with the mined numbers, strings and lengths.
+
+        Parameters:
+            _numbers (list[int | float]): The mined numbers with their neighbours.
+            _strings (list[str]): The mined strings.
+            _lengths (list[int]): The mined lengths of the len() checks with their neighbours, none of them is negative.
+
+        Returns:
+            None
+
+        @category: Entity Classes
+        """
+        self.__numbers: list[int | float] = _numbers
+        self.__strings: list[str] = _strings
+        self.__lengths: list[int] = _lengths
+
+    @property
+    def numbers(self) -> list[int | float]:
+        """
+        Returns the mined numbers with their neighbours.
+
+        Returns:
+            list[int | float]: The mined numbers.
+        """
+        return self.__numbers
+
+    @property
+    def strings(self) -> list[str]:
+        """
+        Returns the mined strings.
+
+        Returns:
+            list[str]: The mined strings.
+        """
+        return self.__strings
+
+    @property
+    def lengths(self) -> list[int]:
+        """
+        Returns the mined lengths of the len() checks with their neighbours.
+
+        Returns:
+            list[int]: The mined lengths.
+        """
+        return self.__lengths
+
+    @property
+    def is_empty(self) -> bool:
+        """
+        Returns whether nothing was mined.
+
+        Returns:
+            bool: True if no number, string or length was mined, False otherwise.
+        """
+        return not (self.__numbers or self.__strings or self.__lengths)
+
+    def values(self) -> list[Any]:
+        """
+        Returns the mined numbers and strings together.
+
+        Returns:
+            list[Any]: The mined numbers followed by the mined strings.
+        """
+        return [*self.__numbers, *self.__strings]
@@ -10,8 +10,11 @@ class TestCase:
     - test_values: Gets and sets the value of the test_values property.
     - tested_lines: Gets and sets the list of tested lines.
     - tested_branches_count: Gets and sets the number of tested branches.
+    - covered_edges: Gets and sets the (from line, to line) branch edges the test traversed.
     - tested_lines_count: Returns the number of tested lines.
     - test_coverages_rate: Gets and sets the test coverages rate.
+    - coverage_bitmap: Gets and sets the coverage bitmap of the test, one byte per probe of the instrumented code.
+    - outcome: Gets and sets how the trial of the test ended, "return" or "timeout".
 
     Initializes the class with default values for test-related attributes.
 
@@ -39,7 +42,10 @@ class TestCase:
         self.__test_values: str = ""
         self._tested_lines: list[str] = []
         self.__tested_branches_count: int = 0
+        self.__covered_edges: set[tuple[int, int]] = set()
         self._test_coverages_rate: float = 0
+        self.__coverage_bitmap: bytes = b""
+        self.__outcome: str = "return"
 
     @property
     def test_values(self) -> str:
@@ -110,6 +116,29 @@ class TestCase:
         """
         self.__tested_branches_count = _count
 
+    @property
+    def covered_edges(self) -> set[tuple[int, int]]:
+        """
+        Returns the branch edges the test traversed.
+
+        Returns:
+            set[tuple[int, int]]: The (from line, to line) edges, a to line of 0 leaves the function.
+        """
+        return self.__covered_edges
+
+    @covered_edges.setter
+    def covered_edges(self, _edges: set[tuple[int, int]]) -> None:
+        """
+        Setter method for the covered_edges attribute.
+
+        Parameters:
+            _edges (set[tuple[int, int]]): The new value for the covered_edges attribute.
+
+        Returns:
+            None
+        """
+        self.__covered_edges = _edges
+
     @property
     def tested_lines_count(self) -> int:
         """
@@ -145,3 +174,49 @@ class TestCase:
             None
         """
         self.__test_coverages_rate = _rate
+
+    @property
+    def coverage_bitmap(self) -> bytes:
+        """
+        Get the coverage bitmap of the test.
+
+        Returns:
+            bytes: The coverage bitmap, one byte per probe of the instrumented code.
+        """
+        return self.__coverage_bitmap
+
+    @coverage_bitmap.setter
+    def coverage_bitmap(self, _bitmap: bytes) -> None:
+        """
+        Setter method for the coverage_bitmap property.
+
+        Args:
+            _bitmap (bytes): The new value for the coverage_bitmap.
+
+        Returns:
+            None
+        """
+        self.__coverage_bitmap = _bitmap
+
+    @property
+    def outcome(self) -> str:
+        """
+        Get how the trial of the test ended.
+
+        Returns:
+            str: "return" if the function returned, "timeout" if the trial used up its time or step budget.
+        """
+        return self.__outcome
+
+    @outcome.setter
+    def outcome(self, _outcome: str) -> None:
+        """
+        Setter method for the outcome property.
+
+        Args:
+            _outcome (str): The new value for the outcome.
+
+        Returns:
+            None
+        """
+        self.__outcome = _outcome
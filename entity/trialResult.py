@@ -0,0 +1,148 @@
+"""
+This class definition is for a class called "TrialResult".
+"""
+import hashlib
+from typing import Any
+
+
+class TrialResult:
+    """
+    This class definition is for a class called "TrialResult".
+    It holds the coverage of a single trial of a function:
+
+    - __init__: Initializes the object with the executed lines, the coverage bitmap and the error of the trial.
+    - executed_lines: Gets the executed line numbers of the trial.
+    - coverage_bitmap: Gets the coverage bitmap of the trial, one byte per probe of the instrumented code.
+    - error: Gets the exception the trial raised, None if the trial returned.
+    - branch_distances: Gets the branch distances of the conditions the trial evaluated.
+    - compared_values: Gets the number and string operands of the comparisons the trial evaluated.
+    - path_conditions: Gets the comparisons of symbolic values the trial evaluated, in the order of the run.
+    - timed_out: Gets whether the trial was stopped because it used up its time or step budget.
+    - fingerprint: Gets the fingerprint of the coverage bitmap.
+
+    The fingerprint is a blake2b digest instead of hash(), so it is the same in every process.
+    A trial that timed out gets another fingerprint than a trial that ended with the same coverage.
+
+    @category: Entity Classes
+    """
+
+    def __init__(
+        self,
+        _executed_lines: set[int],
+        _coverage_bitmap: bytes,
+        _error: Exception | None = None,
+        _branch_distances: dict[int, tuple[float, float]] | None = None,
+        _compared_values: set[Any] | None = None,
+        _path_conditions: list[tuple[int, str, Any, Any, bool]] | None = None,
+        _timed_out: bool = False,
+    ) -> None:
+        """
+        Initializes the object with the executed lines, the coverage bitmap and the error of the trial.
+
+        Parameters:
+            _executed_lines (set[int]): The executed line numbers, starting at 1.
+            _coverage_bitmap (bytes): The coverage bitmap, a non zero byte means the probe with that id was reached.
+            _error (Exception | None): The exception the trial raised. Defaults to None.
+            _branch_distances (dict[int, tuple[float, float]] | None): The distances to true and to false of the evaluated
+            comparisons, keyed by compare id. Defaults to none, only the probe coverage backend records them.
+            _compared_values (set[Any] | None): The number and string operands of the evaluated comparisons. Defaults to none.
+            _path_conditions (list[tuple[int, str, Any, Any, bool]] | None): The compare id, the operator, the operands and
+            the outcome of the comparisons of symbolic values of a concolic trial. Defaults to none.
+            _timed_out (bool): Whether the trial was stopped by its budget, see TrialBudget. Defaults to False.
+
+        Returns:
+            None
+
+        @category: Entity Classes
+        """
+        self.__executed_lines: set[int] = _executed_lines
+        self.__coverage_bitmap: bytes = _coverage_bitmap
+        self.__error: Exception | None = _error
+        self.__branch_distances: dict[int, tuple[float, float]] = _branch_distances or {}
+        self.__compared_values: set[Any] = _compared_values or set()
+        self.__path_conditions: list[tuple[int, str, Any, Any, bool]] = _path_conditions or []
+        self.__timed_out: bool = _timed_out
+
+    @property
+    def executed_lines(self) -> set[int]:
+        """
+        Returns the executed line numbers of the trial.
+
+        Returns:
+            set[int]: The executed line numbers, starting at 1.
+        """
+        return self.__executed_lines
+
+    @property
+    def coverage_bitmap(self) -> bytes:
+        """
+        Returns the coverage bitmap of the trial.
+
+        Returns:
+            bytes: The coverage bitmap, one byte per probe of the instrumented code.
+        """
+        return self.__coverage_bitmap
+
+    @property
+    def error(self) -> Exception | None:
+        """
+        Returns the exception the trial raised.
+
+        Returns:
+            Exception | None: The exception, or None if the trial returned.
+        """
+        return self.__error
+
+    @property
+    def branch_distances(self) -> dict[int, tuple[float, float]]:
+        """
+        Returns the branch distances of the conditions the trial evaluated.
+
+        Returns:
+            dict[int, tuple[float, float]]: The distances to true and to false of every evaluated comparison, keyed by compare id.
+        """
+        return self.__branch_distances
+
+    @property
+    def compared_values(self) -> set[Any]:
+        """
+        Returns the number and string operands of the comparisons the trial evaluated.
+
+        Returns:
+            set[Any]: The compared values, empty if the comparisons were not recorded.
+        """
+        return self.__compared_values
+
+    @property
+    def path_conditions(self) -> list[tuple[int, str, Any, Any, bool]]:
+        """
+        Returns the comparisons of symbolic values the trial evaluated, in the order of the run.
+
+        Returns:
+            list[tuple[int, str, Any, Any, bool]]: The compare id, the operator, the operands and the outcome of every comparison,
+            empty unless the trial ran with symbolic arguments.
+        """
+        return self.__path_conditions
+
+    @property
+    def timed_out(self) -> bool:
+        """
+        Returns whether the trial was stopped because it used up its time or step budget.
+
+        Returns:
+            bool: True if the trial timed out, False otherwise.
+        """
+        return self.__timed_out
+
+    @property
+    def fingerprint(self) -> bytes:
+        """
+        Returns the fingerprint of the coverage bitmap.
+
+        Returns:
+            bytes: An 8 byte blake2b digest of the coverage bitmap and the timeout flag.
+        """
+        digest = hashlib.blake2b(self.__coverage_bitmap, digest_size=8)
+        if self.__timed_out:
+            digest.update(b"timeout")
+        return digest.digest()
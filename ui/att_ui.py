@@ -467,6 +467,14 @@ class Ui_MainWindow(object):
         self.pb_test_rate.setProperty("value", 0)
         self.pb_test_rate.setObjectName("pb_test_rate")
         self.gridLayout_7.addWidget(self.pb_test_rate, 1, 0, 1, 1)
+        self.btn_test_cancel = QtWidgets.QPushButton(self.gbox_test_completed)
+        font = QtGui.QFont()
+        font.setPointSize(13)
+        font.setBold(True)
+        font.setWeight(75)
+        self.btn_test_cancel.setFont(font)
+        self.btn_test_cancel.setObjectName("btn_test_cancel")
+        self.gridLayout_7.addWidget(self.btn_test_cancel, 1, 1, 1, 1)
         self.verticalLayout.addWidget(self.gbox_test_completed)
         self.gbox_statistics = QtWidgets.QGroupBox(self.centralwidget)
         self.gbox_statistics.setMinimumSize(QtCore.QSize(0, 42))
@@ -563,6 +571,7 @@ class Ui_MainWindow(object):
         self.btn_support_case_done.setText(_translate("MainWindow", "✓"))
         self.btn_support_case_clear_cases.setText(_translate("MainWindow", "CLEAR ALL"))
         self.pb_test_rate.setFormat(_translate("MainWindow", "%p % of the test is complete, please wait"))
+        self.btn_test_cancel.setText(_translate("MainWindow", "CANCEL"))
         self.label_2.setText(_translate("MainWindow", "Test Case Statistics"))
         self.lbl_branched_count.setText(_translate("MainWindow", "Branched Count:"))
         self.lbl_tested_line_count.setText(_translate("MainWindow", "Tested Line Count:"))